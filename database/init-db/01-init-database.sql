@@ -116,7 +116,15 @@ CREATE TABLE IF NOT EXISTS incidents.incidents (
 CREATE INDEX IF NOT EXISTS idx_incidents_status   ON incidents.incidents(status);
 CREATE INDEX IF NOT EXISTS idx_incidents_service  ON incidents.incidents(service);
 CREATE INDEX IF NOT EXISTS idx_incidents_severity ON incidents.incidents(severity);
-CREATE INDEX IF NOT EXISTS idx_incidents_created  ON incidents.incidents(created_at);
+-- Covering index for the analytics aggregate: every column it reads is in the
+-- index, so it can run as an index-only scan without touching the wide heap rows.
+-- It also serves plain created_at lookups, so it replaces idx_incidents_created.
+DROP INDEX IF EXISTS incidents.idx_incidents_created;
+CREATE INDEX IF NOT EXISTS idx_incidents_analytics ON incidents.incidents(created_at)
+    INCLUDE (status, severity, service, assigned_to, acknowledged_at, resolved_at);
+-- Per-assignee load over a recent window (analytics oncall_load)
+CREATE INDEX IF NOT EXISTS idx_incidents_assigned_created ON incidents.incidents(assigned_to, created_at)
+    WHERE assigned_to IS NOT NULL;
 
 -- ── Incident <-> Alerts (many-to-many) ────────────────────────
 CREATE TABLE IF NOT EXISTS incidents.incident_alerts (
@@ -170,6 +178,28 @@ CREATE TABLE IF NOT EXISTS oncall.schedules (
     created_at          TIMESTAMPTZ  NOT NULL DEFAULT now()
 );
 
+CREATE INDEX IF NOT EXISTS idx_schedules_team_created ON oncall.schedules(team, created_at DESC);
+
+-- Index of the current primary in a schedule's engineers array at *at_time*.
+-- Mirrors the service's rotation (app/rotation.py): the period rolls over at
+-- handoff_hour in the schedule's timezone, an unknown timezone falls back to
+-- UTC; NULL when the schedule has no engineers.
+CREATE OR REPLACE FUNCTION oncall.current_oncall_index(s oncall.schedules, at_time TIMESTAMPTZ DEFAULT now())
+RETURNS INTEGER AS $$
+    SELECT (GREATEST(
+                local_time::date - s.start_date
+                    - CASE WHEN extract(hour FROM local_time) < COALESCE(s.handoff_hour, 9) THEN 1 ELSE 0 END,
+                0)
+            / CASE WHEN s.rotation_type = 'daily' THEN 1 ELSE 7 END)
+           % NULLIF(jsonb_array_length(s.engineers), 0)
+    FROM (
+        SELECT at_time AT TIME ZONE CASE
+            WHEN EXISTS (SELECT 1 FROM pg_timezone_names WHERE name = s.timezone) THEN s.timezone
+            ELSE 'UTC'
+        END AS local_time
+    ) t;
+$$ LANGUAGE sql STABLE;
+
 -- ── Schedule Members (normalised member list with position) ──
 CREATE TABLE IF NOT EXISTS oncall.schedule_members (
     id          UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -202,10 +232,17 @@ CREATE TABLE IF NOT EXISTS oncall.escalations (
     to_engineer     VARCHAR(255) NOT NULL,
     level           INTEGER      NOT NULL DEFAULT 1,
     reason          VARCHAR(255),
+    team            VARCHAR(255),
     escalated_at    TIMESTAMPTZ  NOT NULL DEFAULT now()
 );
 
-CREATE INDEX IF NOT EXISTS idx_escalations_incident ON oncall.escalations(incident_id);
+-- Databases created before escalations were tagged with their team
+ALTER TABLE oncall.escalations ADD COLUMN IF NOT EXISTS team VARCHAR(255);
+
+-- History is listed newest-first, optionally for a single incident
+CREATE INDEX IF NOT EXISTS idx_escalations_incident_at ON oncall.escalations(incident_id, escalated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_escalations_escalated_at ON oncall.escalations(escalated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_escalations_team ON oncall.escalations(team);
 
 -- ── Escalation Policies ─────────────────────────────────────
 CREATE TABLE IF NOT EXISTS oncall.escalation_policies (
@@ -232,7 +269,75 @@ CREATE TABLE IF NOT EXISTS oncall.escalation_timers (
     created_at      TIMESTAMPTZ  NOT NULL DEFAULT now()
 );
 
-CREATE INDEX IF NOT EXISTS idx_escalation_timers_active ON oncall.escalation_timers(is_active, escalate_after);
+-- Partial index: only active timers are ever scanned for expiry
+CREATE INDEX IF NOT EXISTS idx_escalation_timers_active ON oncall.escalation_timers(escalate_after)
+    WHERE is_active = TRUE;
+-- Cancelling or handing over an incident's timers touches only its active rows
+CREATE INDEX IF NOT EXISTS idx_escalation_timers_incident_active ON oncall.escalation_timers(incident_id)
+    WHERE is_active = TRUE;
+
+-- ── Pre-aggregated escalation metrics (maintained by oncall-service) ──
+-- Escalation inserts/deletes append a +1/-1 delta to the log; the service
+-- periodically folds pending deltas into the per-team summary, so refresh
+-- work is proportional to the number of new escalations, not the table.
+CREATE TABLE IF NOT EXISTS oncall.escalation_metrics (
+    team            VARCHAR(255) PRIMARY KEY,   -- '' for escalations without a team
+    cnt             BIGINT       NOT NULL DEFAULT 0,
+    updated_at      TIMESTAMPTZ  NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS oncall.escalation_metrics_mlog (
+    id              BIGSERIAL    PRIMARY KEY,
+    team            VARCHAR(255),
+    delta           INTEGER      NOT NULL,
+    ts              TIMESTAMPTZ  NOT NULL DEFAULT now()
+);
+
+INSERT INTO oncall.escalation_metrics (team, cnt)
+SELECT COALESCE(team, ''), COUNT(*)
+FROM oncall.escalations
+GROUP BY COALESCE(team, '')
+ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE FUNCTION oncall.log_escalation_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO oncall.escalation_metrics_mlog (team, delta) VALUES (NEW.team, 1);
+    ELSE
+        INSERT INTO oncall.escalation_metrics_mlog (team, delta) VALUES (OLD.team, -1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_escalations_metrics_mlog ON oncall.escalations;
+
+CREATE TRIGGER trg_escalations_metrics_mlog
+    AFTER INSERT OR DELETE ON oncall.escalations
+    FOR EACH ROW EXECUTE FUNCTION oncall.log_escalation_delta();
+
+-- Push the earliest new escalate_after (Unix seconds) to the on-call service,
+-- which LISTENs on this channel instead of polling for new timers
+CREATE OR REPLACE FUNCTION oncall.notify_timer_added()
+RETURNS TRIGGER AS $$
+DECLARE
+    due TIMESTAMPTZ;
+BEGIN
+    SELECT MIN(escalate_after) INTO due FROM new_timers WHERE is_active;
+    IF due IS NOT NULL THEN
+        PERFORM pg_notify('oncall_timer_added', EXTRACT(EPOCH FROM due)::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_escalation_timers_notify ON oncall.escalation_timers;
+
+CREATE TRIGGER trg_escalation_timers_notify
+    AFTER INSERT ON oncall.escalation_timers
+    REFERENCING NEW TABLE AS new_timers
+    FOR EACH STATEMENT EXECUTE FUNCTION oncall.notify_timer_added();
 
 -- ── Auto-update updated_at trigger ──────────────────────────
 CREATE OR REPLACE FUNCTION update_updated_at()
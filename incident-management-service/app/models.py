@@ -88,6 +88,7 @@ class IncidentAnalyticsResponse(BaseModel):
     avg_mttr_seconds: Optional[float] = None
     by_severity: Dict[str, int] = Field(default_factory=dict)
     by_service: Dict[str, int] = Field(default_factory=dict)
+    oncall_load: Dict[str, int] = Field(default_factory=dict, description="Incidents per assignee over the last 7 days")
 
 
 # ---------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 import json
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from app.config import settings
@@ -239,13 +239,35 @@ async def list_incidents(
 # ---------------------------------------------------------------------------
 @router.get("/incidents/analytics", response_model=IncidentAnalyticsResponse)
 async def get_analytics():
-    """Historical incident analytics: counts, avg MTTA/MTTR, breakdowns."""
+    """Historical incident analytics: counts, avg MTTA/MTTR, breakdowns.
+
+    Every aggregate comes from a single scan of ``incidents.incidents``:
+    ``GROUPING SETS`` produces the overall summary plus the severity,
+    service and assignee breakdowns, distinguished by ``GROUPING()``.
+    """
+    # GROUPING() sets one bit per column that is *not* grouped:
+    # 7 = overall, 3 = by severity, 5 = by service, 6 = by assignee
+    summary: dict = {}
+    by_severity: dict = {}
+    by_service: dict = {}
+    oncall_load: dict = {}
+
+    # Load window start, rounded down to the hour and bound as a parameter so the
+    # statement text and its range stay identical for every call within the hour.
+    load_since = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(days=7)
+
     with get_db_connection() as conn:
-        with conn.cursor() as cur:
-            # Total + status counts
+        # Named (server-side) cursor: the per-service and per-assignee groups are
+        # streamed in batches of ``itersize`` rather than materialized by fetchall().
+        with conn.cursor(name="incident_analytics") as cur:
+            cur.itersize = 500
             cur.execute(
                 """
                 SELECT
+                    GROUPING(severity, service, assigned_to)                    AS grp,
+                    severity::text                                              AS severity,
+                    service,
+                    assigned_to,
                     COUNT(*)                                                    AS total,
                     COUNT(*) FILTER (WHERE status = 'open')                     AS open_count,
                     COUNT(*) FILTER (WHERE status = 'acknowledged')             AS ack_count,
@@ -253,29 +275,36 @@ async def get_analytics():
                     AVG(EXTRACT(EPOCH FROM (acknowledged_at - created_at)))
                         FILTER (WHERE acknowledged_at IS NOT NULL)              AS avg_mtta,
                     AVG(EXTRACT(EPOCH FROM (resolved_at - created_at)))
-                        FILTER (WHERE resolved_at IS NOT NULL)                  AS avg_mttr
+                        FILTER (WHERE resolved_at IS NOT NULL)                  AS avg_mttr,
+                    COUNT(*) FILTER (WHERE created_at >= %s)                    AS load_cnt
                 FROM incidents.incidents
-                """
+                GROUP BY GROUPING SETS ((), (severity), (service), (assigned_to))
+                HAVING GROUPING(assigned_to) = 1
+                    OR (assigned_to IS NOT NULL AND COUNT(*) FILTER (WHERE created_at >= %s) > 0)
+                """,
+                (load_since, load_since),
             )
-            summary = cur.fetchone()
-
-            # By severity
-            cur.execute("SELECT severity::text, COUNT(*) AS cnt FROM incidents.incidents GROUP BY severity")
-            sev_rows = cur.fetchall()
-
-            # By service
-            cur.execute("SELECT service, COUNT(*) AS cnt FROM incidents.incidents GROUP BY service")
-            svc_rows = cur.fetchall()
+            for r in cur:
+                grp = r["grp"]
+                if grp == 7:
+                    summary = r
+                elif grp == 3:
+                    by_severity[r["severity"]] = r["total"]
+                elif grp == 5:
+                    by_service[r["service"]] = r["total"]
+                elif grp == 6:
+                    oncall_load[r["assigned_to"]] = r["load_cnt"]
 
     return IncidentAnalyticsResponse(
-        total_incidents=summary["total"],
-        open_count=summary["open_count"],
-        acknowledged_count=summary["ack_count"],
-        resolved_count=summary["resolved_count"],
-        avg_mtta_seconds=round(summary["avg_mtta"], 2) if summary["avg_mtta"] else None,
-        avg_mttr_seconds=round(summary["avg_mttr"], 2) if summary["avg_mttr"] else None,
-        by_severity={r["severity"]: r["cnt"] for r in sev_rows},
-        by_service={r["service"]: r["cnt"] for r in svc_rows},
+        total_incidents=summary.get("total", 0),
+        open_count=summary.get("open_count", 0),
+        acknowledged_count=summary.get("ack_count", 0),
+        resolved_count=summary.get("resolved_count", 0),
+        avg_mtta_seconds=round(summary["avg_mtta"], 2) if summary.get("avg_mtta") else None,
+        avg_mttr_seconds=round(summary["avg_mttr"], 2) if summary.get("avg_mttr") else None,
+        by_severity=by_severity,
+        by_service=by_service,
+        oncall_load=oncall_load,
     )
 
 
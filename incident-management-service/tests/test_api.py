@@ -491,6 +491,7 @@ async def test_get_incident_metrics_not_found(client):
 @pytest.mark.asyncio
 async def test_get_analytics(client):
     summary = {
+        "grp": 7,
         "total": 10,
         "open_count": 3,
         "ack_count": 2,
@@ -498,18 +499,24 @@ async def test_get_analytics(client):
         "avg_mtta": 120.5,
         "avg_mttr": 3600.0,
     }
-    sev_rows = [{"severity": "critical", "cnt": 4}, {"severity": "low", "cnt": 6}]
-    svc_rows = [{"service": "web", "cnt": 7}, {"service": "api", "cnt": 3}]
-
-    # Analytics uses ONE connection + ONE cursor with 3 sequential execute/fetch calls.
-    fetch_one_results = iter([summary])
-    fetch_all_results = iter([sev_rows, svc_rows])
+    grouped_rows = [
+        summary,
+        {"grp": 3, "severity": "critical", "total": 4},
+        {"grp": 3, "severity": "low", "total": 6},
+        {"grp": 5, "service": "web", "total": 7},
+        {"grp": 5, "service": "api", "total": 3},
+        # Unassigned / idle assignees are dropped by the HAVING clause
+        {"grp": 6, "assigned_to": "alice@example.com", "total": 6, "load_cnt": 2},
+    ]
+
+    # Analytics uses ONE connection + ONE server-side cursor with a single GROUPING SETS query.
+    cur_holder = {}
 
     @contextmanager
     def _analytics_conn(autocommit=False):
         cur = MagicMock()
-        cur.fetchone = MagicMock(side_effect=lambda: next(fetch_one_results))
-        cur.fetchall = MagicMock(side_effect=lambda: next(fetch_all_results))
+        cur.__iter__.return_value = iter(grouped_rows)
+        cur_holder["cur"] = cur
 
         conn = MagicMock()
         conn.cursor.return_value.__enter__ = MagicMock(return_value=cur)
@@ -525,6 +532,11 @@ async def test_get_analytics(client):
     assert body["avg_mtta_seconds"] == 120.5
     assert body["by_severity"]["critical"] == 4
     assert body["by_service"]["web"] == 7
+    assert body["oncall_load"] == {"alice@example.com": 2}
+
+    # The 7-day load window starts on an hour boundary and is bound as a parameter
+    load_since, _ = cur_holder["cur"].execute.call_args.args[1]
+    assert (load_since.minute, load_since.second, load_since.microsecond) == (0, 0, 0)
 
 
 # ── POST /incidents — external services UP (oncall + timer + notif) ──
@@ -785,6 +797,7 @@ async def test_patch_update_returns_none(client):
 async def test_get_analytics_no_avg(client):
     """Analytics with no MTTA/MTTR data returns None."""
     summary = {
+        "grp": 7,
         "total": 0,
         "open_count": 0,
         "ack_count": 0,
@@ -793,14 +806,10 @@ async def test_get_analytics_no_avg(client):
         "avg_mttr": None,
     }
 
-    fetch_one_results = iter([summary])
-    fetch_all_results = iter([[], []])
-
     @contextmanager
     def _analytics_conn(autocommit=False):
         cur = MagicMock()
-        cur.fetchone = MagicMock(side_effect=lambda: next(fetch_one_results))
-        cur.fetchall = MagicMock(side_effect=lambda: next(fetch_all_results))
+        cur.__iter__.return_value = iter([summary])
 
         conn = MagicMock()
         conn.cursor.return_value.__enter__ = MagicMock(return_value=cur)
@@ -813,6 +822,7 @@ async def test_get_analytics_no_avg(client):
     assert resp.status_code == 200
     assert resp.json()["avg_mtta_seconds"] is None
     assert resp.json()["avg_mttr_seconds"] is None
+    assert resp.json()["oncall_load"] == {}
 
 
 # ── PATCH — assign_to ────────────────────────────────────────
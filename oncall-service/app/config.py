@@ -17,8 +17,9 @@ class Settings(BaseSettings):
     DATABASE_URL: str  # required -- no insecure default
 
     # Database connection pool
-    DB_POOL_MIN: int = 1
-    DB_POOL_MAX: int = 10
+    DB_POOL_MIN: int = 5
+    DB_POOL_MAX: int = 25
+    DB_POOL_TIMEOUT: float = 5.0  # seconds to wait for a free pooled connection
 
     # HTTP client
     HTTP_CLIENT_TIMEOUT: float = 10.0
@@ -26,6 +27,11 @@ class Settings(BaseSettings):
     # Health-check thresholds (percent)
     HEALTH_MEMORY_THRESHOLD: float = 90.0
     HEALTH_DISK_THRESHOLD: float = 90.0
+    HEALTH_CACHE_TTL: float = 5.0  # seconds; 0 disables the /health cache
+    HEALTH_PSUTIL_INTERVAL: float = 2.0  # seconds between background memory/disk samples
+    HEALTH_READY_CACHE_TTL: float = 2.0  # seconds; 0 disables the /health/ready cache
+    HEALTH_DB_TIMEOUT: float = 1.0  # seconds before a health database ping counts as failed
+    HEALTH_DB_BACKOFF_MAX: float = 30.0  # seconds; cap on skipping pings after failures
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:8080,http://localhost:3000"
@@ -39,6 +45,17 @@ class Settings(BaseSettings):
     DEFAULT_ESCALATION_MINUTES: int = 5
     MANAGER_EMAIL: str = "admin@expertmind.local"
     ESCALATION_LOOP_COUNT: int = 2
+    ESCALATION_CHECK_BATCH_SIZE: int = 1000
+    ESCALATION_CHECK_INTERVAL_SECONDS: float = 10.0
+    ESCALATION_CHECK_MAX_INTERVAL_SECONDS: float = 300.0
+    TIMER_LISTENER_RETRY_SECONDS: float = 30.0  # wait before reopening the new-timer LISTEN connection
+
+    # Metrics
+    METRICS_REFRESH_SECONDS: int = 60
+    METRICS_CACHE_TTL: float = 15.0  # seconds; 0 disables the /metrics/oncall cache
+
+    # Response caching
+    ONCALL_CACHE_MAX_AGE: int = 60  # seconds; cap on the /oncall/current Cache-Control max-age
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -1,16 +1,36 @@
 import logging
+import threading
 from contextlib import contextmanager
 
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+import orjson
+from psycopg2 import extensions, pool
+from psycopg2.extras import RealDictCursor, register_default_json, register_default_jsonb
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Connection pool: min 1, max 10 connections
+# Decode json/jsonb columns with orjson on every connection, so callers always
+# receive Python objects and never have to re-parse a string.
+register_default_json(globally=True, loads=orjson.loads)
+register_default_jsonb(globally=True, loads=orjson.loads)
+
+# Connection pool sized by DB_POOL_MIN / DB_POOL_MAX (5 and 25 by default)
 _connection_pool: pool.ThreadedConnectionPool | None = None
 
+# One slot per pooled connection.  Sync endpoints and asyncio.to_thread calls
+# share a worker pool larger than DB_POOL_MAX, so callers queue here for up to
+# DB_POOL_TIMEOUT instead of failing as soon as the pool runs dry.
+_pool_slots = threading.BoundedSemaphore(settings.DB_POOL_MAX)
+
+
+class PreparingConnection(extensions.connection):
+    """psycopg2 connection that remembers which statements were PREPAREd on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+
 
 def get_pool() -> pool.ThreadedConnectionPool:
     """Lazily initialize and return the connection pool."""
@@ -20,6 +40,7 @@ def get_pool() -> pool.ThreadedConnectionPool:
             minconn=settings.DB_POOL_MIN,
             maxconn=settings.DB_POOL_MAX,
             dsn=settings.DATABASE_URL,
+            connection_factory=PreparingConnection,
             cursor_factory=RealDictCursor,
         )
         logger.info("Database connection pool created")
@@ -27,24 +48,60 @@ def get_pool() -> pool.ThreadedConnectionPool:
 
 
 @contextmanager
-def get_db_connection(autocommit: bool = False):
+def get_db_connection(autocommit: bool = False, readonly: bool = False, timeout: float | None = None):
     """Context manager for database connections using the pool.
 
+    Waits up to *timeout* (default ``DB_POOL_TIMEOUT``) seconds for a free
+    connection, since ``ThreadedConnectionPool.getconn`` raises instead of
+    blocking once all ``DB_POOL_MAX`` connections are in use.
+
     Args:
         autocommit: If True, commits after yield. Default False (caller manages commits).
+        readonly: If True, the connection runs in driver-level autocommit for the
+            duration of the block, so read-only queries skip the implicit BEGIN
+            and the COMMIT/ROLLBACK round trip.  Switching modes sends nothing to
+            the server.
     """
-    p = get_pool()
-    conn = p.getconn()
+    if timeout is None:
+        timeout = settings.DB_POOL_TIMEOUT
+    if not _pool_slots.acquire(timeout=timeout):
+        raise pool.PoolError("connection pool exhausted")
     try:
-        yield conn
-        if autocommit:
-            conn.commit()
-    except Exception as e:
-        conn.rollback()
-        logger.error(f"Database error: {e}")
-        raise
+        p = get_pool()
+        conn = p.getconn()
+        try:
+            if readonly:
+                conn.autocommit = True
+            yield conn
+            if autocommit:
+                conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error("Database error: %s", e)
+            raise
+        finally:
+            if readonly and not conn.closed:
+                conn.autocommit = False
+            p.putconn(conn)
     finally:
-        p.putconn(conn)
+        _pool_slots.release()
+
+
+def execute_prepared(cur, name: str, query: str, params: tuple = ()):
+    """Execute ``query`` through a server-side prepared statement.
+
+    The statement is PREPAREd the first time ``name`` is used on a pooled
+    connection and EXECUTEd from then on, so repeated calls skip parsing and
+    planning.  ``query`` uses ``$1``-style placeholders.
+    """
+    prepared = cur.connection.prepared
+    if name not in prepared:
+        cur.execute(f"PREPARE {name} AS {query}")
+        prepared.add(name)
+    if params:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
 
 
 def close_pool():
@@ -56,13 +113,13 @@ def close_pool():
         _connection_pool = None
 
 
-def check_database_health() -> bool:
-    """Check database connectivity"""
+def check_database_health(timeout: float | None = None) -> bool:
+    """Check database connectivity, waiting at most *timeout* seconds for a pooled connection"""
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(timeout=timeout) as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT 1")
                 return True
     except Exception as e:
-        logger.error(f"Database health check failed: {e}")
+        logger.error("Database health check failed: %s", e)
         return False
@@ -0,0 +1,12 @@
+"""Conditional-request helpers shared by the routers."""
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value matches *etag*.
+
+    Comparison is weak: a ``W/`` prefix on either side is ignored.
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
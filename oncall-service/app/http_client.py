@@ -0,0 +1,42 @@
+"""Shared httpx.AsyncClient for inter-service communication.
+
+A single persistent client is created on application startup and closed on
+shutdown, avoiding the overhead of establishing a new TCP connection for
+every outgoing request.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+_default_timeout: float = 10.0
+
+
+async def init_http_client(timeout: float = 10.0) -> None:
+    """Create the shared async HTTP client (called at startup)."""
+    global _client, _default_timeout
+    _default_timeout = timeout
+    _client = _new_client(timeout)
+
+
+def _new_client(timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+
+
+async def close_http_client() -> None:
+    """Gracefully close the client (called at shutdown)."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use if startup has not
+    run yet (e.g. during unit tests); :func:`close_http_client` closes it."""
+    global _client
+    if _client is None:
+        _client = _new_client(_default_timeout)
+    return _client
@@ -10,40 +10,122 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.config import settings
 from app.database import close_pool
+from app.http_client import close_http_client, init_http_client
 from app.metrics import setup_custom_metrics
 from app.routers import api, health
-from app.routers.api import check_escalations
+from app.routers.api import (
+    apply_metrics_log,
+    check_escalations,
+    refresh_oncall_gauge,
+    refresh_oncall_metrics,
+    seconds_until_next_timer,
+    timer_added,
+    timer_scheduled,
+)
+from app.routers.health import sample_system_usage
+from app.timer_listener import run_timer_listener
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Growth factor of the auto-escalation interval after a scan that finds nothing due
+_ESCALATION_BACKOFF = 1.5
+
+# The background loops wait through these aliases, so tests can drive them
+# without patching the asyncio module that the shared event loop relies on
+_wait_for = asyncio.wait_for
+_sleep = asyncio.sleep
+_monotonic = time.monotonic
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     # Startup
-    logger.info(f"Starting {settings.SERVICE_NAME} on port {settings.SERVICE_PORT}")
-    logger.info(f"Metrics available at http://localhost:{settings.SERVICE_PORT}/metrics")
-    logger.info(f"Health check at http://localhost:{settings.SERVICE_PORT}/health")
+    await init_http_client(timeout=settings.HTTP_CLIENT_TIMEOUT)
+    logger.info("Starting %s on port %s", settings.SERVICE_NAME, settings.SERVICE_PORT)
+    logger.info("Metrics available at http://localhost:%s/metrics", settings.SERVICE_PORT)
+    logger.info("Health check at http://localhost:%s/health", settings.SERVICE_PORT)
     # Start background escalation task
     task = asyncio.create_task(_escalation_loop())
+    # Wake the escalation loop when any replica inserts a timer
+    listener_task = asyncio.create_task(run_timer_listener(timer_scheduled))
+    # Fold new escalations into the pre-aggregated metrics
+    refresh_task = asyncio.create_task(_metrics_refresh_loop())
+    # Keep memory/disk usage sampled for /health/deep
+    sample_task = asyncio.create_task(_system_sample_loop())
     yield
     # Shutdown
     task.cancel()
+    refresh_task.cancel()
+    sample_task.cancel()
+    listener_task.cancel()
+    await close_http_client()
     close_pool()
-    logger.info(f"Shutting down {settings.SERVICE_NAME}")
+    logger.info("Shutting down %s", settings.SERVICE_NAME)
 
 
 async def _escalation_loop():
-    """Background loop that runs auto-escalation every 60 seconds."""
+    """Background loop that runs auto-escalation on an adaptive interval.
+
+    Sleeps until the earliest pending timer is due, as learned from scans and
+    from new-timer notifications, which wake the loop to recompute its wait.
+    As a safety net for timers it was not told about, it also scans every
+    ``ESCALATION_CHECK_INTERVAL_SECONDS`` while timers keep firing and backs
+    off by ``_ESCALATION_BACKOFF`` after each scan that finds nothing, up to
+    ``ESCALATION_CHECK_MAX_INTERVAL_SECONDS``.  The safety-net scan has an
+    absolute deadline, so a stream of notifications can bring it forward but
+    never postpone it.
+    """
+    interval = settings.ESCALATION_CHECK_INTERVAL_SECONDS
+    scan_deadline = _monotonic() + interval
     while True:
-        await asyncio.sleep(60)
+        delay = max(scan_deadline - _monotonic(), 0.0)
+        until_due = seconds_until_next_timer()
+        if until_due is not None:
+            delay = min(delay, until_due)
         try:
-            await check_escalations()
+            await _wait_for(timer_added.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+        else:
+            timer_added.clear()
+            continue
+
+        try:
+            result = await check_escalations()
             logger.info("Auto-escalation task executed successfully.")
         except Exception as e:
-            logger.error(f"Auto-escalation task failed: {e}")
+            logger.error("Auto-escalation task failed: %s", e)
+        else:
+            if result.checked:
+                interval = settings.ESCALATION_CHECK_INTERVAL_SECONDS
+            else:
+                interval = min(interval * _ESCALATION_BACKOFF, settings.ESCALATION_CHECK_MAX_INTERVAL_SECONDS)
+        scan_deadline = _monotonic() + interval
+
+
+async def _metrics_refresh_loop():
+    """Background loop that folds pending escalation deltas and republishes the on-call metrics.
+
+    Refreshes once immediately so the gauges are populated right after startup.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(apply_metrics_log)
+            await asyncio.to_thread(refresh_oncall_gauge)
+            await refresh_oncall_metrics()
+        except Exception as e:
+            logger.error("Metrics refresh failed: %s", e, exc_info=True)
+        await _sleep(settings.METRICS_REFRESH_SECONDS)
+
+
+async def _system_sample_loop():
+    """Background loop that samples memory and disk usage for the health check."""
+    while True:
+        await asyncio.to_thread(sample_system_usage)
+        await _sleep(settings.HEALTH_PSUTIL_INTERVAL)
 
 
 # Create FastAPI app
@@ -69,7 +151,7 @@ instrumentator = Instrumentator(
     should_ignore_untemplated=True,
     should_respect_env_var=False,
     should_instrument_requests_inprogress=True,
-    excluded_handlers=["/metrics", "/health", "/health/ready", "/health/live"],
+    excluded_handlers=["/metrics", "/health", "/health/deep", "/health/ready", "/health/live"],
     inprogress_name="http_requests_inprogress",
     inprogress_labels=True,
 )
@@ -93,7 +175,7 @@ async def add_process_time_header(request: Request, call_next):
 # Exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Global exception handler caught: {exc}", exc_info=True)
+    logger.error("Global exception handler caught: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
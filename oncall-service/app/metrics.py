@@ -1,6 +1,7 @@
 import logging
 
-from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,51 @@ escalation_response_seconds = Histogram(
 )
 
 
+# ---------------------------------------------------------------------------
+# Snapshot collector
+# ---------------------------------------------------------------------------
+
+
+class OnCallSnapshotCollector:
+    """Expose the latest ``/metrics/oncall`` breakdowns once per scrape.
+
+    The metrics refresh loop (and any ``/metrics/oncall`` computation) swaps
+    in whole dicts via :meth:`update`; :meth:`collect` reads the current
+    snapshot, so publishing N teams costs no per-label ``set()`` calls.
+    """
+
+    def __init__(self):
+        self._snapshot: tuple[dict, dict] = ({}, {})
+
+    def update(self, by_team: dict, oncall_load: dict):
+        self._snapshot = (dict(by_team), dict(oncall_load))
+
+    def collect(self):
+        by_team, oncall_load = self._snapshot
+
+        team_family = GaugeMetricFamily(
+            "oncall_escalations_by_team",
+            "Escalations recorded per team",
+            labels=["team"],
+        )
+        for team, cnt in by_team.items():
+            team_family.add_metric([team], cnt)
+        yield team_family
+
+        load_family = GaugeMetricFamily(
+            "oncall_engineer_load",
+            "Incidents assigned per engineer over the last 7 days",
+            labels=["engineer"],
+        )
+        for engineer, cnt in oncall_load.items():
+            load_family.add_metric([engineer], cnt)
+        yield load_family
+
+
+oncall_snapshot = OnCallSnapshotCollector()
+REGISTRY.register(oncall_snapshot)
+
+
 def setup_custom_metrics():
     """Initialize custom metrics."""
     logger.info("Custom Prometheus metrics initialized")
@@ -78,4 +124,5 @@ __all__ = [
     "active_escalation_timers",
     "escalation_rate",
     "escalation_response_seconds",
+    "oncall_snapshot",
 ]
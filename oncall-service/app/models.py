@@ -170,6 +170,7 @@ class AutoEscalationResult(BaseModel):
     checked: int
     escalated: int
     details: List[Dict]
+    failed: int = 0  # timers that could not be processed; retried on the next run
 
 
 # ---------------------------------------------------------------------------
@@ -263,6 +264,7 @@ class OnCallMetrics(BaseModel):
     avg_mttr_seconds: Optional[float] = None
     oncall_load: Dict[str, int] = Field(default_factory=dict)
     by_team: Dict[str, int] = Field(default_factory=dict)
+    staleness_seconds: float = Field(default=0.0, description="Age of the escalation aggregates (0 when computed live)")
 
 
 # ---------------------------------------------------------------------------
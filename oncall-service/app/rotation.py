@@ -0,0 +1,145 @@
+"""On-call rotation: who is primary and secondary for a schedule right now.
+
+Kept free of I/O and typed on primitives (dates, ints, strings) so the
+rotation math can be compiled as a standalone module.
+"""
+
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.models import Engineer
+
+
+def compute_current_oncall(schedule: dict, now: datetime | None = None) -> tuple[Engineer | None, Engineer | None]:
+    """Compute the current primary and secondary on-call from a rotation schedule.
+
+    For *weekly* rotations the on-call engineer index is determined by
+    the number of full weeks since ``start_date``.  For *daily* rotations
+    the index is the number of full days since ``start_date``.
+
+    **Handoff-hour aware**: The rotation switches at ``handoff_hour`` in
+    the schedule's ``timezone``.  Before the handoff hour, the previous
+    period's engineer is still on-call.
+
+    Returns (primary_engineer, secondary_engineer) where secondary is the
+    next engineer in the rotation or ``None`` if the team has only one
+    member.  *now* (an aware datetime) lets callers that already hold a
+    timestamp resolve many schedules without reading the clock each time.
+    """
+    engineers = schedule["engineers"]
+    if not engineers:
+        return None, None
+
+    start = schedule["start_date"]
+    if isinstance(start, str):
+        start = date.fromisoformat(start)
+    elif hasattr(start, "date") and callable(start.date):
+        # datetime objects have a .date() method; plain date objects do not
+        start = start.date()
+
+    # Resolve timezone and handoff hour
+    tz_name = schedule.get("timezone") or "UTC"
+    handoff_hour = schedule.get("handoff_hour")
+    if handoff_hour is None:
+        handoff_hour = 9
+    rotation_type = schedule.get("rotation_type", "weekly")
+
+    # Handoffs happen on the hour in every zone, so the rotation cannot
+    # change within a wall-clock minute -- use it as the cache bucket.
+    minute_bucket = int((now or datetime.now(timezone.utc)).timestamp()) // 60
+
+    schedule_id = schedule.get("id")
+    if schedule_id is None and not all(isinstance(e, dict) for e in engineers):
+        # Already-built Engineer models are not hashable; compute directly
+        return _rotation(engineers, start, tz_name, handoff_hour, rotation_type, minute_bucket)
+
+    return _cached_rotation(
+        _ScheduleEngineers(schedule_id, engineers), start, tz_name, handoff_hour, rotation_type, minute_bucket
+    )
+
+
+class _ScheduleEngineers:
+    """Hashable handle on a schedule's engineer list for the rotation cache.
+
+    Schedules are never updated in place, so one with an ``id`` is keyed by
+    that id alone and its engineer list is not rehashed on every lookup.
+    """
+
+    __slots__ = ("key", "engineers")
+
+    def __init__(self, schedule_id, engineers: list):
+        self.engineers = engineers
+        self.key = str(schedule_id) if schedule_id is not None else tuple(tuple(e.items()) for e in engineers)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _ScheduleEngineers) and self.key == other.key
+
+
+@lru_cache(maxsize=64)
+def get_zone(name: str) -> ZoneInfo:
+    """Return the ``ZoneInfo`` for *name*, falling back to UTC for unknown zones."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, KeyError):
+        return ZoneInfo("UTC")
+
+
+@lru_cache(maxsize=1024)
+def _cached_rotation(
+    engineers: _ScheduleEngineers,
+    start: date,
+    tz_name: str,
+    handoff_hour: int,
+    rotation_type: str,
+    minute_bucket: int,
+) -> tuple[Engineer | None, Engineer | None]:
+    """Memoized :func:`_rotation` keyed on the schedule and hashable primitives.
+
+    Results expire implicitly when ``minute_bucket`` rolls over.
+    """
+    return _rotation(engineers.engineers, start, tz_name, handoff_hour, rotation_type, minute_bucket)
+
+
+def _rotation(
+    engineers: list,
+    start: date,
+    tz_name: str,
+    handoff_hour: int,
+    rotation_type: str,
+    minute_bucket: int,
+) -> tuple[Engineer | None, Engineer | None]:
+    """Resolve the on-call pair for already-normalised schedule fields.
+
+    The time is taken from ``minute_bucket`` (Unix minutes) rather than the
+    clock, which is exact because handoffs fall on the hour.
+    """
+    engineer_list = [Engineer.model_construct(**e) if isinstance(e, dict) else e for e in engineers]
+    if not engineer_list:
+        return None, None
+
+    now_tz = datetime.fromtimestamp(minute_bucket * 60, get_zone(tz_name))
+
+    # Before handoff hour → still in the previous rotation period
+    effective_ordinal = now_tz.toordinal() - (now_tz.hour < handoff_hour)
+    delta_days = max(effective_ordinal - start.toordinal(), 0)
+
+    periods = delta_days if rotation_type == "daily" else delta_days // 7
+    n = len(engineer_list)
+    # Power-of-two team sizes (2, 4, 8, ...) reduce with a mask instead of a division
+    nmask = n - 1 if n & (n - 1) == 0 else None
+
+    if nmask is not None:
+        idx = periods & nmask
+        next_idx = (idx + 1) & nmask
+    else:
+        idx = periods % n
+        next_idx = (idx + 1) % n
+
+    primary = engineer_list[idx]
+    secondary = engineer_list[next_idx] if n > 1 else None
+
+    return primary, secondary
@@ -1,15 +1,21 @@
-import json
+import asyncio
+import hashlib
 import logging
-import uuid
-from datetime import date, datetime, timedelta, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import httpx
-from fastapi import APIRouter, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from psycopg2.errors import ForeignKeyViolation
 
 from app.config import settings
-from app.database import get_db_connection
+from app.database import execute_prepared, get_db_connection
+from app.etag import etag_matches
+from app.http_client import get_http_client
+from app.ids import new_id
 from app.metrics import (
     active_escalation_timers,
     auto_escalation_runs_total,
@@ -17,6 +23,7 @@ from app.metrics import (
     escalation_rate,
     escalations_total,
     oncall_current,
+    oncall_snapshot,
 )
 from app.models import (
     AutoEscalationResult,
@@ -42,82 +49,147 @@ from app.models import (
     TimerStartRequest,
     TimerStartResponse,
 )
+from app.rotation import compute_current_oncall, get_zone
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-
-# ---------------------------------------------------------------------------
-# Helpers -- rotation logic
-# ---------------------------------------------------------------------------
-
-
-def _compute_current_oncall(schedule: dict) -> tuple[Engineer | None, Engineer | None]:
-    """Compute the current primary and secondary on-call from a rotation schedule.
-
-    For *weekly* rotations the on-call engineer index is determined by
-    the number of full weeks since ``start_date``.  For *daily* rotations
-    the index is the number of full days since ``start_date``.
-
-    **Handoff-hour aware**: The rotation switches at ``handoff_hour`` in
-    the schedule's ``timezone``.  Before the handoff hour, the previous
-    period's engineer is still on-call.
-
-    Returns (primary_engineer, secondary_engineer) where secondary is the
-    next engineer in the rotation or ``None`` if the team has only one
-    member.
-    """
-    engineers = schedule["engineers"]
-    if not engineers:
-        return None, None
-
-    # Parse engineers -- they're stored as JSONB (list of dicts)
-    if isinstance(engineers, str):
-        engineers = json.loads(engineers)
-
-    engineer_list = [Engineer(**e) if isinstance(e, dict) else e for e in engineers]
-    if not engineer_list:
-        return None, None
-
-    start = schedule["start_date"]
-    if isinstance(start, str):
-        start = date.fromisoformat(start)
-    elif hasattr(start, "date") and callable(start.date):
-        # datetime objects have a .date() method; plain date objects do not
-        start = start.date()
-
-    # Resolve timezone and handoff hour
-    tz_name = schedule.get("timezone") or "UTC"
-    handoff_hour = schedule.get("handoff_hour")
-    if handoff_hour is None:
-        handoff_hour = 9
-
-    try:
-        tz = ZoneInfo(tz_name)
-    except (ZoneInfoNotFoundError, KeyError):
-        tz = ZoneInfo("UTC")
-
-    now_tz = datetime.now(tz)
-    effective_date = now_tz.date()
-
-    # Before handoff hour → still in the previous rotation period
-    if now_tz.hour < handoff_hour:
-        effective_date -= timedelta(days=1)
-
-    delta_days = (effective_date - start).days
-    if delta_days < 0:
-        delta_days = 0
-
-    rotation_type = schedule.get("rotation_type", "weekly")
-    if rotation_type == "daily":
-        idx = delta_days % len(engineer_list)
-    else:  # weekly
-        idx = (delta_days // 7) % len(engineer_list)
-
-    primary = engineer_list[idx]
-    secondary = engineer_list[(idx + 1) % len(engineer_list)] if len(engineer_list) > 1 else None
-
-    return primary, secondary
+# Fixed metrics queries, executed as server-side prepared statements
+# Total and per-team escalation counts from one scan of oncall.escalations
+_Q_ESC_COUNTS = """
+    SELECT
+        COALESCE(SUM(cnt), 0) AS cnt,
+        COALESCE(jsonb_object_agg(team, cnt) FILTER (WHERE team IS NOT NULL), '{}'::jsonb) AS by_team
+    FROM (
+        SELECT team, COUNT(*) AS cnt
+        FROM oncall.escalations
+        GROUP BY team
+    ) t
+"""
+_Q_METRICS_SUMMARY = """
+    SELECT
+        COALESCE(SUM(cnt), 0) AS total_escalations,
+        COALESCE(jsonb_object_agg(team, cnt) FILTER (WHERE team <> ''), '{}'::jsonb) AS by_team,
+        (
+            SELECT COALESCE(EXTRACT(EPOCH FROM now() - MIN(ts)), 0)
+            FROM oncall.escalation_metrics_mlog
+        ) AS staleness_seconds
+    FROM oncall.escalation_metrics
+"""
+
+# Hot-path lookups, also executed as server-side prepared statements
+_Q_LATEST_SCHEDULE = "SELECT * FROM oncall.schedules WHERE team = $1 ORDER BY created_at DESC LIMIT 1"
+_Q_POLICY_LEVEL = "SELECT wait_minutes, notify_target FROM oncall.escalation_policies WHERE team = $1 AND level = $2"
+# Due timers plus the earliest escalate_after among the active timers left
+# over; the outer join always yields one row, with a NULL id when none is due.
+_Q_EXPIRED_TIMERS = """
+    WITH due AS (
+        SELECT id, incident_id, team, current_level, assigned_to, escalate_after
+        FROM oncall.escalation_timers
+        WHERE is_active = TRUE AND escalate_after <= $1
+        ORDER BY escalate_after
+        LIMIT $2
+    )
+    SELECT due.*, pending.next_due
+    FROM (
+        SELECT MIN(escalate_after) AS next_due
+        FROM oncall.escalation_timers
+        WHERE is_active = TRUE AND id NOT IN (SELECT id FROM due)
+    ) pending
+    LEFT JOIN due ON TRUE
+    ORDER BY due.escalate_after
+"""
+# Escalation and timer writes, prepared on first use per pooled connection.
+# A manual escalation is one statement: record it, retire the incident's
+# active timers and start the next-level timer, whose wait comes from the
+# team's policy for that level (or $10 minutes without one).
+_Q_RECORD_ESCALATION = """
+    WITH recorded AS (
+        INSERT INTO oncall.escalations
+            (id, incident_id, from_engineer, to_engineer, level, reason, team, escalated_at)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ), retired AS (
+        UPDATE oncall.escalation_timers SET is_active = FALSE
+        WHERE incident_id = $2 AND is_active = TRUE
+    )
+    INSERT INTO oncall.escalation_timers
+        (id, incident_id, team, current_level, assigned_to, escalate_after, is_active)
+    VALUES (
+        $9, $2, $7, $5 + 1, $4,
+        $8 + make_interval(mins => COALESCE(
+            (SELECT wait_minutes FROM oncall.escalation_policies WHERE team = $7 AND level = $5 + 1), $10
+        )),
+        TRUE
+    )
+"""
+_Q_INSERT_TIMER = """
+    INSERT INTO oncall.escalation_timers
+        (id, incident_id, team, current_level, assigned_to, escalate_after, is_active)
+    VALUES ($1, $2, $3, $4, $5, $6, TRUE)
+"""
+_Q_CANCEL_TIMERS = """
+    UPDATE oncall.escalation_timers
+    SET is_active = FALSE
+    WHERE incident_id = $1 AND is_active = TRUE
+    RETURNING team
+"""
+# Id arrays are passed as text[] (how psycopg2 adapts a list of str) and cast in SQL
+_Q_DEACTIVATE_TIMERS = "UPDATE oncall.escalation_timers SET is_active = FALSE WHERE id = ANY($1::text[]::uuid[])"
+# Every escalation of an auto-escalation run in one round trip: the escalation
+# rows, the expired timers they retire and the next-level timers, as arrays
+_Q_RECORD_AUTO_ESCALATIONS = """
+    WITH recorded AS (
+        INSERT INTO oncall.escalations
+            (id, incident_id, from_engineer, to_engineer, level, reason, team, escalated_at)
+        SELECT e.id::uuid, e.incident_id, e.from_engineer, e.to_engineer, e.level, e.reason, e.team, $8::timestamptz
+        FROM UNNEST($1::text[], $2::text[], $3::text[], $4::text[], $5::int[], $6::text[], $7::text[])
+            AS e(id, incident_id, from_engineer, to_engineer, level, reason, team)
+    ), retired AS (
+        UPDATE oncall.escalation_timers SET is_active = FALSE WHERE id = ANY($9::text[]::uuid[])
+    )
+    INSERT INTO oncall.escalation_timers
+        (id, incident_id, team, current_level, assigned_to, escalate_after, is_active)
+    SELECT t.id::uuid, t.incident_id, t.team, t.current_level, t.assigned_to, t.escalate_after, TRUE
+    FROM UNNEST($10::text[], $11::text[], $12::text[], $13::int[], $14::text[], $15::timestamptz[])
+        AS t(id, incident_id, team, current_level, assigned_to, escalate_after)
+"""
+# The rotation index is computed in SQL (oncall.current_oncall_index), so only
+# the primary and secondary entries of the engineers array leave the database.
+_Q_CURRENT_ONCALL = """
+    SELECT id, rotation_type, escalation_minutes, handoff_hour, timezone, created_at,
+           engineers -> idx AS primary_engineer,
+           CASE WHEN n > 1 THEN engineers -> ((idx + 1) % n) END AS secondary_engineer
+    FROM (
+        SELECT s.*, oncall.current_oncall_index(s) AS idx, jsonb_array_length(s.engineers) AS n
+        FROM oncall.schedules s
+        WHERE team = $1
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) q
+"""
+# Current pair for every team's latest schedule, for the oncall_current gauge
+_Q_ONCALL_ALL_TEAMS = """
+    SELECT team,
+           engineers -> idx AS primary_engineer,
+           CASE WHEN n > 1 THEN engineers -> ((idx + 1) % n) END AS secondary_engineer
+    FROM (
+        SELECT DISTINCT ON (team) s.team, s.engineers,
+               oncall.current_oncall_index(s) AS idx, jsonb_array_length(s.engineers) AS n
+        FROM oncall.schedules s
+        ORDER BY team, created_at DESC
+    ) q
+"""
+# Escalation history columns, selected in the EscalationHistoryItem shape so
+# rows can be encoded unchanged
+_ESCALATION_HISTORY_COLUMNS = (
+    "id::text AS id, incident_id, from_engineer, to_engineer, COALESCE(level, 1) AS level, reason, escalated_at"
+)
+# Timer and member columns in the EscalationTimerResponse / ScheduleMemberResponse
+# shape, so rows map straight onto the models without per-field copying
+_TIMER_COLUMNS = "id::text AS id, incident_id, team, current_level, assigned_to, escalate_after, is_active"
+_MEMBER_COLUMNS = (
+    "id::text AS id, schedule_id::text AS schedule_id, user_name, user_email, position, is_active, created_at"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -128,7 +200,7 @@ def _compute_current_oncall(schedule: dict) -> tuple[Engineer | None, Engineer |
 @router.post("/schedules", response_model=ScheduleResponse, status_code=status.HTTP_201_CREATED)
 def create_schedule(body: ScheduleCreateRequest):
     """Create a new on-call rotation schedule for a team."""
-    schedule_id = str(uuid.uuid4())
+    schedule_id = new_id()
     engineers_json = [e.model_dump() for e in body.engineers]
 
     # Validate timezone
@@ -154,7 +226,7 @@ def create_schedule(body: ScheduleCreateRequest):
                         body.team,
                         body.rotation_type.value,
                         body.start_date.isoformat(),
-                        json.dumps(engineers_json),
+                        orjson.dumps(engineers_json).decode(),
                         body.escalation_minutes,
                         body.handoff_hour,
                         body.timezone,
@@ -162,19 +234,15 @@ def create_schedule(body: ScheduleCreateRequest):
                 )
                 row = cur.fetchone()
     except Exception as exc:
-        logger.error(f"Failed to create schedule: {exc}")
+        logger.error("Failed to create schedule: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to create schedule") from exc
 
-    engineers_data = row["engineers"]
-    if isinstance(engineers_data, str):
-        engineers_data = json.loads(engineers_data)
-
-    return ScheduleResponse(
+    return ScheduleResponse.model_construct(
         id=str(row["id"]),
         team=row["team"],
         rotation_type=row["rotation_type"],
         start_date=row["start_date"],
-        engineers=[Engineer(**e) for e in engineers_data],
+        engineers=[Engineer.model_construct(**e) for e in row["engineers"]],
         escalation_minutes=row["escalation_minutes"],
         handoff_hour=row.get("handoff_hour", 9) if isinstance(row, dict) else 9,
         timezone=row.get("timezone", "UTC") if isinstance(row, dict) else "UTC",
@@ -193,7 +261,7 @@ def list_schedules(
 ):
     """List all on-call schedules, optionally filtered by team."""
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 if team:
                     cur.execute(
@@ -204,21 +272,18 @@ def list_schedules(
                     cur.execute("SELECT * FROM oncall.schedules ORDER BY created_at DESC")
                 rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to list schedules: {exc}")
+        logger.error("Failed to list schedules: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to list schedules") from exc
 
     schedules = []
     for row in rows:
-        engineers_data = row["engineers"]
-        if isinstance(engineers_data, str):
-            engineers_data = json.loads(engineers_data)
         schedules.append(
-            ScheduleResponse(
+            ScheduleResponse.model_construct(
                 id=str(row["id"]),
                 team=row["team"],
                 rotation_type=row["rotation_type"],
                 start_date=row["start_date"],
-                engineers=[Engineer(**e) for e in engineers_data],
+                engineers=[Engineer.model_construct(**e) for e in row["engineers"]],
                 escalation_minutes=row["escalation_minutes"],
                 handoff_hour=row.get("handoff_hour", 9) if isinstance(row, dict) else 9,
                 timezone=row.get("timezone", "UTC") if isinstance(row, dict) else "UTC",
@@ -250,7 +315,7 @@ def delete_schedule(schedule_id: str):
                 )
                 row = cur.fetchone()
     except Exception as exc:
-        logger.error(f"Failed to delete schedule: {exc}")
+        logger.error("Failed to delete schedule: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to delete schedule") from exc
 
     if not row:
@@ -262,50 +327,92 @@ def delete_schedule(schedule_id: str):
 # ---------------------------------------------------------------------------
 
 
-@router.get("/oncall/current", response_model=CurrentOnCallResponse)
+def _engineer_from_json(value) -> Engineer | None:
+    """Build an :class:`Engineer` from a decoded JSONB engineer object (or ``None``)."""
+    return Engineer.model_construct(**value) if value else None
+
+
+def _seconds_until_handoff(tz_name: str, handoff_hour: int) -> int:
+    """Seconds from now until the next daily handoff in *tz_name*."""
+    now = datetime.now(get_zone(tz_name))
+    handoff = now.replace(hour=handoff_hour, minute=0, second=0, microsecond=0)
+    if handoff <= now:
+        handoff += timedelta(days=1)
+    # Compare in UTC so DST transitions are accounted for
+    return max(int((handoff.astimezone(timezone.utc) - now.astimezone(timezone.utc)).total_seconds()), 0)
+
+
+@router.get(
+    "/oncall/current",
+    response_model=CurrentOnCallResponse,
+    responses={304: {"description": "On-call pair unchanged since the ETag was issued"}},
+)
 def get_current_oncall(
+    response: Response,
     team: str = Query(..., description="Team name to look up"),
+    if_none_match: Optional[str] = Header(None),
 ):
-    """Get the current primary and secondary on-call engineers for a team."""
+    """Get the current primary and secondary on-call engineers for a team.
+
+    The response carries an ``ETag`` over every returned field and the
+    schedule's ``created_at``, and a ``Cache-Control`` max-age of at most
+    ``ONCALL_CACHE_MAX_AGE`` that never runs past the next handoff, so a new
+    or deleted schedule is picked up quickly; a matching ``If-None-Match``
+    gets ``304 Not Modified``.
+    """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT * FROM oncall.schedules WHERE team = %s ORDER BY created_at DESC LIMIT 1",
-                    (team,),
-                )
+                execute_prepared(cur, "oncall_current", _Q_CURRENT_ONCALL, (team,))
                 schedule = cur.fetchone()
     except Exception as exc:
-        logger.error(f"Failed to query on-call: {exc}")
+        logger.error("Failed to query on-call: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to query on-call schedule") from exc
 
     if not schedule:
         raise HTTPException(status_code=404, detail=f"No schedule found for team '{team}'")
 
-    primary_eng, secondary_eng = _compute_current_oncall(schedule)
+    primary_eng = _engineer_from_json(schedule["primary_engineer"])
+    secondary_eng = _engineer_from_json(schedule["secondary_engineer"])
 
     if not primary_eng:
         raise HTTPException(status_code=404, detail=f"No engineers configured for team '{team}'")
 
-    # Update Prometheus gauge
-    oncall_current.labels(team=team, engineer=primary_eng.email, role="primary").set(1)
-    if secondary_eng:
-        oncall_current.labels(team=team, engineer=secondary_eng.email, role="secondary").set(1)
+    handoff_hour = schedule.get("handoff_hour", 9) if isinstance(schedule, dict) else 9
+    tz_name = schedule.get("timezone", "UTC") if isinstance(schedule, dict) else "UTC"
+    # The pair only changes at a handoff, but the schedule itself can be
+    # replaced at any time, so shared caches only keep it briefly
+    secondary_id = f"{secondary_eng.name}:{secondary_eng.email}" if secondary_eng else ""
+    version = (
+        f"{schedule['id']}:{schedule.get('created_at')}:{primary_eng.name}:{primary_eng.email}:{secondary_id}:"
+        f"{schedule['rotation_type']}:{schedule['escalation_minutes']}:{handoff_hour}:{tz_name}"
+    )
+    etag = hashlib.blake2b(version.encode(), digest_size=8)
+    max_age = min(
+        _seconds_until_handoff(tz_name or "UTC", 9 if handoff_hour is None else handoff_hour),
+        settings.ONCALL_CACHE_MAX_AGE,
+    )
+    cache_headers = {"ETag": f'"{etag.hexdigest()}"', "Cache-Control": f"public, max-age={max_age}"}
+    if etag_matches(if_none_match, cache_headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    response.headers.update(cache_headers)
 
-    primary = OnCallEngineer(name=primary_eng.name, email=primary_eng.email, role="primary")
+    primary = OnCallEngineer.model_construct(name=primary_eng.name, email=primary_eng.email, role="primary")
     secondary = (
-        OnCallEngineer(name=secondary_eng.name, email=secondary_eng.email, role="secondary") if secondary_eng else None
+        OnCallEngineer.model_construct(name=secondary_eng.name, email=secondary_eng.email, role="secondary")
+        if secondary_eng
+        else None
     )
 
-    return CurrentOnCallResponse(
+    return CurrentOnCallResponse.model_construct(
         team=team,
         primary=primary,
         secondary=secondary,
         schedule_id=str(schedule["id"]),
         rotation_type=schedule["rotation_type"],
         escalation_minutes=schedule["escalation_minutes"],
-        handoff_hour=schedule.get("handoff_hour", 9) if isinstance(schedule, dict) else 9,
-        timezone=schedule.get("timezone", "UTC") if isinstance(schedule, dict) else "UTC",
+        handoff_hour=handoff_hour,
+        timezone=tz_name,
     )
 
 
@@ -314,12 +421,67 @@ def get_current_oncall(
 # ---------------------------------------------------------------------------
 
 
+def _escalation_target(primary_eng: Engineer, secondary_eng: Engineer | None, level: int) -> tuple[str, str | None]:
+    """Return ``(from_engineer, to_engineer)`` for a manual escalation at *level*."""
+    if level == 1 and secondary_eng:
+        return primary_eng.email, secondary_eng.email
+    if level >= 2:
+        # Escalate to manager
+        return (secondary_eng.email if secondary_eng else primary_eng.email), settings.MANAGER_EMAIL
+    # Single engineer team — try manager as target
+    return primary_eng.email, settings.MANAGER_EMAIL
+
+
+def _record_escalation(
+    incident_id: str, team: str, level: int, escalation_id: str, reason: str, now: datetime
+) -> tuple[dict | None, Engineer | None, str | None, str | None]:
+    """Resolve the escalation target for *team* and record the escalation.
+
+    Returns ``(schedule, primary, from_engineer, to_engineer)``.  Nothing is
+    written unless a target is found; otherwise the escalation, the timer
+    hand-over and the next-level timer commit together.
+    """
+    primary_eng = secondary_eng = None
+    from_engineer = to_engineer = None
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            execute_prepared(cur, "oncall_latest_schedule", _Q_LATEST_SCHEDULE, (team,))
+            schedule = cur.fetchone()
+
+        if schedule:
+            primary_eng, secondary_eng = compute_current_oncall(schedule, now)
+        if primary_eng:
+            from_engineer, to_engineer = _escalation_target(primary_eng, secondary_eng, level)
+        if to_engineer:
+            with conn.cursor() as cur:
+                execute_prepared(
+                    cur,
+                    "oncall_record_escalation",
+                    _Q_RECORD_ESCALATION,
+                    (
+                        escalation_id,
+                        incident_id,
+                        from_engineer,
+                        to_engineer,
+                        level,
+                        reason,
+                        team,
+                        now,
+                        new_id(),
+                        settings.DEFAULT_ESCALATION_MINUTES,
+                    ),
+                )
+            conn.commit()
+            logger.info("Escalation timer set: incident=%s level=%s", incident_id, level + 1)
+    return schedule, primary_eng, from_engineer, to_engineer
+
+
 @router.post("/escalate", response_model=EscalateResponse, status_code=status.HTTP_201_CREATED)
-async def escalate_incident(body: EscalateRequest):
+async def escalate_incident(body: EscalateRequest, background_tasks: BackgroundTasks):
     """Escalate an incident: reassign from primary to secondary on-call.
 
-    Determines escalation level, records the event, sends notification
-    to the next on-call engineer, and starts a new escalation timer.
+    Determines escalation level, records the event, starts a new escalation
+    timer, and notifies the next on-call engineer once the response is sent.
     """
     team = body.team
 
@@ -328,101 +490,48 @@ async def escalate_incident(body: EscalateRequest):
         team = "platform"  # default fallback
 
     level = body.level or 1
+    escalation_id = new_id()
+    now = datetime.now(timezone.utc)
+    reason = body.reason or "No acknowledgment within escalation window"
 
-    # Look up the current schedule
+    # Schedule lookup, escalation record, timer hand-over and the next-level
+    # timer share one pooled connection and run in a worker thread, off the
+    # event loop.
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT * FROM oncall.schedules WHERE team = %s ORDER BY created_at DESC LIMIT 1",
-                    (team,),
-                )
-                schedule = cur.fetchone()
+        schedule, primary_eng, from_engineer, to_engineer = await asyncio.to_thread(
+            _record_escalation, body.incident_id, team, level, escalation_id, reason, now
+        )
     except Exception as exc:
-        logger.error(f"Failed to query schedule for escalation: {exc}")
-        raise HTTPException(status_code=500, detail="Failed to query schedule") from exc
+        logger.error("Failed to record escalation: %s", exc)
+        raise HTTPException(status_code=500, detail="Failed to record escalation") from exc
 
     if not schedule:
         raise HTTPException(status_code=404, detail=f"No schedule found for team '{team}'")
 
-    primary_eng, secondary_eng = _compute_current_oncall(schedule)
-
     if not primary_eng:
         raise HTTPException(status_code=404, detail=f"No engineers configured for team '{team}'")
 
-    # Determine escalation target based on level and policy
-    from_engineer = primary_eng.email
-    to_engineer = None
-
-    if level == 1 and secondary_eng:
-        to_engineer = secondary_eng.email
-    elif level >= 2:
-        # Escalate to manager
-        to_engineer = settings.MANAGER_EMAIL
-        from_engineer = secondary_eng.email if secondary_eng else primary_eng.email
-    else:
-        # Single engineer team — try manager as target
-        to_engineer = settings.MANAGER_EMAIL
-
     if not to_engineer:
         raise HTTPException(
             status_code=422,
             detail=f"No secondary on-call for team '{team}' -- cannot escalate",
         )
 
-    # Record escalation in the database
-    escalation_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc)
-    reason = body.reason or "No acknowledgment within escalation window"
-
-    try:
-        with get_db_connection(autocommit=True) as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO oncall.escalations (id, incident_id, from_engineer, to_engineer, level, reason, escalated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        escalation_id,
-                        body.incident_id,
-                        from_engineer,
-                        to_engineer,
-                        level,
-                        reason,
-                        now,
-                    ),
-                )
-    except Exception as exc:
-        logger.error(f"Failed to record escalation: {exc}")
-        raise HTTPException(status_code=500, detail="Failed to record escalation") from exc
-
-    # Increment Prometheus counter
     escalations_total.labels(team=team).inc()
+    active_escalation_timers.labels(team=team).inc()
 
-    # Deactivate any existing escalation timer for this incident
-    try:
-        with get_db_connection(autocommit=True) as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE oncall.escalation_timers SET is_active = FALSE WHERE incident_id = %s AND is_active = TRUE",
-                    (body.incident_id,),
-                )
-    except Exception:
-        pass  # Non-critical
-
-    # Start new escalation timer for the next level
-    _start_escalation_timer(body.incident_id, team, level + 1, to_engineer)
-
-    # Send notification to the escalation target
-    await _notify_engineer(
+    # Notify the escalation target after the response has been sent
+    background_tasks.add_task(
+        _notify_engineer,
         incident_id=body.incident_id,
         engineer=to_engineer,
         message=f"[ESCALATED L{level}] Incident {body.incident_id} escalated to you. Reason: {reason}",
         team=team,
     )
 
-    logger.info(f"Escalation L{level}: incident={body.incident_id} from={from_engineer} to={to_engineer} team={team}")
+    logger.info(
+        "Escalation L%s: incident=%s from=%s to=%s team=%s", level, body.incident_id, from_engineer, to_engineer, team
+    )
 
     return EscalateResponse(
         escalation_id=escalation_id,
@@ -446,14 +555,20 @@ def list_escalations(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
 ):
-    """List escalation history."""
+    """List escalation history.
+
+    The page (bounded by *limit*) is fetched in full and the connection
+    returned to the pool before the body is sent, so a slow client never
+    holds a pool slot.  Rows already have the :class:`EscalationHistoryItem`
+    shape, so orjson encodes them as-is (datetimes as RFC 3339).
+    """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 if incident_id:
                     cur.execute(
-                        """
-                        SELECT * FROM oncall.escalations
+                        f"""
+                        SELECT {_ESCALATION_HISTORY_COLUMNS} FROM oncall.escalations
                         WHERE incident_id = %s
                         ORDER BY escalated_at DESC
                         LIMIT %s OFFSET %s
@@ -462,8 +577,8 @@ def list_escalations(
                     )
                 else:
                     cur.execute(
-                        """
-                        SELECT * FROM oncall.escalations
+                        f"""
+                        SELECT {_ESCALATION_HISTORY_COLUMNS} FROM oncall.escalations
                         ORDER BY escalated_at DESC
                         LIMIT %s OFFSET %s
                         """,
@@ -471,24 +586,10 @@ def list_escalations(
                     )
                 rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to list escalations: {exc}")
+        logger.error("Failed to list escalations: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to list escalations") from exc
 
-    return {
-        "escalations": [
-            {
-                "id": str(r["id"]),
-                "incident_id": r["incident_id"],
-                "from_engineer": r["from_engineer"],
-                "to_engineer": r["to_engineer"],
-                "level": r.get("level", 1),
-                "reason": r.get("reason"),
-                "escalated_at": r["escalated_at"].isoformat() if r["escalated_at"] else None,
-            }
-            for r in rows
-        ],
-        "total": len(rows),
-    }
+    return ORJSONResponse({"escalations": rows, "total": len(rows)})
 
 
 # ---------------------------------------------------------------------------
@@ -499,30 +600,30 @@ def list_escalations(
 async def _notify_engineer(incident_id: str, engineer: str, message: str, team: str):
     """Send a notification to an engineer via the Notification Service."""
     try:
-        async with httpx.AsyncClient(timeout=settings.HTTP_CLIENT_TIMEOUT) as client:
-            resp = await client.post(
-                f"{settings.NOTIFICATION_SERVICE_URL}/api/v1/notify",
-                json={
-                    "incident_id": incident_id,
-                    "engineer": engineer,
-                    "channel": "mock",
-                    "message": message,
-                },
-            )
-            notif_status = "sent" if resp.status_code < 400 else "failed"
-            escalation_notifications_total.labels(
-                team=team,
-                channel="mock",
-                status=notif_status,
-            ).inc()
-            logger.info(f"Notification sent to {engineer} for {incident_id}: {notif_status}")
+        client = get_http_client()
+        resp = await client.post(
+            f"{settings.NOTIFICATION_SERVICE_URL}/api/v1/notify",
+            json={
+                "incident_id": incident_id,
+                "engineer": engineer,
+                "channel": "mock",
+                "message": message,
+            },
+        )
+        notif_status = "sent" if resp.status_code < 400 else "failed"
+        escalation_notifications_total.labels(
+            team=team,
+            channel="mock",
+            status=notif_status,
+        ).inc()
+        logger.info("Notification sent to %s for %s: %s", engineer, incident_id, notif_status)
     except Exception as e:
         escalation_notifications_total.labels(
             team=team,
             channel="mock",
             status="failed",
         ).inc()
-        logger.warning(f"Notification service unavailable for {incident_id}: {e}")
+        logger.warning("Notification service unavailable for %s: %s", incident_id, e)
 
 
 # ---------------------------------------------------------------------------
@@ -530,41 +631,37 @@ async def _notify_engineer(incident_id: str, engineer: str, message: str, team:
 # ---------------------------------------------------------------------------
 
 
-def _start_escalation_timer(incident_id: str, team: str, next_level: int, assigned_to: str):
-    """Create an escalation timer for the next escalation level."""
-    # Look up the escalation policy to find wait time for next level
-    wait_minutes = settings.DEFAULT_ESCALATION_MINUTES
-    try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT wait_minutes FROM oncall.escalation_policies WHERE team = %s AND level = %s",
-                    (team, next_level),
-                )
-                policy = cur.fetchone()
-                if policy:
-                    wait_minutes = policy["wait_minutes"]
-    except Exception:
-        pass  # Use default
+# Policies are edited by hand and rarely change, so (team, level) lookups are
+# cached in-process; create_escalation_policy drops a team's entries.
+_POLICY_CACHE_TTL = 60.0
+_policy_cache: dict[tuple[str, int], tuple[float, dict | None]] = {}
 
-    now = datetime.now(timezone.utc)
-    escalate_after = now + timedelta(minutes=wait_minutes)
 
-    try:
-        with get_db_connection(autocommit=True) as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO oncall.escalation_timers
-                        (incident_id, team, current_level, assigned_to, escalate_after, is_active)
-                    VALUES (%s, %s, %s, %s, %s, TRUE)
-                    """,
-                    (incident_id, team, next_level, assigned_to, escalate_after),
-                )
-        active_escalation_timers.labels(team=team).inc()
-        logger.info(f"Escalation timer set: incident={incident_id} level={next_level} at={escalate_after}")
-    except Exception as e:
-        logger.error(f"Failed to create escalation timer: {e}")
+def _cached_policy(team: str, level: int) -> tuple[bool, dict | None]:
+    """Return ``(hit, policy)`` for *team*/*level*; ``policy`` is ``None`` for unconfigured levels."""
+    entry = _policy_cache.get((team, level))
+    if entry is not None and time.monotonic() < entry[0]:
+        return True, entry[1]
+    return False, None
+
+
+def _cache_policy(team: str, level: int, policy: dict | None) -> None:
+    _policy_cache[(team, level)] = (time.monotonic() + _POLICY_CACHE_TTL, policy)
+
+
+def _invalidate_policy_cache(team: str) -> None:
+    for key in [k for k in list(_policy_cache) if k[0] == team]:
+        _policy_cache.pop(key, None)
+
+
+def _policy_level(cur, team: str, level: int) -> dict | None:
+    """Return the policy row for *team*/*level*, querying on *cur* only on a cache miss."""
+    hit, policy = _cached_policy(team, level)
+    if not hit:
+        execute_prepared(cur, "oncall_policy_level", _Q_POLICY_LEVEL, (team, level))
+        policy = cur.fetchone()
+        _cache_policy(team, level, policy)
+    return policy
 
 
 # ---------------------------------------------------------------------------
@@ -588,18 +685,24 @@ def create_escalation_policy(body: EscalationPolicyCreateRequest):
                     (body.team,),
                 )
 
-                # Insert new levels
-                for lvl in body.levels:
-                    cur.execute(
-                        """
-                        INSERT INTO oncall.escalation_policies (team, level, wait_minutes, notify_target)
-                        VALUES (%s, %s, %s, %s)
-                        """,
-                        (body.team, lvl.level, lvl.wait_minutes, lvl.notify_target),
-                    )
+                # Insert all new levels in one statement
+                cur.execute(
+                    """
+                    INSERT INTO oncall.escalation_policies (team, level, wait_minutes, notify_target)
+                    SELECT %s, * FROM UNNEST(%s::int[], %s::int[], %s::varchar[])
+                    """,
+                    (
+                        body.team,
+                        [lvl.level for lvl in body.levels],
+                        [lvl.wait_minutes for lvl in body.levels],
+                        [lvl.notify_target for lvl in body.levels],
+                    ),
+                )
     except Exception as exc:
-        logger.error(f"Failed to create escalation policy: {exc}")
+        logger.error("Failed to create escalation policy: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to create escalation policy") from exc
+    finally:
+        _invalidate_policy_cache(body.team)
 
     return EscalationPolicyResponse(team=body.team, levels=body.levels)
 
@@ -615,7 +718,7 @@ def list_escalation_policies(
 ):
     """List escalation policies, optionally filtered by team."""
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 if team:
                     cur.execute(
@@ -626,7 +729,7 @@ def list_escalation_policies(
                     cur.execute("SELECT * FROM oncall.escalation_policies ORDER BY team, level")
                 rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to list escalation policies: {exc}")
+        logger.error("Failed to list escalation policies: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to list escalation policies") from exc
 
     # Group by team
@@ -658,7 +761,7 @@ def list_escalation_policies(
 def get_escalation_policy(team: str):
     """Get escalation policy for a specific team."""
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     "SELECT * FROM oncall.escalation_policies WHERE team = %s ORDER BY level",
@@ -666,14 +769,14 @@ def get_escalation_policy(team: str):
                 )
                 rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to get escalation policy: {exc}")
+        logger.error("Failed to get escalation policy: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to get escalation policy") from exc
 
     if not rows:
         raise HTTPException(status_code=404, detail=f"No escalation policy found for team '{team}'")
 
     levels = [
-        EscalationPolicyLevel(
+        EscalationPolicyLevel.model_construct(
             level=r["level"],
             wait_minutes=r["wait_minutes"],
             notify_target=r["notify_target"],
@@ -681,7 +784,7 @@ def get_escalation_policy(team: str):
         for r in rows
     ]
 
-    return EscalationPolicyResponse(team=team, levels=levels)
+    return EscalationPolicyResponse.model_construct(team=team, levels=levels)
 
 
 # ---------------------------------------------------------------------------
@@ -689,6 +792,39 @@ def get_escalation_policy(team: str):
 # ---------------------------------------------------------------------------
 
 
+# Incident states in which a pending escalation timer is simply retired
+_HANDLED_INCIDENT_STATUSES = frozenset({"acknowledged", "in_progress", "resolved", "closed", "mitigated"})
+
+# Upper bound on concurrent outbound calls made by one escalation check
+_ESCALATION_CONCURRENCY = 32
+
+
+# Earliest pending escalate_after as of the last scan, advanced whenever a
+# new timer is announced (start_timer, or the oncall_timer_added
+# notification).  The auto-escalation loop never sleeps
+# past it, and timer_added wakes the loop to recompute its wait.
+next_timer_due: datetime | None = None
+timer_added = asyncio.Event()
+
+
+def timer_scheduled(escalate_after: datetime) -> None:
+    """Record a new timer due at *escalate_after* and wake the auto-escalation loop.
+
+    Must be called on the event loop.
+    """
+    global next_timer_due
+    if next_timer_due is None or escalate_after < next_timer_due:
+        next_timer_due = escalate_after
+    timer_added.set()
+
+
+def seconds_until_next_timer() -> float | None:
+    """Seconds until the earliest known pending timer, or ``None`` if none is known."""
+    if next_timer_due is None:
+        return None
+    return max((next_timer_due - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
 @router.post("/check-escalations", response_model=AutoEscalationResult)
 async def check_escalations():
     """Check for expired escalation timers and trigger automatic escalation.
@@ -697,190 +833,417 @@ async def check_escalations():
     by a cron job or scheduler. It finds all active timers whose
     `escalate_after` timestamp has passed, and triggers escalation for each.
     """
+    global next_timer_due
     auto_escalation_runs_total.inc()
     now = datetime.now(timezone.utc)
-    details = []
 
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT id, incident_id, team, current_level, assigned_to
-                    FROM oncall.escalation_timers
-                    WHERE is_active = TRUE AND escalate_after <= %s
-                    ORDER BY escalate_after
-                    """,
-                    (now,),
-                )
-                expired_timers = cur.fetchall()
+        expired_timers, scanned_due = await asyncio.to_thread(_fetch_expired_timers, now)
     except Exception as exc:
-        logger.error(f"Failed to check escalation timers: {exc}")
+        logger.error("Failed to check escalation timers: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to check escalation timers") from exc
 
-    escalated_count = 0
+    # Anything due by *now* was covered by the scan, but a timer announced
+    # while it ran is kept
+    if next_timer_due is None or next_timer_due <= now:
+        next_timer_due = scanned_due
+    elif scanned_due is not None:
+        next_timer_due = min(next_timer_due, scanned_due)
+
+    if not expired_timers:
+        return AutoEscalationResult(checked=0, escalated=0, details=[])
+
+    # Incident status checks go over HTTP; do them before taking a pooled
+    # connection so no connection is held across network round trips.
+    # The checks are independent, so fire them concurrently on the shared client.
+    client = get_http_client()
+    sem = asyncio.Semaphore(_ESCALATION_CONCURRENCY)
+    responses = await asyncio.gather(
+        *(
+            _bounded(sem, client.get(f"{settings.INCIDENT_SERVICE_URL}/api/v1/incidents/{t['incident_id']}"))
+            for t in expired_timers
+        ),
+        return_exceptions=True,
+    )
+    statuses = {}
+    for timer, resp in zip(expired_timers, responses):
+        if isinstance(resp, Exception):
+            logger.warning("Could not check incident %s status: %s", timer["incident_id"], resp)
+        elif resp.status_code == 200:
+            statuses[timer["incident_id"]] = resp.json().get("status")
 
-    for timer in expired_timers:
-        timer_id = str(timer["id"])
-        incident_id = timer["incident_id"]
-        team = timer["team"]
-        current_level = timer["current_level"]
+    try:
+        details, notifications, failed = await asyncio.to_thread(
+            _escalate_expired_timers, expired_timers, statuses, now
+        )
+    except Exception as exc:
+        logger.error("Failed to process escalation timers: %s", exc)
+        raise HTTPException(status_code=500, detail="Failed to process escalation timers") from exc
 
-        # Check if incident is still unacknowledged
-        incident_status = None
-        try:
-            async with httpx.AsyncClient(timeout=settings.HTTP_CLIENT_TIMEOUT) as client:
-                resp = await client.get(
-                    f"{settings.INCIDENT_SERVICE_URL}/api/v1/incidents/{incident_id}",
-                )
-                if resp.status_code == 200:
-                    incident_data = resp.json()
-                    incident_status = incident_data.get("status")
-        except Exception as e:
-            logger.warning(f"Could not check incident {incident_id} status: {e}")
-
-        # If incident is already acknowledged or resolved, deactivate the timer
-        if incident_status in (
-            "acknowledged",
-            "in_progress",
-            "resolved",
-            "closed",
-            "mitigated",
-        ):
-            try:
-                with get_db_connection(autocommit=True) as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            "UPDATE oncall.escalation_timers SET is_active = FALSE WHERE id = %s",
-                            (timer_id,),
-                        )
-                active_escalation_timers.labels(team=team).dec()
-            except Exception:
-                pass
-            details.append(
-                {
-                    "incident_id": incident_id,
-                    "action": "skipped",
-                    "reason": f"Incident already {incident_status}",
-                }
-            )
-            continue
+    # Notify in the background; the escalations are already committed
+    if notifications:
+        _spawn(_send_notifications(notifications, sem))
 
-        # Look up the schedule for the team
-        try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT * FROM oncall.schedules WHERE team = %s ORDER BY created_at DESC LIMIT 1",
-                        (team,),
-                    )
-                    schedule = cur.fetchone()
-        except Exception:
-            schedule = None
-
-        if not schedule:
-            details.append(
-                {
-                    "incident_id": incident_id,
-                    "action": "skipped",
-                    "reason": "No schedule found",
-                }
+    return AutoEscalationResult(
+        checked=len(expired_timers),
+        escalated=len(notifications),
+        details=details,
+        failed=failed,
+    )
+
+
+def _fetch_expired_timers(now: datetime) -> tuple[list[dict], datetime | None]:
+    """Return up to ``ESCALATION_CHECK_BATCH_SIZE`` active timers due at *now*.
+
+    The second element is when the earliest active timer outside the batch
+    is due, or ``None`` if there is none.
+    """
+    with get_db_connection(readonly=True) as conn:
+        with conn.cursor() as cur:
+            execute_prepared(
+                cur, "oncall_expired_timers", _Q_EXPIRED_TIMERS, (now, settings.ESCALATION_CHECK_BATCH_SIZE)
             )
-            continue
+            rows = cur.fetchall()
+    next_due = rows[0].get("next_due") if rows else None
+    return [row for row in rows if row["id"] is not None], next_due
 
-        primary_eng, secondary_eng = _compute_current_oncall(schedule)
-        from_engineer = timer["assigned_to"]
 
-        # Determine next target based on policy
-        to_engineer = None
-        try:
-            with get_db_connection() as conn:
+def _escalate_expired_timers(
+    expired_timers: list[dict], statuses: dict, now: datetime
+) -> tuple[list[dict], list[dict], int]:
+    """Retire handled timers and escalate the rest on one pooled connection.
+
+    Returns the run's ``details``, the notifications to send once the
+    connection is back in the pool, and how many timers failed (they stay
+    active and are retried on the next run).
+    """
+    failed_count = 0
+    with get_db_connection() as conn:
+        # If an incident is already acknowledged or resolved, deactivate its timer
+        handled = [t for t in expired_timers if statuses.get(t["incident_id"]) in _HANDLED_INCIDENT_STATUSES]
+        if handled:
+            try:
+                with conn.cursor() as cur:
+                    execute_prepared(
+                        cur, "oncall_deactivate_timers", _Q_DEACTIVATE_TIMERS, ([str(t["id"]) for t in handled],)
+                    )
+                conn.commit()
+                for t in handled:
+                    active_escalation_timers.labels(team=t["team"]).dec()
+            except Exception:
+                conn.rollback()
+                logger.exception("Failed to deactivate %d handled escalation timers", len(handled))
+                failed_count += len(handled)
+
+        # Fetch the latest schedule per team and the policy rows for every
+        # pending timer's current and next level up front
+        pending = [t for t in expired_timers if statuses.get(t["incident_id"]) not in _HANDLED_INCIDENT_STATUSES]
+        schedules_by_team = {}
+        policy_by_team_level = {}
+        if pending:
+            try:
                 with conn.cursor() as cur:
                     cur.execute(
-                        "SELECT notify_target FROM oncall.escalation_policies WHERE team = %s AND level = %s",
-                        (team, current_level),
+                        """
+                        SELECT DISTINCT ON (team) * FROM oncall.schedules
+                        WHERE team = ANY(%s)
+                        ORDER BY team, created_at DESC
+                        """,
+                        (list({t["team"] for t in pending}),),
                     )
-                    policy_row = cur.fetchone()
-        except Exception:
-            policy_row = None
-
-        if policy_row:
-            target = policy_row["notify_target"]
-            if target == "secondary" and secondary_eng:
-                to_engineer = secondary_eng.email
-            elif target == "manager":
-                to_engineer = settings.MANAGER_EMAIL
-            else:
-                to_engineer = target  # Direct email
-        elif secondary_eng and current_level == 1:
+                    schedules_by_team = {row["team"]: row for row in cur.fetchall()}
+            except Exception:
+                conn.rollback()
+                logger.exception("Failed to load schedules for auto-escalation")
+            uncached = set()
+            keys = {(t["team"], t["current_level"] + step) for t in pending for step in (0, 1)}
+            for key in keys:
+                hit, policy = _cached_policy(*key)
+                if not hit:
+                    uncached.add(key)
+                elif policy:
+                    policy_by_team_level[key] = policy
+            if uncached:
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            """
+                            SELECT team, level, wait_minutes, notify_target
+                            FROM oncall.escalation_policies WHERE (team, level) IN %s
+                            """,
+                            (tuple(uncached),),
+                        )
+                        found = {(row["team"], row["level"]): row for row in cur.fetchall()}
+                    for key in uncached:
+                        _cache_policy(*key, found.get(key))
+                        if key in found:
+                            policy_by_team_level[key] = found[key]
+                except Exception:
+                    conn.rollback()
+                    logger.exception("Failed to load escalation policies for auto-escalation")
+
+        entries = [
+            _plan_escalation(timer, statuses.get(timer["incident_id"]), schedules_by_team, policy_by_team_level, now)
+            for timer in expired_timers
+        ]
+        failed = _record_auto_escalations(conn, [plan for _, plan in entries if plan], now)
+
+    # Escalations that could not be recorded are left out of both lists
+    entries = [(detail, plan) for detail, plan in entries if not plan or plan["timer_id"] not in failed]
+    return (
+        [detail for detail, _ in entries],
+        [plan["notification"] for _, plan in entries if plan],
+        failed_count + len(failed),
+    )
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Run *coro* as a background task, keeping it referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _send_notifications(notifications: list[dict], sem: asyncio.Semaphore):
+    """Send every escalation notification, at most ``sem`` at a time."""
+    await asyncio.gather(*(_bounded(sem, _notify_engineer(**n)) for n in notifications))
+
+
+async def _bounded(sem: asyncio.Semaphore, coro):
+    """Await *coro* while holding a slot of *sem*."""
+    async with sem:
+        return await coro
+
+
+def _plan_escalation(
+    timer: dict,
+    incident_status: str | None,
+    schedules_by_team: dict,
+    policy_by_team_level: dict,
+    now: datetime,
+) -> tuple[dict, dict | None]:
+    """Work out how a single expired timer escalates, without touching the database.
+
+    Returns ``(detail, plan)``: the entry for the run's ``details`` list and,
+    when the timer escalates, the rows to write plus the keyword arguments for
+    :func:`_notify_engineer`.
+    """
+    incident_id = timer["incident_id"]
+    team = timer["team"]
+    current_level = timer["current_level"]
+
+    if incident_status in _HANDLED_INCIDENT_STATUSES:
+        return {
+            "incident_id": incident_id,
+            "action": "skipped",
+            "reason": f"Incident already {incident_status}",
+        }, None
+
+    schedule = schedules_by_team.get(team)
+    if not schedule:
+        return {
+            "incident_id": incident_id,
+            "action": "skipped",
+            "reason": "No schedule found",
+        }, None
+
+    primary_eng, secondary_eng = compute_current_oncall(schedule, now)
+    from_engineer = timer["assigned_to"]
+
+    # Determine next target based on policy
+    to_engineer = None
+    policy = policy_by_team_level.get((team, current_level))
+    target = policy["notify_target"] if policy else None
+    if target:
+        if target == "secondary" and secondary_eng:
             to_engineer = secondary_eng.email
-        else:
+        elif target == "manager":
             to_engineer = settings.MANAGER_EMAIL
+        else:
+            to_engineer = target  # Direct email
+    elif secondary_eng and current_level == 1:
+        to_engineer = secondary_eng.email
+    else:
+        to_engineer = settings.MANAGER_EMAIL
+
+    # Start the next-level timer only while within the loop count
+    next_timer = None
+    if current_level < settings.ESCALATION_LOOP_COUNT + 1:
+        next_policy = policy_by_team_level.get((team, current_level + 1))
+        wait_minutes = next_policy["wait_minutes"] if next_policy else settings.DEFAULT_ESCALATION_MINUTES
+        next_timer = (
+            new_id(),
+            incident_id,
+            team,
+            current_level + 1,
+            to_engineer,
+            now + timedelta(minutes=wait_minutes),
+        )
+
+    detail = {
+        "incident_id": incident_id,
+        "action": "escalated",
+        "level": current_level,
+        "from": from_engineer,
+        "to": to_engineer,
+    }
+    return detail, {
+        "timer_id": str(timer["id"]),
+        "escalation": (
+            new_id(),
+            incident_id,
+            from_engineer,
+            to_engineer,
+            current_level,
+            f"Auto-escalation: no acknowledgment within escalation window (level {current_level})",
+            team,
+        ),
+        "next_timer": next_timer,
+        "notification": {
+            "incident_id": incident_id,
+            "engineer": to_engineer,
+            "message": f"[AUTO-ESCALATED L{current_level}] Incident {incident_id} escalated to you. "
+            f"Previous assignee ({from_engineer}) did not acknowledge.",
+            "team": team,
+        },
+    }
+
 
-        # Record escalation
-        escalation_id = str(uuid.uuid4())
-        reason = f"Auto-escalation: no acknowledgment within escalation window (level {current_level})"
+def _record_auto_escalations(conn, planned: list[dict], now: datetime) -> set[str]:
+    """Write every planned escalation on *conn* in one statement and one transaction.
 
+    If the batch fails, each escalation is retried in its own transaction so
+    a single bad row cannot hold back the rest.  Returns the timer ids of the
+    escalations that could not be recorded.
+    """
+    if not planned:
+        return set()
+    try:
+        _write_auto_escalations(conn, planned, now)
+        return set()
+    except Exception as e:
+        conn.rollback()
+        if len(planned) == 1:
+            logger.exception("auto-escalation failed for timer %s", planned[0]["timer_id"])
+            return {planned[0]["timer_id"]}
+        logger.warning("Batched auto-escalation write failed, retrying one by one: %s", e)
+
+    failed = set()
+    for plan in planned:
         try:
-            with get_db_connection(autocommit=True) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO oncall.escalations (id, incident_id, from_engineer, to_engineer, level, reason, escalated_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            escalation_id,
-                            incident_id,
-                            from_engineer,
-                            to_engineer,
-                            current_level,
-                            reason,
-                            now,
-                        ),
-                    )
-                    # Deactivate this timer
-                    cur.execute(
-                        "UPDATE oncall.escalation_timers SET is_active = FALSE WHERE id = %s",
-                        (timer_id,),
-                    )
-        except Exception as e:
-            logger.error(f"Failed to record auto-escalation for {incident_id}: {e}")
-            continue
+            _write_auto_escalations(conn, [plan], now)
+        except Exception:
+            conn.rollback()
+            logger.exception("auto-escalation failed for timer %s", plan["timer_id"])
+            failed.add(plan["timer_id"])
+    return failed
+
+
+def _write_auto_escalations(conn, planned: list[dict], now: datetime) -> None:
+    """Insert the escalations, retire their timers and start next-level timers, then commit."""
+    escalations = list(zip(*(p["escalation"] for p in planned)))
+    next_timers = [p["next_timer"] for p in planned if p["next_timer"]]
+    next_columns = list(zip(*next_timers)) if next_timers else [()] * 6
+    with conn.cursor() as cur:
+        execute_prepared(
+            cur,
+            "oncall_record_auto_escalations",
+            _Q_RECORD_AUTO_ESCALATIONS,
+            (
+                *(list(col) for col in escalations),
+                now,
+                [p["timer_id"] for p in planned],
+                *(list(col) for col in next_columns),
+            ),
+        )
+    conn.commit()
 
+    for plan in planned:
+        team = plan["escalation"][6]
         escalations_total.labels(team=team).inc()
         active_escalation_timers.labels(team=team).dec()
+        if plan["next_timer"]:
+            active_escalation_timers.labels(team=team).inc()
 
-        # Start next-level timer if within loop count
-        max_level = settings.ESCALATION_LOOP_COUNT + 1
-        if current_level < max_level:
-            _start_escalation_timer(incident_id, team, current_level + 1, to_engineer)
 
-        # Send notification
-        await _notify_engineer(
-            incident_id=incident_id,
-            engineer=to_engineer,
-            message=f"[AUTO-ESCALATED L{current_level}] Incident {incident_id} escalated to you. "
-            f"Previous assignee ({from_engineer}) did not acknowledge.",
-            team=team,
-        )
+# ---------------------------------------------------------------------------
+# Helpers -- incrementally maintained escalation metrics
+# ---------------------------------------------------------------------------
 
-        escalated_count += 1
-        details.append(
-            {
-                "incident_id": incident_id,
-                "action": "escalated",
-                "level": current_level,
-                "from": from_engineer,
-                "to": to_engineer,
-            }
-        )
+# Cleared when folding the escalation delta log fails so that the metrics
+# endpoint serves live aggregates until the next successful run.
+_metrics_summary_fresh = True
 
-    return AutoEscalationResult(
-        checked=len(expired_timers),
-        escalated=escalated_count,
-        details=details,
-    )
+
+def apply_metrics_log():
+    """Fold pending escalation deltas into ``oncall.escalation_metrics``.
+
+    The log rows are consumed with ``DELETE ... RETURNING`` in the same
+    transaction as the upsert, so every delta is applied exactly once and
+    the work is proportional to the number of new escalations.
+    """
+    global _metrics_summary_fresh
+    try:
+        with get_db_connection(autocommit=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    WITH consumed AS (
+                        DELETE FROM oncall.escalation_metrics_mlog
+                        RETURNING COALESCE(team, '') AS team, delta
+                    )
+                    INSERT INTO oncall.escalation_metrics (team, cnt)
+                    SELECT team, SUM(delta) FROM consumed GROUP BY team
+                    ON CONFLICT (team) DO UPDATE
+                        SET cnt = oncall.escalation_metrics.cnt + EXCLUDED.cnt,
+                            updated_at = now()
+                """)
+        _metrics_summary_fresh = True
+    except Exception as e:
+        _metrics_summary_fresh = False
+        logger.warning("Failed to apply escalation metrics log: %s", e, exc_info=True)
+
+
+def refresh_oncall_gauge():
+    """Republish ``oncall_current`` from every team's latest schedule.
+
+    Runs on the metrics refresh loop rather than per request, and replaces
+    the whole label set so engineers who rotated off drop out of the gauge.
+    """
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with conn.cursor() as cur:
+                execute_prepared(cur, "oncall_all_teams", _Q_ONCALL_ALL_TEAMS)
+                rows = cur.fetchall()
+    except Exception as e:
+        logger.warning("Failed to refresh on-call gauge: %s", e, exc_info=True)
+        return
+
+    oncall_current.clear()
+    for row in rows:
+        for role in ("primary", "secondary"):
+            engineer = row[f"{role}_engineer"]
+            if engineer:
+                oncall_current.labels(team=row["team"], engineer=engineer["email"], role=role).set(1)
+
+
+def _read_metrics_summary(cur) -> dict | None:
+    """Return the pre-aggregated escalation metrics, or ``None`` if unavailable.
+
+    ``staleness_seconds`` is the age of the oldest delta not yet folded in.
+    """
+    if not _metrics_summary_fresh:
+        return None
+    try:
+        execute_prepared(cur, "oncall_metrics_summary", _Q_METRICS_SUMMARY)
+        return cur.fetchone()
+    except Exception as e:
+        logger.warning("Failed to read escalation metrics summary: %s", e, exc_info=True)
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -888,9 +1251,53 @@ async def check_escalations():
 # ---------------------------------------------------------------------------
 
 
+# Dashboards poll this endpoint; identical requests within METRICS_CACHE_TTL
+# are served from memory.  The lock also collapses concurrent misses into one
+# computation.
+_metrics_cache: tuple[float, OnCallMetrics] | None = None
+_metrics_cache_lock = asyncio.Lock()
+
+
 @router.get("/metrics/oncall", response_model=OnCallMetrics)
-def get_oncall_metrics():
+async def get_oncall_metrics():
     """Return key on-call metrics: MTTA, MTTR, escalation rate, on-call load."""
+    global _metrics_cache
+    if settings.METRICS_CACHE_TTL <= 0:
+        return await _collect_oncall_metrics()
+    async with _metrics_cache_lock:
+        if _metrics_cache and _metrics_cache[0] > time.monotonic():
+            return _metrics_cache[1]
+        result = await _collect_oncall_metrics()
+        _metrics_cache = (time.monotonic() + settings.METRICS_CACHE_TTL, result)
+        return result
+
+
+async def refresh_oncall_metrics() -> None:
+    """Recompute the on-call metrics on the refresh loop.
+
+    Keeps the ``oncall_escalations_by_team`` / ``oncall_engineer_load``
+    snapshot current for ``/metrics`` scrapes without relying on API traffic,
+    and primes the ``/metrics/oncall`` cache with the result.
+    """
+    global _metrics_cache
+    async with _metrics_cache_lock:
+        result = await _collect_oncall_metrics()
+        if settings.METRICS_CACHE_TTL > 0:
+            _metrics_cache = (time.monotonic() + settings.METRICS_CACHE_TTL, result)
+
+
+async def _collect_oncall_metrics() -> OnCallMetrics:
+    """Compute the on-call metrics from the database and the incident analytics API.
+
+    The escalation and incident lookups are independent, so the blocking DB
+    read runs in a worker thread while the analytics call goes out on the
+    shared HTTP client.
+    """
+    esc_metrics, incident_metrics = await asyncio.gather(
+        asyncio.to_thread(_escalation_metrics),
+        _incident_metrics(),
+    )
+
     metrics: dict = {
         "total_incidents": 0,
         "total_escalations": 0,
@@ -899,55 +1306,70 @@ def get_oncall_metrics():
         "avg_mttr_seconds": None,
         "oncall_load": {},
         "by_team": {},
+        **esc_metrics,
+        **incident_metrics,
     }
 
-    # Escalation counts by team
+    rate = _escalation_rate_pct(metrics["total_escalations"], metrics["total_incidents"])
+    if rate is not None:
+        metrics["escalation_rate_pct"] = rate
+        escalation_rate.set(rate)
+    oncall_snapshot.update(metrics["by_team"], metrics["oncall_load"])
+
+    # Every field was built above from typed SQL results and the analytics
+    # API's validated response, so skip re-validation.
+    return OnCallMetrics.model_construct(**metrics)
+
+
+def _escalation_rate_pct(total_escalations: int, total_incidents: int) -> float | None:
+    """Escalations per 100 incidents, rounded to 2 decimals; ``None`` without incidents."""
+    return round(100.0 * total_escalations / total_incidents, 2) if total_incidents else None
+
+
+def _escalation_metrics() -> dict:
+    """Escalation totals by team -- pre-aggregated summary, live query as fallback.
+
+    Both reads share one autocommit connection, so a failed summary read does
+    not abort the fallback.
+    """
+    metrics: dict = {}
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
-                # Total escalations
-                cur.execute("SELECT COUNT(*) AS cnt FROM oncall.escalations")
-                metrics["total_escalations"] = cur.fetchone()["cnt"]
-
-                # Escalations by team (via escalation timers which store team)
-                cur.execute("""
-                    SELECT t.team, COUNT(e.id) AS cnt
-                    FROM oncall.escalations e
-                    LEFT JOIN oncall.escalation_timers t
-                        ON t.incident_id = e.incident_id
-                    GROUP BY t.team
-                """)
-                for r in cur.fetchall():
-                    if r["team"]:
-                        metrics["by_team"][r["team"]] = r["cnt"]
+                summary = _read_metrics_summary(cur)
+            if summary:
+                metrics["total_escalations"] = int(summary["total_escalations"])
+                metrics["by_team"] = dict(summary["by_team"] or {})
+                metrics["staleness_seconds"] = round(float(summary["staleness_seconds"]), 2)
+            else:
+                with conn.cursor() as cur:
+                    # Total and by-team counts in one round trip
+                    execute_prepared(cur, "oncall_esc_counts", _Q_ESC_COUNTS)
+                    counts = cur.fetchone()
+                metrics["total_escalations"] = int(counts["cnt"])
+                metrics["by_team"] = counts["by_team"]
     except Exception as e:
-        logger.warning(f"Failed to query escalation metrics: {e}")
+        logger.warning("Failed to query escalation metrics: %s", e, exc_info=True)
+    return metrics
 
-    # Incident metrics via incident-management service API (proper service boundary)
-    try:
-        import httpx
 
-        resp = httpx.get(
-            f"{settings.INCIDENT_SERVICE_URL}/api/v1/incidents/analytics",
-            timeout=settings.HTTP_CLIENT_TIMEOUT,
-        )
+async def _incident_metrics() -> dict:
+    """Incident totals, MTTA/MTTR and load via the incident-management API (proper service boundary)."""
+    try:
+        client = get_http_client()
+        resp = await client.get(f"{settings.INCIDENT_SERVICE_URL}/api/v1/incidents/analytics")
         if resp.status_code == 200:
             data = resp.json()
-            metrics["total_incidents"] = data.get("total_incidents", 0)
-            metrics["avg_mtta_seconds"] = data.get("avg_mtta_seconds")
-            metrics["avg_mttr_seconds"] = data.get("avg_mttr_seconds")
-
-            # Escalation rate
-            if metrics["total_incidents"] > 0:
-                rate = (metrics["total_escalations"] / metrics["total_incidents"]) * 100
-                metrics["escalation_rate_pct"] = round(rate, 2)
-                escalation_rate.set(rate)
-        else:
-            logger.warning(f"Incident analytics API returned {resp.status_code}")
+            return {
+                "total_incidents": data.get("total_incidents") or 0,
+                "avg_mtta_seconds": data.get("avg_mtta_seconds"),
+                "avg_mttr_seconds": data.get("avg_mttr_seconds"),
+                "oncall_load": data.get("oncall_load") or {},
+            }
+        logger.warning("Incident analytics API returned %s", resp.status_code)
     except Exception as e:
-        logger.warning(f"Failed to query incident analytics API: {e}")
-
-    return OnCallMetrics(**metrics)
+        logger.warning("Failed to query incident analytics API: %s", e, exc_info=True)
+    return {}
 
 
 # ---------------------------------------------------------------------------
@@ -960,57 +1382,28 @@ def get_oncall_metrics():
     response_model=TimerStartResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def start_timer(body: TimerStartRequest):
+async def start_timer(body: TimerStartRequest):
     """Start an escalation timer for a newly assigned incident.
 
     Called by the incident-management service when an incident is created
     and assigned to an on-call engineer.  The timer fires at level 1.
     """
-    # Look up escalation policy to get wait time for level 1
-    wait_minutes = settings.DEFAULT_ESCALATION_MINUTES
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT wait_minutes FROM oncall.escalation_policies WHERE team = %s AND level = 1",
-                    (body.team,),
-                )
-                policy = cur.fetchone()
-                if policy:
-                    wait_minutes = policy["wait_minutes"]
-    except Exception:
-        pass  # Use default
-
-    now = datetime.now(timezone.utc)
-    escalate_after = now + timedelta(minutes=wait_minutes)
-    timer_id = str(uuid.uuid4())
-
-    try:
-        with get_db_connection(autocommit=True) as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO oncall.escalation_timers
-                        (id, incident_id, team, current_level, assigned_to, escalate_after, is_active)
-                    VALUES (%s, %s, %s, 1, %s, %s, TRUE)
-                    """,
-                    (
-                        timer_id,
-                        body.incident_id,
-                        body.team,
-                        body.assigned_to,
-                        escalate_after,
-                    ),
-                )
-        active_escalation_timers.labels(team=body.team).inc()
-        logger.info(
-            f"Timer started: incident={body.incident_id} team={body.team} "
-            f"assigned={body.assigned_to} escalate_after={escalate_after}"
-        )
+        timer_id, escalate_after = await asyncio.to_thread(_insert_level1_timer, body)
     except Exception as exc:
-        logger.error(f"Failed to start timer: {exc}")
+        logger.error("Failed to start timer: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to start escalation timer") from exc
 
+    active_escalation_timers.labels(team=body.team).inc()
+    timer_scheduled(escalate_after)
+    logger.info(
+        "Timer started: incident=%s team=%s assigned=%s escalate_after=%s",
+        body.incident_id,
+        body.team,
+        body.assigned_to,
+        escalate_after,
+    )
+
     return TimerStartResponse(
         timer_id=timer_id,
         incident_id=body.incident_id,
@@ -1021,6 +1414,33 @@ def start_timer(body: TimerStartRequest):
     )
 
 
+def _insert_level1_timer(body: TimerStartRequest) -> tuple[str, datetime]:
+    """Insert the level-1 timer for *body*; returns ``(timer_id, escalate_after)``."""
+    # Level-1 wait time from the escalation policy; a cache hit needs no
+    # pooled connection at all
+    hit, policy = _cached_policy(body.team, 1)
+    if not hit:
+        try:
+            with get_db_connection(readonly=True) as conn:
+                with conn.cursor() as cur:
+                    policy = _policy_level(cur, body.team, 1)
+        except Exception:
+            pass  # Use default
+    wait_minutes = policy["wait_minutes"] if policy else settings.DEFAULT_ESCALATION_MINUTES
+
+    escalate_after = datetime.now(timezone.utc) + timedelta(minutes=wait_minutes)
+    timer_id = new_id()
+    with get_db_connection(autocommit=True) as conn:
+        with conn.cursor() as cur:
+            execute_prepared(
+                cur,
+                "oncall_insert_timer",
+                _Q_INSERT_TIMER,
+                (timer_id, body.incident_id, body.team, 1, body.assigned_to, escalate_after),
+            )
+    return timer_id, escalate_after
+
+
 # ---------------------------------------------------------------------------
 # POST /timers/cancel -- cancel timer (called on acknowledge)
 # ---------------------------------------------------------------------------
@@ -1036,25 +1456,17 @@ def cancel_timer(body: TimerCancelRequest):
     try:
         with get_db_connection(autocommit=True) as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    UPDATE oncall.escalation_timers
-                    SET is_active = FALSE
-                    WHERE incident_id = %s AND is_active = TRUE
-                    RETURNING team
-                    """,
-                    (body.incident_id,),
-                )
+                execute_prepared(cur, "oncall_cancel_timers", _Q_CANCEL_TIMERS, (body.incident_id,))
                 cancelled_rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to cancel timers: {exc}")
+        logger.error("Failed to cancel timers: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to cancel escalation timers") from exc
 
     count = len(cancelled_rows)
     for r in cancelled_rows:
         active_escalation_timers.labels(team=r["team"]).dec()
 
-    logger.info(f"Cancelled {count} timer(s) for incident {body.incident_id}")
+    logger.info("Cancelled %s timer(s) for incident %s", count, body.incident_id)
 
     return TimerCancelResponse(incident_id=body.incident_id, cancelled_count=count)
 
@@ -1071,7 +1483,7 @@ def list_timers(
 ):
     """List active escalation timers, optionally filtered by team or incident."""
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 conditions = ["is_active = TRUE"]
                 params: list = []
@@ -1084,28 +1496,18 @@ def list_timers(
 
                 where = " AND ".join(conditions)
                 cur.execute(
-                    f"SELECT * FROM oncall.escalation_timers WHERE {where} ORDER BY escalate_after",
+                    f"SELECT {_TIMER_COLUMNS} FROM oncall.escalation_timers WHERE {where} ORDER BY escalate_after",
                     params,
                 )
                 rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to list timers: {exc}")
+        logger.error("Failed to list timers: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to list escalation timers") from exc
 
-    timers = [
-        EscalationTimerResponse(
-            id=str(r["id"]),
-            incident_id=r["incident_id"],
-            team=r["team"],
-            current_level=r["current_level"],
-            assigned_to=r["assigned_to"],
-            escalate_after=r["escalate_after"],
-            is_active=r["is_active"],
-        )
-        for r in rows
-    ]
+    # Rows come from the database already in shape; skip re-validation
+    timers = [EscalationTimerResponse.model_construct(**r) for r in rows]
 
-    return TimerListResponse(timers=timers, total=len(timers))
+    return TimerListResponse.model_construct(timers=timers, total=len(timers))
 
 
 # ---------------------------------------------------------------------------
@@ -1120,24 +1522,19 @@ def list_timers(
 )
 def add_schedule_member(schedule_id: str, body: ScheduleMemberCreate):
     """Add a member to a schedule rotation."""
-    member_id = str(uuid.uuid4())
+    member_id = new_id()
 
+    # The schedule_id foreign key doubles as the existence check, so the
+    # insert is a single statement on one connection.
     try:
-        with get_db_connection(autocommit=True) as conn:
-            with conn.cursor() as cur:
-                # Verify schedule exists
-                cur.execute("SELECT id FROM oncall.schedules WHERE id = %s", (schedule_id,))
-                if not cur.fetchone():
-                    raise HTTPException(status_code=404, detail=f"Schedule {schedule_id} not found")
-
         with get_db_connection(autocommit=True) as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
+                    f"""
                     INSERT INTO oncall.schedule_members
                         (id, schedule_id, user_name, user_email, position)
                     VALUES (%s, %s, %s, %s, %s)
-                    RETURNING id, schedule_id, user_name, user_email, position, is_active, created_at
+                    RETURNING {_MEMBER_COLUMNS}
                     """,
                     (
                         member_id,
@@ -1148,21 +1545,13 @@ def add_schedule_member(schedule_id: str, body: ScheduleMemberCreate):
                     ),
                 )
                 row = cur.fetchone()
-    except HTTPException:
-        raise
+    except ForeignKeyViolation as exc:
+        raise HTTPException(status_code=404, detail=f"Schedule {schedule_id} not found") from exc
     except Exception as exc:
-        logger.error(f"Failed to add schedule member: {exc}")
+        logger.error("Failed to add schedule member: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to add schedule member") from exc
 
-    return ScheduleMemberResponse(
-        id=str(row["id"]),
-        schedule_id=str(row["schedule_id"]),
-        user_name=row["user_name"],
-        user_email=row["user_email"],
-        position=row["position"],
-        is_active=row["is_active"],
-        created_at=row["created_at"],
-    )
+    return ScheduleMemberResponse.model_construct(**row)
 
 
 # ---------------------------------------------------------------------------
@@ -1174,11 +1563,11 @@ def add_schedule_member(schedule_id: str, body: ScheduleMemberCreate):
 def list_schedule_members(schedule_id: str):
     """List all members in a schedule rotation, ordered by position."""
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT id, schedule_id, user_name, user_email, position, is_active, created_at
+                    f"""
+                    SELECT {_MEMBER_COLUMNS}
                     FROM oncall.schedule_members
                     WHERE schedule_id = %s
                     ORDER BY position
@@ -1187,20 +1576,9 @@ def list_schedule_members(schedule_id: str):
                 )
                 rows = cur.fetchall()
     except Exception as exc:
-        logger.error(f"Failed to list schedule members: {exc}")
+        logger.error("Failed to list schedule members: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to list schedule members") from exc
 
-    members = [
-        ScheduleMemberResponse(
-            id=str(r["id"]),
-            schedule_id=str(r["schedule_id"]),
-            user_name=r["user_name"],
-            user_email=r["user_email"],
-            position=r["position"],
-            is_active=r["is_active"],
-            created_at=r["created_at"],
-        )
-        for r in rows
-    ]
+    members = [ScheduleMemberResponse.model_construct(**r) for r in rows]
 
-    return ScheduleMemberListResponse(members=members, total=len(members))
+    return ScheduleMemberListResponse.model_construct(members=members, total=len(members))
@@ -1,52 +1,201 @@
+import asyncio
+import hashlib
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Optional
 
 import psutil
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Header, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import check_database_health
+from app.etag import etag_matches
 from app.models import HealthCheck
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
-# Track service start time
-service_start_time = time.time()
+# Track service start time (monotonic, so clock steps do not skew uptime)
+service_start_time = time.monotonic()
+
+
+# Health checks run on their own small pool, so a probe storm or a hung
+# database cannot starve request handlers of the default executor, nor the
+# other way around.
+_health_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health")
+
+
+# Circuit breaker: after n consecutive failed pings the database is reported
+# down without being pinged for 2**(n-1) seconds (capped at
+# HEALTH_DB_BACKOFF_MAX), so monitors polling harder during an outage do not
+# add load to a struggling database.
+_db_failures = 0
+_db_retry_at = 0.0
+
+
+async def _ping_database() -> bool:
+    """Run the database check on the health pool; one slower than HEALTH_DB_TIMEOUT fails.
+
+    The check gives up waiting for a pool slot after HEALTH_DB_TIMEOUT too, so
+    a timed-out ping does not keep a health thread queued on an exhausted pool.
+    """
+    global _db_failures, _db_retry_at
+    if time.monotonic() < _db_retry_at:
+        return False
+
+    loop = asyncio.get_running_loop()
+    try:
+        ok = await asyncio.wait_for(
+            loop.run_in_executor(_health_executor, check_database_health, settings.HEALTH_DB_TIMEOUT),
+            timeout=settings.HEALTH_DB_TIMEOUT,
+        )
+    except TimeoutError:
+        logger.warning("Health database check timed out")
+        ok = False
+
+    if ok:
+        _db_failures = 0
+    else:
+        _db_failures += 1
+        _db_retry_at = time.monotonic() + min(2 ** (_db_failures - 1), settings.HEALTH_DB_BACKOFF_MAX)
+    return ok
+
+
+# Latest memory and disk usage percentages (``None`` if the read failed) for
+# /health/deep, refreshed every HEALTH_PSUTIL_INTERVAL seconds by a background
+# loop so that probes never call psutil themselves.  Empty until the first sample.
+_system_usage: dict[str, float | None] = {}
+
+
+def sample_system_usage() -> None:
+    """Read memory and disk usage into the shared sample."""
+    for key, read in (
+        ("memory", lambda: psutil.virtual_memory().percent),
+        ("disk", lambda: psutil.disk_usage("/").percent),
+    ):
+        try:
+            _system_usage[key] = read()
+        except Exception as e:
+            logger.warning("Failed to sample %s usage: %s", key, e)
+            _system_usage[key] = None
+
+
+# Probes and scrapers hit /health several times a second; each result is
+# reused for HEALTH_CACHE_TTL seconds (per endpoint), and the lock lets only
+# one request per window run the checks.
+_health_cache: dict[bool, tuple[float, HealthCheck, int]] = {}
+_health_cache_lock = asyncio.Lock()
+
 
+_NOT_MODIFIED = {304: {"description": "Healthy, with the same checks as the ETag that was sent"}}
 
-@router.get("/health", response_model=HealthCheck)
-def health_check(response: Response):
+
+@router.get("/health", response_model=HealthCheck, response_class=ORJSONResponse, responses=_NOT_MODIFIED)
+async def health_check(response: Response, if_none_match: Optional[str] = Header(None)):
     """
-    Health check endpoint with dependency checks
+    Health check endpoint (database only)
     Returns 200 if healthy, 503 if degraded
     """
+    return await _cached_health(response, False, if_none_match)
+
+
+@router.get("/health/deep", response_model=HealthCheck, response_class=ORJSONResponse, responses=_NOT_MODIFIED)
+async def deep_health_check(response: Response, if_none_match: Optional[str] = Header(None)):
+    """
+    Health check endpoint with database, memory and disk checks
+    Returns 200 if healthy, 503 if degraded
+    """
+    return await _cached_health(response, True, if_none_match)
+
+
+async def _cached_health(response: Response, deep: bool, if_none_match: str | None):
+    """Serve the health payload for *deep*, with cache headers.
+
+    A healthy result carries a weak ``ETag`` over its status and checks (the
+    timestamp and uptime are left out), and a matching ``If-None-Match`` gets
+    ``304 Not Modified``.  Only healthy results may be cached downstream;
+    degraded results always return their full 503 with ``no-store``.
+    """
+    payload, code = await _health_result(deep)
+    headers = {}
+    if code != status.HTTP_200_OK:
+        headers["Cache-Control"] = "no-store"
+    else:
+        if settings.HEALTH_CACHE_TTL > 0:
+            headers["Cache-Control"] = f"public, max-age={settings.HEALTH_CACHE_TTL:g}"
+        checks = ",".join(f"{name}={state}" for name, state in sorted(payload.checks.items()))
+        digest = hashlib.blake2b(f"{payload.status}:{checks}".encode(), digest_size=8).hexdigest()
+        headers["ETag"] = f'W/"{digest}"'
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    response.status_code = code
+    return payload
+
+
+async def _health_result(deep: bool) -> tuple[HealthCheck, int]:
+    """Return the health payload and status code for *deep*, refreshing the cache when expired."""
+    ttl = settings.HEALTH_CACHE_TTL
+    cached = _health_cache.get(deep)
+    if ttl > 0 and cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+
+    async with _health_cache_lock:
+        cached = _health_cache.get(deep)
+        if ttl > 0 and cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        payload = await _run_health_checks(deep)
+        code = status.HTTP_200_OK if payload.status == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
+        _health_cache[deep] = (time.monotonic() + ttl, payload, code)
+    return payload, code
+
+
+async def _run_health_checks(deep: bool) -> HealthCheck:
+    """Check the database, plus the sampled memory and disk usage if *deep*, and build the health payload.
+
+    The database check blocks, so it runs on the health pool, alongside a
+    first usage sample if the background sampler has not taken one yet.
+    A check that raises or has no reading counts as failed.
+    """
     health_status = "healthy"
-    checks = {"database": "unknown", "memory": "healthy", "disk": "healthy"}
+    checks = {"database": "unknown"}
+
+    pending = [_ping_database()]
+    if deep and not _system_usage:
+        pending.append(asyncio.get_running_loop().run_in_executor(_health_executor, sample_system_usage))
+    db_ok, *_ = await asyncio.gather(*pending, return_exceptions=True)
 
     # Check database
-    if check_database_health():
+    if db_ok is True:
         checks["database"] = "healthy"
     else:
         checks["database"] = "unhealthy"
         health_status = "degraded"
 
-    # Check memory usage
-    memory_percent = psutil.virtual_memory().percent
-    if memory_percent > settings.HEALTH_MEMORY_THRESHOLD:
-        checks["memory"] = "warning"
-        health_status = "degraded"
+    if deep:
+        checks["memory"] = checks["disk"] = "healthy"
+        memory_percent = _system_usage.get("memory")
+        disk_percent = _system_usage.get("disk")
 
-    # Check disk usage
-    disk_percent = psutil.disk_usage("/").percent
-    if disk_percent > settings.HEALTH_DISK_THRESHOLD:
-        checks["disk"] = "warning"
-        health_status = "degraded"
+        # Check memory usage
+        if memory_percent is None or memory_percent > settings.HEALTH_MEMORY_THRESHOLD:
+            checks["memory"] = "warning"
+            health_status = "degraded"
 
-    uptime = time.time() - service_start_time
+        # Check disk usage
+        if disk_percent is None or disk_percent > settings.HEALTH_DISK_THRESHOLD:
+            checks["disk"] = "warning"
+            health_status = "degraded"
 
-    response.status_code = status.HTTP_200_OK if health_status == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
+    uptime = time.monotonic() - service_start_time
 
-    return HealthCheck(
+    # Every field is built here with the right type, so skip validation
+    return HealthCheck.model_construct(
         status=health_status,
         timestamp=datetime.now(timezone.utc),
         service=settings.SERVICE_NAME,
@@ -56,17 +205,31 @@ def health_check(response: Response):
     )
 
 
-@router.get("/health/ready")
-def readiness_check(response: Response):
+# Readiness probes reuse the last database ping for HEALTH_READY_CACHE_TTL
+# seconds; a ping slower than HEALTH_DB_TIMEOUT counts as not ready.
+_ready_cache: tuple[float, bool] | None = None
+_ready_cache_lock = asyncio.Lock()
+
+
+@router.get("/health/ready", response_class=ORJSONResponse)
+async def readiness_check(response: Response):
     """Readiness probe - can service accept traffic?"""
-    if check_database_health():
+    global _ready_cache
+    async with _ready_cache_lock:
+        if _ready_cache and _ready_cache[0] > time.monotonic():
+            ready = _ready_cache[1]
+        else:
+            ready = await _ping_database()
+            _ready_cache = (time.monotonic() + settings.HEALTH_READY_CACHE_TTL, ready)
+
+    if ready:
         return {"status": "ready"}
     else:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         return {"status": "not ready"}
 
 
-@router.get("/health/live")
+@router.get("/health/live", response_class=ORJSONResponse)
 async def liveness_check():
     """Liveness probe - is service running?"""
     return {"status": "alive"}
@@ -0,0 +1,91 @@
+"""LISTEN for newly inserted escalation timers.
+
+A statement-level trigger on ``oncall.escalation_timers`` sends the earliest
+new ``escalate_after`` (as Unix seconds) on the ``oncall_timer_added``
+channel.  One dedicated autocommit connection LISTENs on it, and its socket
+is watched with ``loop.add_reader``, so notifications are delivered on the
+event loop without any polling.  The connection is opened in a worker thread
+and reopened every ``TIMER_LISTENER_RETRY_SECONDS`` while it is unavailable;
+in the meantime the escalation loop falls back to its capped interval.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Callable
+
+import psycopg2
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+TIMER_CHANNEL = "oncall_timer_added"
+
+# Seconds libpq may spend establishing the LISTEN connection
+_CONNECT_TIMEOUT = 5
+
+# Retry waits go through this alias so tests need not patch the asyncio module
+_sleep = asyncio.sleep
+
+
+async def run_timer_listener(on_timer: Callable[[datetime], None]) -> None:
+    """Pass each announced due time to *on_timer* until cancelled.
+
+    Run as a background task.  After every (re)connect *on_timer* is also
+    called with the current time, because timers inserted while nothing was
+    listening were never announced and the escalation loop should rescan.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        conn = await asyncio.to_thread(_connect)
+        if conn is None:
+            await _sleep(settings.TIMER_LISTENER_RETRY_SECONDS)
+            continue
+
+        lost = asyncio.Event()
+        fd = conn.fileno()
+        loop.add_reader(fd, _drain_notifies, conn, on_timer, lost)
+        logger.info("Listening for new escalation timers on '%s'", TIMER_CHANNEL)
+        on_timer(datetime.now(timezone.utc))
+        try:
+            await lost.wait()
+        finally:
+            loop.remove_reader(fd)
+            conn.close()
+        await _sleep(settings.TIMER_LISTENER_RETRY_SECONDS)
+
+
+def _connect():
+    """Open the autocommit LISTEN connection, or return ``None`` if it cannot be opened."""
+    try:
+        conn = psycopg2.connect(settings.DATABASE_URL, connect_timeout=_CONNECT_TIMEOUT)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {TIMER_CHANNEL}")
+    except Exception as e:
+        logger.warning("Timer listener unavailable, relying on periodic checks: %s", e)
+        return None
+    return conn
+
+
+def _drain_notifies(conn, on_timer: Callable[[datetime], None], lost: asyncio.Event) -> None:
+    """Read pending notifications from *conn* and report their due times.
+
+    Sets *lost* if the connection has failed, so the listener reconnects.
+    """
+    try:
+        conn.poll()
+    except Exception as e:
+        logger.warning("Timer listener connection lost, reconnecting: %s", e)
+        lost.set()
+        return
+
+    while conn.notifies:
+        notify = conn.notifies.pop(0)
+        try:
+            due = datetime.fromtimestamp(float(notify.payload), timezone.utc)
+        except ValueError:
+            logger.warning("Ignoring malformed timer notification: %r", notify.payload)
+            continue
+        on_timer(due)
@@ -3,54 +3,107 @@
 Importable by test_api.py, etc.
 """
 
+from collections.abc import Sequence
 from contextlib import contextmanager
-from unittest.mock import MagicMock
+from functools import partial
 
+import orjson
 
-def fake_connection(cursor_sides: list[dict | None]):
-    """Return a patched get_db_connection that yields a mock with preset cursor results.
 
-    ``cursor_sides`` is a list of values that successive ``fetchone()`` / ``fetchall()``
+class FakeCursor:
+    """Cursor stand-in that returns one preset result and ignores executed SQL."""
+
+    __slots__ = ("_val", "_rows", "connection")
+
+    def __init__(self, connection, val):
+        self.connection = connection
+        self._val = val
+        self._rows = val if isinstance(val, list) else [val] if val else []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchone(self):
+        return self._val
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    """Connection stand-in whose successive cursors take the next entry of ``cursor_sides``."""
+
+    __slots__ = ("_sides", "_call_idx", "prepared", "autocommit")
+
+    def __init__(self, sides, call_idx):
+        self._sides = sides
+        self._call_idx = call_idx
+        self.prepared = set()
+        self.autocommit = False
+
+    def cursor(self, *args, **kwargs):
+        i = self._call_idx["i"]
+        self._call_idx["i"] += 1
+        val = self._sides[i] if i < len(self._sides) else None
+        # Support raising exceptions at a specific call index
+        if isinstance(val, Exception):
+            raise val
+        return FakeCursor(self, val)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def fake_connection(cursor_sides: Sequence):
+    """Return a patched get_db_connection that yields a fake with preset cursor results.
+
+    ``cursor_sides`` is a list or tuple of values that successive ``fetchone()`` / ``fetchall()``
     calls will return (one entry per ``with conn.cursor()`` block).
 
-    If an entry is an ``Exception`` instance the corresponding ``get_db_connection``
-    invocation will raise that exception instead of yielding a connection.
+    If an entry is an ``Exception`` instance the corresponding ``with conn.cursor()``
+    block raises that exception instead of yielding a cursor.
     """
     call_idx = {"i": 0}
 
     @contextmanager
-    def _ctx(autocommit=False):
-        idx = call_idx["i"]
-        # Support raising exceptions at a specific call index
-        if idx < len(cursor_sides) and isinstance(cursor_sides[idx], Exception):
-            call_idx["i"] += 1
-            raise cursor_sides[idx]
-
-        conn = MagicMock()
-
-        @contextmanager
-        def _cur_ctx():
-            cur = MagicMock()
-            i = call_idx["i"]
-            if i < len(cursor_sides):
-                val = cursor_sides[i]
-                cur.fetchone.return_value = val
-                cur.fetchall.return_value = val if isinstance(val, list) else [val] if val else []
-            else:
-                cur.fetchone.return_value = None
-                cur.fetchall.return_value = []
-            call_idx["i"] += 1
-            yield cur
-
-        conn.cursor = _cur_ctx
-        yield conn
+    def _ctx(autocommit=False, readonly=False, timeout=None):
+        yield FakeConnection(cursor_sides, call_idx)
 
     return _ctx
 
 
+class FakeResponse:
+    __slots__ = ("status_code", "_json")
+
+    def __init__(self, status_code, json_data=None):
+        self.status_code = status_code
+        self._json = json_data or {}
+
+    def json(self):
+        return self._json
+
+
 class FakeAsyncClient:
     """Simulate a healthy external service."""
 
+    __slots__ = ()
+
+    # Every call returns the same response objects
+    _get_response = FakeResponse(200, {"status": "healthy"})
+    _post_response = FakeResponse(200, {"status": "ok"})
+
     def __init__(self, **kw):
         pass
 
@@ -60,16 +113,21 @@ class FakeAsyncClient:
     async def __aexit__(self, *args):
         pass
 
+    async def aclose(self):
+        pass
+
     async def get(self, url, **kw):
-        return FakeResponse(200, {"status": "healthy"})
+        return self._get_response
 
     async def post(self, url, **kw):
-        return FakeResponse(200, {"status": "ok"})
+        return self._post_response
 
 
 class FakeAsyncClientDown:
     """Simulate an unreachable external service."""
 
+    __slots__ = ()
+
     def __init__(self, **kw):
         pass
 
@@ -79,6 +137,9 @@ class FakeAsyncClientDown:
     async def __aexit__(self, *args):
         pass
 
+    async def aclose(self):
+        pass
+
     async def get(self, url, **kw):
         raise ConnectionError("Service unavailable")
 
@@ -86,32 +147,42 @@ class FakeAsyncClientDown:
         raise ConnectionError("Service unavailable")
 
 
-class FakeResponse:
-    def __init__(self, status_code, json_data=None):
-        self.status_code = status_code
-        self._json = json_data or {}
+class ConfigurableAsyncClient:
+    """Fake client answering every GET and POST with a fixed status and JSON body."""
 
-    def json(self):
-        return self._json
+    __slots__ = ("_get", "_post")
 
+    def __init__(self, get_status=200, get_json=None, post_status=200, post_json=None, **kw):
+        self._get = FakeResponse(get_status, get_json or {"status": "ok"})
+        self._post = FakeResponse(post_status, post_json or {"status": "ok"})
 
-def make_fake_async_client(get_status=200, get_json=None, post_status=200, post_json=None):
-    """Factory that returns a FakeAsyncClient class with configurable responses."""
+    async def __aenter__(self):
+        return self
 
-    class _Client:
-        def __init__(self, **kw):
-            pass
+    async def __aexit__(self, *args):
+        pass
 
-        async def __aenter__(self):
-            return self
+    async def aclose(self):
+        pass
 
-        async def __aexit__(self, *args):
-            pass
+    async def get(self, url, **kw):
+        return self._get
 
-        async def get(self, url, **kw):
-            return FakeResponse(get_status, get_json or {"status": "ok"})
+    async def post(self, url, **kw):
+        return self._post
 
-        async def post(self, url, **kw):
-            return FakeResponse(post_status, post_json or {"status": "ok"})
 
-    return _Client
+def make_fake_async_client(get_status=200, get_json=None, post_status=200, post_json=None):
+    """Return a client factory with configurable responses, usable in place of ``httpx.AsyncClient``."""
+    return partial(
+        ConfigurableAsyncClient,
+        get_status=get_status,
+        get_json=get_json,
+        post_status=post_status,
+        post_json=post_json,
+    )
+
+
+def rjson(response):
+    """Decode an httpx response body with orjson."""
+    return orjson.loads(response.content)
@@ -11,9 +11,11 @@ Run with:
 
 import os
 import uuid
+from unittest.mock import patch
 
 import psycopg2
 import pytest
+from helpers import make_fake_async_client
 from httpx import ASGITransport, AsyncClient
 
 # Skip the entire module if no real database is available
@@ -31,16 +33,21 @@ pytestmark = [
 
 @pytest.fixture(scope="module")
 def db_conn():
-    """Raw psycopg2 connection for verification queries."""
+    """Raw psycopg2 connection for verification queries.
+
+    CI runs these tests serially (``-p no:xdist``) against the shared
+    database.  Tests create uniquely suffixed teams and incidents and can run
+    in any order.
+    """
     conn = psycopg2.connect(DATABASE_URL)
     conn.autocommit = True
     yield conn
     conn.close()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 async def live_client():
-    """Async client wired to the real FastAPI app (no DB mocks)."""
+    """Async client wired to the real FastAPI app (no DB mocks), shared by the module."""
     from app.main import app
 
     transport = ASGITransport(app=app)
@@ -53,7 +60,6 @@ async def live_client():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_create_schedule(live_client, db_conn):
     """POST /api/v1/schedules stores the schedule in oncall.schedules."""
     team_name = f"integ-{uuid.uuid4().hex[:6]}"
@@ -86,7 +92,6 @@ async def test_create_schedule(live_client, db_conn):
     assert row[1] == "weekly"
 
 
-@pytest.mark.asyncio
 async def test_list_schedules(live_client):
     """GET /api/v1/schedules returns the list (seed data has 3 teams)."""
     resp = await live_client.get("/api/v1/schedules")
@@ -96,14 +101,13 @@ async def test_list_schedules(live_client):
     assert len(body["schedules"]) >= 1
 
 
-@pytest.mark.asyncio
 async def test_list_schedules_filter_by_team(live_client):
     """GET /api/v1/schedules?team=platform returns only platform schedules."""
     resp = await live_client.get("/api/v1/schedules?team=platform")
     assert resp.status_code == 200
     body = resp.json()
     assert body["total"] >= 1
-    assert all(s["team"] == "platform" for s in body["schedules"])
+    assert {s["team"] for s in body["schedules"]} == {"platform"}
 
 
 # ---------------------------------------------------------------------------
@@ -111,7 +115,6 @@ async def test_list_schedules_filter_by_team(live_client):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_get_current_oncall(live_client):
     """GET /api/v1/oncall/current?team=platform returns current on-call engineers."""
     resp = await live_client.get("/api/v1/oncall/current?team=platform")
@@ -123,19 +126,67 @@ async def test_get_current_oncall(live_client):
     assert body["escalation_minutes"] > 0
 
 
-@pytest.mark.asyncio
 async def test_get_current_oncall_not_found(live_client):
     """GET /api/v1/oncall/current?team=nonexistent returns 404."""
     resp = await live_client.get("/api/v1/oncall/current?team=nonexistent-team-xyz")
     assert resp.status_code == 404
 
 
+@pytest.mark.parametrize("tz", ["UTC", "America/New_York", "Asia/Kolkata", "Not/AZone"])
+@pytest.mark.parametrize("rotation_type", ["daily", "weekly"])
+@pytest.mark.parametrize("handoff_hour", [0, 9])
+def test_sql_rotation_matches_python(db_conn, tz, rotation_type, handoff_hour):
+    """oncall.current_oncall_index agrees with app.rotation for every hour around handoffs."""
+    from datetime import date, datetime, timedelta, timezone
+
+    from app.rotation import compute_current_oncall
+    from psycopg2.extras import Json
+
+    engineers = [{"name": n, "email": f"{n.lower()}@example.com", "primary": False} for n in ("Ann", "Ben", "Cid")]
+    schedule = {
+        "rotation_type": rotation_type,
+        "start_date": date(2026, 1, 1),
+        "engineers": engineers,
+        "handoff_hour": handoff_hour,
+        "timezone": tz,
+    }
+    # Hourly from two days before start_date across three weeks
+    first = datetime(2025, 12, 30, tzinfo=timezone.utc)
+    instants = [first + timedelta(hours=h) for h in range(21 * 24)]
+
+    cur = db_conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO oncall.schedules (team, rotation_type, start_date, engineers, handoff_hour, timezone)
+        VALUES (%s, %s, %s, %s, %s, %s) RETURNING id
+        """,
+        (f"parity-{uuid.uuid4().hex[:8]}", rotation_type, schedule["start_date"], Json(engineers), handoff_hour, tz),
+    )
+    schedule_id = cur.fetchone()[0]
+    try:
+        cur.execute(
+            """
+            SELECT oncall.current_oncall_index(s, t)
+            FROM oncall.schedules s, unnest(%s::timestamptz[]) WITH ORDINALITY AS u(t, i)
+            WHERE s.id = %s
+            ORDER BY i
+            """,
+            (instants, schedule_id),
+        )
+        sql_indexes = [row[0] for row in cur.fetchall()]
+    finally:
+        cur.execute("DELETE FROM oncall.schedules WHERE id = %s", (schedule_id,))
+
+    emails = [e["email"] for e in engineers]
+    py_indexes = [emails.index(compute_current_oncall(schedule, at)[0].email) for at in instants]
+    assert sql_indexes == py_indexes
+
+
 # ---------------------------------------------------------------------------
 # Escalation
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_escalate_incident(live_client, db_conn):
     """POST /api/v1/escalate creates escalation record."""
     payload = {
@@ -163,7 +214,132 @@ async def test_escalate_incident(live_client, db_conn):
     assert row[0] == payload["incident_id"]
 
 
-@pytest.mark.asyncio
+async def _create_team_with_policy(live_client, levels):
+    """Create a uniquely named team with a two-engineer schedule and the given policy levels."""
+    team = f"integ-esc-{uuid.uuid4().hex[:6]}"
+    resp = await live_client.post(
+        "/api/v1/schedules",
+        json={
+            "team": team,
+            "rotation_type": "weekly",
+            "start_date": "2026-01-01",
+            "engineers": [
+                {"name": "Alice CI", "email": "alice-ci@example.com", "primary": True},
+                {"name": "Bob CI", "email": "bob-ci@example.com", "primary": False},
+            ],
+        },
+    )
+    assert resp.status_code == 201
+    resp = await live_client.post("/api/v1/escalation-policies", json={"team": team, "levels": levels})
+    assert resp.status_code == 201
+    return team
+
+
+async def test_escalate_hands_over_to_next_level_timer(live_client, db_conn):
+    """POST /api/v1/escalate retires the active timer and starts level+1 with that level's wait_minutes."""
+    team = await _create_team_with_policy(
+        live_client,
+        [
+            {"level": 1, "wait_minutes": 3, "notify_target": "secondary"},
+            {"level": 2, "wait_minutes": 17, "notify_target": "manager"},
+        ],
+    )
+    incident_id = f"inc-handover-{uuid.uuid4().hex[:8]}"
+    cur = db_conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO oncall.escalation_timers (incident_id, team, current_level, assigned_to, escalate_after)
+        VALUES (%s, %s, 1, 'alice-ci@example.com', now() + interval '3 minutes') RETURNING id
+        """,
+        (incident_id, team),
+    )
+    old_timer_id = cur.fetchone()[0]
+
+    resp = await live_client.post("/api/v1/escalate", json={"incident_id": incident_id, "team": team, "level": 1})
+    assert resp.status_code == 201
+
+    cur.execute("SELECT is_active FROM oncall.escalation_timers WHERE id = %s", (old_timer_id,))
+    assert cur.fetchone()[0] is False
+    cur.execute(
+        """
+        SELECT t.current_level, t.escalate_after - e.escalated_at
+        FROM oncall.escalation_timers t
+        JOIN oncall.escalations e ON e.incident_id = t.incident_id
+        WHERE t.incident_id = %s AND t.is_active = TRUE
+        """,
+        (incident_id,),
+    )
+    rows = cur.fetchall()
+    cur.close()
+
+    assert len(rows) == 1
+    level, wait = rows[0]
+    assert level == 2
+    assert wait.total_seconds() == 17 * 60
+
+
+async def test_check_escalations_end_to_end(live_client, db_conn):
+    """POST /api/v1/check-escalations escalates expired timers, stopping at the last level."""
+    from app.config import settings
+
+    max_level = settings.ESCALATION_LOOP_COUNT + 1
+    team = await _create_team_with_policy(
+        live_client,
+        [
+            {"level": 1, "wait_minutes": 3, "notify_target": "secondary"},
+            {"level": 2, "wait_minutes": 11, "notify_target": "manager"},
+            {"level": max_level, "wait_minutes": 13, "notify_target": "manager"},
+        ],
+    )
+    first = f"inc-auto-{uuid.uuid4().hex[:8]}"
+    last = f"inc-auto-max-{uuid.uuid4().hex[:8]}"
+    cur = db_conn.cursor()
+    # Due long ago, so they sort ahead of anything else left in the shared database
+    cur.execute(
+        """
+        INSERT INTO oncall.escalation_timers (incident_id, team, current_level, assigned_to, escalate_after)
+        VALUES (%s, %s, 1, 'alice-ci@example.com', '2000-01-01T00:00:00Z'),
+               (%s, %s, %s, 'bob-ci@example.com', '2000-01-01T00:00:01Z')
+        RETURNING id
+        """,
+        (first, team, last, team, max_level),
+    )
+    expired_ids = [row[0] for row in cur.fetchall()]
+
+    # Only the incident service is faked; every query runs against Postgres
+    with patch("app.routers.api.get_http_client", make_fake_async_client(get_json={"status": "open"})):
+        resp = await live_client.post("/api/v1/check-escalations")
+    assert resp.status_code == 200
+    details = {d["incident_id"]: d for d in resp.json()["details"]}
+    assert details[first]["action"] == "escalated"
+    assert details[last]["action"] == "escalated"
+
+    cur.execute("SELECT bool_or(is_active) FROM oncall.escalation_timers WHERE id = ANY(%s::uuid[])", (expired_ids,))
+    assert cur.fetchone()[0] is False
+    cur.execute(
+        "SELECT incident_id, level FROM oncall.escalations WHERE incident_id IN (%s, %s)",
+        (first, last),
+    )
+    assert sorted(cur.fetchall()) == sorted([(first, 1), (last, max_level)])
+    cur.execute(
+        """
+        SELECT t.incident_id, t.current_level, t.escalate_after - e.escalated_at
+        FROM oncall.escalation_timers t
+        JOIN oncall.escalations e ON e.incident_id = t.incident_id
+        WHERE t.incident_id IN (%s, %s) AND t.is_active = TRUE
+        """,
+        (first, last),
+    )
+    rows = cur.fetchall()
+    cur.close()
+
+    # The last level escalates without starting another timer
+    assert len(rows) == 1
+    incident_id, level, wait = rows[0]
+    assert (incident_id, level) == (first, 2)
+    assert wait.total_seconds() == 11 * 60
+
+
 async def test_escalate_no_schedule_returns_404(live_client):
     """POST /api/v1/escalate for nonexistent team returns 404."""
     payload = {
@@ -174,7 +350,6 @@ async def test_escalate_no_schedule_returns_404(live_client):
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_list_escalations(live_client):
     """GET /api/v1/escalations returns escalation history."""
     # First create an escalation
@@ -190,7 +365,6 @@ async def test_list_escalations(live_client):
     assert body["total"] >= 1
 
 
-@pytest.mark.asyncio
 async def test_list_escalations_filter_by_incident(live_client):
     """GET /api/v1/escalations?incident_id=... filters by incident."""
     incident_id = f"inc-filter-{uuid.uuid4().hex[:8]}"
@@ -203,7 +377,7 @@ async def test_list_escalations_filter_by_incident(live_client):
     assert resp.status_code == 200
     body = resp.json()
     assert body["total"] >= 1
-    assert all(e["incident_id"] == incident_id for e in body["escalations"])
+    assert {e["incident_id"] for e in body["escalations"]} == {incident_id}
 
 
 # ---------------------------------------------------------------------------
@@ -211,7 +385,6 @@ async def test_list_escalations_filter_by_incident(live_client):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_health_endpoint_with_real_db(live_client):
     """Health endpoint reports healthy when DB is reachable."""
     resp = await live_client.get("/health")
@@ -221,7 +394,6 @@ async def test_health_endpoint_with_real_db(live_client):
     assert body["checks"]["database"] == "healthy"
 
 
-@pytest.mark.asyncio
 async def test_readiness_with_real_db(live_client):
     """Readiness probe returns ready when DB is up."""
     resp = await live_client.get("/health/ready")
@@ -229,7 +401,6 @@ async def test_readiness_with_real_db(live_client):
     assert resp.json()["status"] == "ready"
 
 
-@pytest.mark.asyncio
 async def test_liveness(live_client):
     """Liveness probe always returns alive."""
     resp = await live_client.get("/health/live")
@@ -237,7 +408,6 @@ async def test_liveness(live_client):
     assert resp.json()["status"] == "alive"
 
 
-@pytest.mark.asyncio
 async def test_metrics_endpoint(live_client):
     """The /metrics endpoint returns Prometheus text format with custom metrics."""
     resp = await live_client.get("/metrics")
@@ -247,7 +417,6 @@ async def test_metrics_endpoint(live_client):
     assert "http_requests_total" in text or "http_request" in text
 
 
-@pytest.mark.asyncio
 async def test_post_schedule_validation_error(live_client):
     """Missing required fields returns 422."""
     resp = await live_client.post("/api/v1/schedules", json={"team": "x"})
@@ -1,43 +1,63 @@
 """Tests for the on-call API -- schedules CRUD, current on-call, escalation, policies, metrics."""
 
-import json
+import asyncio
+import time
 import uuid
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
-from helpers import FakeAsyncClient, FakeAsyncClientDown, fake_connection, make_fake_async_client
+from helpers import FakeAsyncClient, FakeAsyncClientDown, fake_connection, make_fake_async_client, rjson
+
+# Timestamps shared by the fake rows below; dates are immutable, so one
+# instance of each serves every test.
+_DATE_2026_01_01 = date(2026, 1, 1)
+_TS_2026_01_01 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_TS_2026_02_10 = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+# Two-engineer platform schedule row shared by the escalation tests.  The
+# handlers only read it, so tests use it as-is; copy it before changing it.
+_PLATFORM_SCHEDULE = {
+    "id": "00000000-0000-7000-8000-000000000001",
+    "team": "platform",
+    "rotation_type": "weekly",
+    "start_date": _DATE_2026_01_01,
+    "engineers": [
+        {"name": "Alice", "email": "alice@example.com", "primary": True},
+        {"name": "Bob", "email": "bob@example.com", "primary": False},
+    ],
+    "escalation_minutes": 5,
+    "created_at": _TS_2026_01_01,
+}
 
 # ── POST /api/v1/schedules -- create schedule ─────────────────
 
 
-@pytest.mark.asyncio
 async def test_create_schedule(client, sample_schedule_payload):
     """POST /api/v1/schedules creates a schedule and returns 201."""
     fake_row = {
         "id": str(uuid.uuid4()),
         "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
+        "start_date": _DATE_2026_01_01,
         "engineers": [
             {"name": "Alice Engineer", "email": "alice@example.com", "primary": True},
             {"name": "Bob Developer", "email": "bob@example.com", "primary": False},
         ],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_row])):
         resp = await client.post("/api/v1/schedules", json=sample_schedule_payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["team"] == "platform"
     assert body["rotation_type"] == "weekly"
     assert len(body["engineers"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_create_schedule_validation_error(client):
     """POST /api/v1/schedules rejects empty engineers list."""
     payload = {
@@ -50,18 +70,33 @@ async def test_create_schedule_validation_error(client):
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_create_schedule_db_error(client, sample_schedule_payload):
-    """POST /api/v1/schedules returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.post("/api/v1/schedules", json=sample_schedule_payload)
+@pytest.mark.parametrize(
+    "method,url,payload_fixture",
+    [
+        ("post", "/api/v1/schedules", "sample_schedule_payload"),
+        ("get", "/api/v1/schedules", None),
+        ("get", "/api/v1/oncall/current?team=platform", None),
+        ("post", "/api/v1/escalate", "sample_escalate_payload"),
+        ("get", "/api/v1/escalations", None),
+        ("post", "/api/v1/escalation-policies", "sample_policy_payload"),
+        ("get", "/api/v1/escalation-policies", None),
+        ("get", "/api/v1/escalation-policies/platform", None),
+        ("post", "/api/v1/check-escalations", None),
+    ],
+)
+async def test_db_error_returns_500(client, request, method, url, payload_fixture):
+    """Endpoints return 500 when the database connection fails."""
+    kwargs = {"json": request.getfixturevalue(payload_fixture)} if payload_fixture else {}
+    with (
+        patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")),
+    ):
+        resp = await getattr(client, method)(url, **kwargs)
     assert resp.status_code == 500
 
 
 # ── GET /api/v1/schedules -- list schedules ───────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_schedules(client):
     """GET /api/v1/schedules returns schedule list."""
     fake_rows = [
@@ -69,10 +104,10 @@ async def test_list_schedules(client):
             "id": str(uuid.uuid4()),
             "team": "platform",
             "rotation_type": "weekly",
-            "start_date": date(2026, 1, 1),
+            "start_date": _DATE_2026_01_01,
             "engineers": [{"name": "Alice", "email": "alice@example.com", "primary": True}],
             "escalation_minutes": 5,
-            "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "created_at": _TS_2026_01_01,
         }
     ]
 
@@ -80,12 +115,11 @@ async def test_list_schedules(client):
         resp = await client.get("/api/v1/schedules")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 1
     assert body["schedules"][0]["team"] == "platform"
 
 
-@pytest.mark.asyncio
 async def test_list_schedules_with_team_filter(client):
     """GET /api/v1/schedules?team=backend filters by team."""
     fake_rows = [
@@ -93,10 +127,10 @@ async def test_list_schedules_with_team_filter(client):
             "id": str(uuid.uuid4()),
             "team": "backend",
             "rotation_type": "weekly",
-            "start_date": date(2026, 1, 1),
+            "start_date": _DATE_2026_01_01,
             "engineers": [{"name": "Diana", "email": "diana@example.com", "primary": True}],
             "escalation_minutes": 10,
-            "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "created_at": _TS_2026_01_01,
         }
     ]
 
@@ -104,19 +138,18 @@ async def test_list_schedules_with_team_filter(client):
         resp = await client.get("/api/v1/schedules?team=backend")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 1
     assert body["schedules"][0]["team"] == "backend"
 
 
-@pytest.mark.asyncio
 async def test_list_schedules_empty(client):
     """GET /api/v1/schedules returns empty list when none exist."""
     with patch("app.routers.api.get_db_connection", fake_connection([[]])):
         resp = await client.get("/api/v1/schedules")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 0
     assert body["schedules"] == []
 
@@ -124,42 +157,146 @@ async def test_list_schedules_empty(client):
 # ── GET /api/v1/oncall/current -- current on-call ─────────────
 
 
-@pytest.mark.asyncio
 async def test_get_current_oncall(client):
     """GET /api/v1/oncall/current?team=platform returns current on-call."""
+    # The rotation index is resolved in SQL; the row carries the selected engineers
     fake_schedule = {
         "id": str(uuid.uuid4()),
-        "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice Engineer", "email": "alice@example.com", "primary": True},
-            {"name": "Bob Developer", "email": "bob@example.com", "primary": False},
-            {"name": "Charlie SRE", "email": "charlie@example.com", "primary": False},
-        ],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "handoff_hour": 9,
+        "timezone": "UTC",
+        "primary_engineer": {"name": "Bob Developer", "email": "bob@example.com", "primary": False},
+        "secondary_engineer": {"name": "Charlie SRE", "email": "charlie@example.com", "primary": False},
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_schedule])):
         resp = await client.get("/api/v1/oncall/current?team=platform")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["team"] == "platform"
-    assert body["primary"]["role"] == "primary"
+    assert body["primary"] == {"name": "Bob Developer", "email": "bob@example.com", "role": "primary"}
+    assert body["secondary"]["email"] == "charlie@example.com"
     assert body["secondary"]["role"] == "secondary"
     assert body["escalation_minutes"] == 5
 
 
-@pytest.mark.asyncio
+async def test_get_current_oncall_uses_prepared_statement(client):
+    """GET /api/v1/oncall/current runs its lookup as a prepared statement."""
+    with (
+        patch("app.routers.api.get_db_connection", fake_connection([None])),
+        patch("app.routers.api.execute_prepared") as prepared,
+    ):
+        resp = await client.get("/api/v1/oncall/current?team=platform")
+
+    assert resp.status_code == 404
+    name, _query, params = prepared.call_args.args[1:]
+    assert name == "oncall_current"
+    assert params == ("platform",)
+
+
+async def test_read_endpoints_use_readonly_connections(client):
+    """Pure-read endpoints check out their connection in autocommit (readonly=True) mode."""
+    calls = []
+    inner = fake_connection([[], None, [], [], [], []])
+
+    def _recording(**kwargs):
+        calls.append(kwargs)
+        return inner(**kwargs)
+
+    with patch("app.routers.api.get_db_connection", _recording):
+        await client.get("/api/v1/schedules")
+        await client.get("/api/v1/oncall/current?team=platform")
+        await client.get("/api/v1/escalation-policies")
+        await client.get("/api/v1/timers")
+        await client.get(f"/api/v1/schedules/{uuid.uuid4()}/members")
+        await client.get("/api/v1/escalations")
+
+    assert len(calls) == 6
+    assert all(c.get("readonly") for c in calls)
+
+
+_CACHEABLE_SCHEDULE = {
+    "id": "5d0c3f5e-0000-4000-8000-000000000001",
+    "rotation_type": "weekly",
+    "escalation_minutes": 5,
+    "handoff_hour": 9,
+    "timezone": "UTC",
+    "created_at": _TS_2026_01_01,
+    "primary_engineer": {"name": "Bob Developer", "email": "bob@example.com", "primary": False},
+    "secondary_engineer": None,
+}
+
+
+async def test_get_current_oncall_cache_headers(client):
+    """GET /api/v1/oncall/current sends an ETag and a short max-age that never runs past the handoff."""
+    with patch("app.routers.api.get_db_connection", fake_connection([_CACHEABLE_SCHEDULE])):
+        resp = await client.get("/api/v1/oncall/current?team=platform")
+
+    assert resp.status_code == 200
+    assert resp.headers["etag"].startswith('"') and len(resp.headers["etag"]) == 18
+    max_age = int(resp.headers["cache-control"].removeprefix("public, max-age="))
+    assert 0 <= max_age <= 60
+
+
+async def test_get_current_oncall_not_modified(client):
+    """GET /api/v1/oncall/current answers 304 when If-None-Match carries the current ETag."""
+    with patch("app.routers.api.get_db_connection", fake_connection([_CACHEABLE_SCHEDULE])):
+        etag = (await client.get("/api/v1/oncall/current?team=platform")).headers["etag"]
+    with patch("app.routers.api.get_db_connection", fake_connection([_CACHEABLE_SCHEDULE])):
+        resp = await client.get("/api/v1/oncall/current?team=platform", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+    assert resp.content == b""
+
+    # A different pair produces a different ETag
+    changed = {**_CACHEABLE_SCHEDULE, "secondary_engineer": {"name": "Eve", "email": "eve@example.com"}}
+    with patch("app.routers.api.get_db_connection", fake_connection([changed])):
+        resp = await client.get("/api/v1/oncall/current?team=platform", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+    # So does a replacement schedule with the same id and pair
+    replaced = {**_CACHEABLE_SCHEDULE, "created_at": _TS_2026_02_10}
+    with patch("app.routers.api.get_db_connection", fake_connection([replaced])):
+        resp = await client.get("/api/v1/oncall/current?team=platform", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+
+async def test_get_current_oncall_max_age_ends_at_handoff(client):
+    """Close to a handoff, max-age shrinks below ONCALL_CACHE_MAX_AGE."""
+    with (
+        patch("app.routers.api._seconds_until_handoff", return_value=12),
+        patch("app.routers.api.get_db_connection", fake_connection([_CACHEABLE_SCHEDULE])),
+    ):
+        resp = await client.get("/api/v1/oncall/current?team=platform")
+
+    assert resp.headers["cache-control"] == "public, max-age=12"
+
+
+def test_seconds_until_handoff():
+    """_seconds_until_handoff counts to today's handoff, or tomorrow's once it has passed."""
+    from app.routers.api import _seconds_until_handoff
+
+    class _FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 3, 2, 8, 30, tzinfo=tz)
+
+    with patch("app.routers.api.datetime", _FakeDatetime):
+        assert _seconds_until_handoff("UTC", 9) == 30 * 60
+        assert _seconds_until_handoff("UTC", 8) == 23 * 3600 + 30 * 60
+
+
 async def test_get_current_oncall_missing_team(client):
     """GET /api/v1/oncall/current requires team query param."""
     resp = await client.get("/api/v1/oncall/current")
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_get_current_oncall_no_schedule(client):
     """GET /api/v1/oncall/current returns 404 for unknown team."""
     with patch("app.routers.api.get_db_connection", fake_connection([None])):
@@ -171,33 +308,31 @@ async def test_get_current_oncall_no_schedule(client):
 # ── POST /api/v1/escalate -- escalate incident ────────────────
 
 
-@pytest.mark.asyncio
 async def test_escalate_incident(client, sample_escalate_payload):
     """POST /api/v1/escalate creates escalation record."""
     fake_schedule = {
         "id": str(uuid.uuid4()),
         "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
+        "start_date": _DATE_2026_01_01,
         "engineers": [
             {"name": "Alice Engineer", "email": "alice@example.com", "primary": True},
             {"name": "Bob Developer", "email": "bob@example.com", "primary": False},
         ],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
-    # DB calls: 1) lookup schedule, 2) insert escalation, 3) deactivate timer,
-    # 4) lookup policy for timer, 5) insert timer
+    # One connection: 1) lookup schedule, 2) insert escalation + deactivate timer
+    # + policy lookup + insert timer
     with patch(
         "app.routers.api.get_db_connection",
-        fake_connection([fake_schedule, None, None, None, None]),
+        fake_connection([fake_schedule, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["incident_id"] == "inc-test-123"
     assert "from_engineer" in body
     assert "to_engineer" in body
@@ -205,51 +340,46 @@ async def test_escalate_incident(client, sample_escalate_payload):
     assert body["level"] == 1
 
 
-@pytest.mark.asyncio
 async def test_escalate_no_schedule(client, sample_escalate_payload):
     """POST /api/v1/escalate returns 404 when no schedule found."""
     with patch("app.routers.api.get_db_connection", fake_connection([None])):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
 
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_escalate_single_engineer(client):
     """POST /api/v1/escalate with single engineer escalates to manager."""
     fake_schedule = {
         "id": str(uuid.uuid4()),
         "team": "solo",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
+        "start_date": _DATE_2026_01_01,
         "engineers": [
             {"name": "Alice Engineer", "email": "alice@example.com", "primary": True},
         ],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post(
-                "/api/v1/escalate",
-                json={"incident_id": "inc-solo", "team": "solo"},
-            )
+        resp = await client.post(
+            "/api/v1/escalate",
+            json={"incident_id": "inc-solo", "team": "solo"},
+        )
 
     # Single-engineer teams now escalate to manager instead of returning 422
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["to_engineer"] == "admin@expertmind.local"
 
 
 # ── GET /api/v1/escalations -- list escalation history ────────
 
 
-@pytest.mark.asyncio
 async def test_list_escalations(client):
     """GET /api/v1/escalations returns escalation history."""
     fake_rows = [
@@ -260,7 +390,7 @@ async def test_list_escalations(client):
             "to_engineer": "bob@example.com",
             "level": 1,
             "reason": "Timeout",
-            "escalated_at": datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc),
+            "escalated_at": _TS_2026_02_10,
         }
     ]
 
@@ -268,16 +398,50 @@ async def test_list_escalations(client):
         resp = await client.get("/api/v1/escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 1
     assert body["escalations"][0]["incident_id"] == "inc-123"
     assert body["escalations"][0]["level"] == 1
+    assert body["escalations"][0]["escalated_at"] == "2026-02-10T12:00:00+00:00"
+
+
+async def test_list_escalations_returns_whole_page(client):
+    """GET /api/v1/escalations returns every fetched row in one JSON document."""
+    fake_rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "incident_id": f"inc-{i}",
+            "from_engineer": "alice@example.com",
+            "to_engineer": "bob@example.com",
+            "level": 1,
+            "reason": None,
+            "escalated_at": None,
+        }
+        for i in range(3)
+    ]
+
+    with patch("app.routers.api.get_db_connection", fake_connection([fake_rows])):
+        resp = await client.get("/api/v1/escalations")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    body = rjson(resp)
+    assert body["total"] == 3
+    assert [e["incident_id"] for e in body["escalations"]] == ["inc-0", "inc-1", "inc-2"]
+
+
+async def test_list_escalations_empty(client):
+    """GET /api/v1/escalations returns an empty list when there is no history."""
+    with patch("app.routers.api.get_db_connection", fake_connection([[]])):
+        resp = await client.get("/api/v1/escalations")
+
+    assert resp.status_code == 200
+    assert rjson(resp) == {"escalations": [], "total": 0}
 
 
 # ── POST /api/v1/escalation-policies -- create policy ────────
 
 
-@pytest.mark.asyncio
 async def test_create_escalation_policy(client):
     """POST /api/v1/escalation-policies creates a policy."""
     payload = {
@@ -292,13 +456,43 @@ async def test_create_escalation_policy(client):
         resp = await client.post("/api/v1/escalation-policies", json=payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["team"] == "platform"
     assert len(body["levels"]) == 2
     assert body["levels"][0]["wait_minutes"] == 5
 
 
-@pytest.mark.asyncio
+async def test_create_escalation_policy_single_insert(client):
+    """POST /api/v1/escalation-policies inserts every level with one statement."""
+    from contextlib import contextmanager
+    from unittest.mock import MagicMock
+
+    cur = MagicMock()
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cur
+
+    @contextmanager
+    def _ctx(autocommit=False, readonly=False):
+        yield conn
+
+    payload = {
+        "team": "platform",
+        "levels": [
+            {"level": 1, "wait_minutes": 5, "notify_target": "secondary"},
+            {"level": 2, "wait_minutes": 10, "notify_target": "manager"},
+            {"level": 3, "wait_minutes": 15, "notify_target": "lead@example.com"},
+        ],
+    }
+
+    with patch("app.routers.api.get_db_connection", _ctx):
+        resp = await client.post("/api/v1/escalation-policies", json=payload)
+
+    assert resp.status_code == 201
+    inserts = [c for c in cur.execute.call_args_list if "INSERT" in c.args[0]]
+    assert len(inserts) == 1
+    assert inserts[0].args[1] == ("platform", [1, 2, 3], [5, 10, 15], ["secondary", "manager", "lead@example.com"])
+
+
 async def test_create_escalation_policy_validation_error(client):
     """POST /api/v1/escalation-policies rejects empty levels."""
     payload = {"team": "platform", "levels": []}
@@ -309,7 +503,6 @@ async def test_create_escalation_policy_validation_error(client):
 # ── GET /api/v1/escalation-policies -- list policies ─────────
 
 
-@pytest.mark.asyncio
 async def test_list_escalation_policies(client):
     """GET /api/v1/escalation-policies returns policy list."""
     fake_rows = [
@@ -331,7 +524,7 @@ async def test_list_escalation_policies(client):
         resp = await client.get("/api/v1/escalation-policies")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 1
     assert len(body["policies"][0]["levels"]) == 2
 
@@ -339,7 +532,6 @@ async def test_list_escalation_policies(client):
 # ── GET /api/v1/escalation-policies/{team} -- get policy ─────
 
 
-@pytest.mark.asyncio
 async def test_get_escalation_policy(client):
     """GET /api/v1/escalation-policies/platform returns the team policy."""
     fake_rows = [
@@ -355,11 +547,10 @@ async def test_get_escalation_policy(client):
         resp = await client.get("/api/v1/escalation-policies/platform")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["team"] == "platform"
 
 
-@pytest.mark.asyncio
 async def test_get_escalation_policy_not_found(client):
     """GET /api/v1/escalation-policies/nonexistent returns 404."""
     with patch("app.routers.api.get_db_connection", fake_connection([[]])):
@@ -371,19 +562,64 @@ async def test_get_escalation_policy_not_found(client):
 # ── POST /api/v1/check-escalations -- auto escalation ────────
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_no_timers(client):
     """POST /api/v1/check-escalations returns empty when no expired timers."""
     with patch("app.routers.api.get_db_connection", fake_connection([[]])):
         resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["checked"] == 0
     assert body["escalated"] == 0
 
 
-@pytest.mark.asyncio
+async def test_check_escalations_records_next_timer_due(client):
+    """A scan that finds nothing due remembers when the earliest active timer fires."""
+    from app.routers import api as api_mod
+
+    due = datetime.now(timezone.utc) + timedelta(minutes=3)
+    with patch("app.routers.api.get_db_connection", fake_connection([[{"id": None, "next_due": due}]])):
+        resp = await client.post("/api/v1/check-escalations")
+
+    assert resp.status_code == 200
+    assert rjson(resp)["checked"] == 0
+    assert api_mod.next_timer_due == due
+    assert 170 < api_mod.seconds_until_next_timer() <= 180
+
+
+async def test_check_escalations_keeps_timer_announced_mid_scan(client):
+    """A timer announced while the scan runs is not overwritten by the scan's later due time."""
+    from app.routers import api as api_mod
+
+    announced = datetime.now(timezone.utc) + timedelta(minutes=1)
+    scanned = announced + timedelta(minutes=4)
+
+    def _scan(now):
+        api_mod.timer_scheduled(announced)
+        return [], scanned
+
+    with patch("app.routers.api._fetch_expired_timers", _scan):
+        resp = await client.post("/api/v1/check-escalations")
+
+    assert resp.status_code == 200
+    assert api_mod.next_timer_due == announced
+
+
+async def test_check_escalations_remembers_due_time_after_finding_timers(client):
+    """A scan that finds due timers still records when the remaining ones fire."""
+    from app.routers import api as api_mod
+
+    api_mod.next_timer_due = datetime.now(timezone.utc) - timedelta(seconds=1)
+    later = datetime.now(timezone.utc) + timedelta(minutes=2)
+    timer = {"id": str(uuid.uuid4()), "incident_id": "inc-x", "team": "none", "current_level": 1}
+    with patch("app.routers.api._fetch_expired_timers", return_value=([timer], later)):
+        with patch("app.routers.api._escalate_expired_timers", return_value=([], [], 0)):
+            resp = await client.post("/api/v1/check-escalations")
+
+    assert resp.status_code == 200
+    assert api_mod.next_timer_due == later
+
+
 async def test_check_escalations_with_expired_timer(client):
     """POST /api/v1/check-escalations escalates expired timers."""
     fake_timers = [
@@ -396,57 +632,83 @@ async def test_check_escalations_with_expired_timer(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    fake_policy = {"wait_minutes": 5, "notify_target": "secondary"}
+    fake_policy = {"team": "platform", "level": 1, "wait_minutes": 5, "notify_target": "secondary"}
 
-    # DB calls: 1) get expired timers, 2) get schedule, 3) get policy,
-    # 4) insert escalation + deactivate timer, 5) lookup policy for new timer, 6) insert timer
+    # DB calls: 1) get expired timers, then on one connection 2) get schedule,
+    # 3) get policy, 4) insert escalation + deactivate timer + start next timer
     with patch(
         "app.routers.api.get_db_connection",
-        fake_connection([fake_timers, fake_schedule, fake_policy, None, None, None]),
+        fake_connection([fake_timers, fake_schedule, fake_policy, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["checked"] == 1
     assert body["escalated"] == 1
     assert body["details"][0]["action"] == "escalated"
 
 
+async def test_check_escalations_notifies_in_background(client):
+    """Notifications are sent after the check returns instead of delaying it."""
+    from app.routers import api as api_mod
+
+    fake_timers = [
+        {
+            "id": str(uuid.uuid4()),
+            "incident_id": "inc-bg-1",
+            "team": "platform",
+            "current_level": 1,
+            "assigned_to": "alice@example.com",
+        }
+    ]
+    fake_schedule = _PLATFORM_SCHEDULE
+    fake_policy = {"team": "platform", "level": 1, "wait_minutes": 5, "notify_target": "secondary"}
+    release = asyncio.Event()
+
+    async def slow_notify(**kwargs):
+        await release.wait()
+
+    with (
+        patch(
+            "app.routers.api.get_db_connection",
+            fake_connection([fake_timers, fake_schedule, fake_policy, None]),
+        ),
+        patch("app.routers.api.get_http_client", return_value=FakeAsyncClient()),
+        patch("app.routers.api._notify_engineer", side_effect=slow_notify) as notify,
+    ):
+        resp = await client.post("/api/v1/check-escalations")
+
+        assert resp.status_code == 200
+        assert rjson(resp)["escalated"] == 1
+        pending = set(api_mod._background_tasks)
+        assert len(pending) == 1
+
+        release.set()
+        await asyncio.gather(*pending)
+
+    notify.assert_called_once()
+    assert notify.call_args.kwargs["incident_id"] == "inc-bg-1"
+    assert not api_mod._background_tasks
+
+
 # ── GET /api/v1/metrics/oncall -- on-call metrics ────────────
 
 
-@pytest.mark.asyncio
 async def test_get_oncall_metrics(client):
     """GET /api/v1/metrics/oncall returns on-call metrics."""
-    fake_esc_count = {"cnt": 5}
-    fake_esc_by_team = [{"team": "platform", "cnt": 3}]
-    fake_incident_summary = {"total": 50, "avg_mtta": 180.0, "avg_mttr": 900.0}
-    fake_load = [{"assigned_to": "Alice", "cnt": 3}]
+    fake_esc_live = {"cnt": 5, "by_team": {"platform": 3}}
 
-    with patch(
-        "app.routers.api.get_db_connection",
-        fake_connection([fake_esc_count, fake_esc_by_team, fake_incident_summary, fake_load]),
-    ):
+    # 1) pre-aggregated summary unavailable, 2) live escalation queries
+    with patch("app.routers.api.get_db_connection", fake_connection([None, fake_esc_live])):
         resp = await client.get("/api/v1/metrics/oncall")
 
     assert resp.status_code == 200
-    body = resp.json()
-    assert "total_escalations" in body
+    body = rjson(resp)
+    assert body["total_escalations"] == 5
+    assert body["by_team"] == {"platform": 3}
     assert "escalation_rate_pct" in body
     assert "avg_mtta_seconds" in body
 
@@ -454,39 +716,26 @@ async def test_get_oncall_metrics(client):
 # ── POST /api/v1/escalate with level 2 ───────────────────────
 
 
-@pytest.mark.asyncio
 async def test_escalate_level_2_to_manager(client):
     """POST /api/v1/escalate with level=2 escalates to manager."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post(
-                "/api/v1/escalate",
-                json={
-                    "incident_id": "inc-l2",
-                    "team": "platform",
-                    "level": 2,
-                    "reason": "Secondary did not respond",
-                },
-            )
+        resp = await client.post(
+            "/api/v1/escalate",
+            json={
+                "incident_id": "inc-l2",
+                "team": "platform",
+                "level": 2,
+                "reason": "Secondary did not respond",
+            },
+        )
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["level"] == 2
     assert body["to_engineer"] == "admin@expertmind.local"
 
@@ -494,7 +743,6 @@ async def test_escalate_level_2_to_manager(client):
 # ── GET /metrics ──────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_metrics_contains_custom_metrics(client):
     """Metrics endpoint exposes escalations_total and oncall_current."""
     resp = await client.get("/metrics")
@@ -503,320 +751,184 @@ async def test_metrics_contains_custom_metrics(client):
     assert "escalations_total" in text
 
 
-# ══════════════════════════════════════════════════════════════
-# String-engineers branches (json.loads path)
-# ══════════════════════════════════════════════════════════════
-
-
-@pytest.mark.asyncio
-async def test_create_schedule_string_engineers(client, sample_schedule_payload):
-    """POST /api/v1/schedules handles engineers returned as a JSON string."""
-    fake_row = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": json.dumps(
-            [
-                {
-                    "name": "Alice Engineer",
-                    "email": "alice@example.com",
-                    "primary": True,
-                },
-            ]
-        ),
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
-
-    with patch("app.routers.api.get_db_connection", fake_connection([fake_row])):
-        resp = await client.post("/api/v1/schedules", json=sample_schedule_payload)
-
-    assert resp.status_code == 201
-    assert len(resp.json()["engineers"]) == 1
-
-
-@pytest.mark.asyncio
-async def test_list_schedules_string_engineers(client):
-    """GET /api/v1/schedules handles engineers stored as JSON string."""
-    fake_rows = [
-        {
-            "id": str(uuid.uuid4()),
-            "team": "platform",
-            "rotation_type": "weekly",
-            "start_date": date(2026, 1, 1),
-            "engineers": json.dumps([{"name": "Alice", "email": "alice@example.com", "primary": True}]),
-            "escalation_minutes": 5,
-            "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-        }
-    ]
-
-    with patch("app.routers.api.get_db_connection", fake_connection([fake_rows])):
-        resp = await client.get("/api/v1/schedules")
-
-    assert resp.status_code == 200
-    assert resp.json()["total"] == 1
-
-
-@pytest.mark.asyncio
-async def test_get_current_oncall_string_engineers(client):
-    """GET /api/v1/oncall/current handles engineers stored as JSON string."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": json.dumps(
-            [
-                {"name": "Alice", "email": "alice@example.com", "primary": True},
-                {"name": "Bob", "email": "bob@example.com", "primary": False},
-            ]
-        ),
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
-
-    with patch("app.routers.api.get_db_connection", fake_connection([fake_schedule])):
-        resp = await client.get("/api/v1/oncall/current?team=platform")
-
-    assert resp.status_code == 200
-    assert resp.json()["primary"]["role"] == "primary"
-
-
 # ══════════════════════════════════════════════════════════════
 # DB-error paths
 # ══════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
-async def test_list_schedules_db_error(client):
-    """GET /api/v1/schedules returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.get("/api/v1/schedules")
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
-async def test_get_current_oncall_db_error(client):
-    """GET /api/v1/oncall/current returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.get("/api/v1/oncall/current?team=platform")
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
 async def test_get_current_oncall_empty_engineers(client):
     """GET /api/v1/oncall/current returns 404 when schedule has no engineers."""
     fake_schedule = {
         "id": str(uuid.uuid4()),
-        "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "primary_engineer": None,
+        "secondary_engineer": None,
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_schedule])):
         resp = await client.get("/api/v1/oncall/current?team=platform")
     assert resp.status_code == 404
-    assert "No engineers" in resp.json()["detail"]
+    assert "No engineers" in rjson(resp)["detail"]
 
 
-@pytest.mark.asyncio
-async def test_escalate_db_error_schedule_lookup(client, sample_escalate_payload):
-    """POST /api/v1/escalate returns 500 when schedule lookup fails."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
 async def test_escalate_empty_engineers(client, sample_escalate_payload):
     """POST /api/v1/escalate returns 404 when schedule has no engineers."""
     fake_schedule = {
         "id": str(uuid.uuid4()),
         "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
+        "start_date": _DATE_2026_01_01,
         "engineers": [],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_schedule])):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_escalate_no_team_defaults_to_platform(client):
     """POST /api/v1/escalate defaults team to 'platform' when missing."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post(
-                "/api/v1/escalate",
-                json={"incident_id": "inc-no-team", "team": None},
-            )
+        resp = await client.post(
+            "/api/v1/escalate",
+            json={"incident_id": "inc-no-team", "team": None},
+        )
     assert resp.status_code == 201
 
 
-@pytest.mark.asyncio
 async def test_escalate_db_error_recording(client, sample_escalate_payload):
     """POST /api/v1/escalate returns 500 when recording the escalation fails."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     # 1) schedule lookup OK, 2) insert escalation FAIL
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_schedule, Exception("DB down")]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
     assert resp.status_code == 500
 
 
-@pytest.mark.asyncio
-async def test_escalate_deactivate_timer_error(client, sample_escalate_payload):
-    """POST /api/v1/escalate succeeds even when deactivating timers fails (non-critical)."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+def _escalation_write_conn(schedule, fail_on):
+    """Single pooled connection whose cursor raises on the statement containing *fail_on*."""
+    from contextlib import contextmanager
+    from unittest.mock import MagicMock
 
-    # 1) schedule OK, 2) insert escalation OK, 3) deactivate timer FAIL, 4) timer policy OK, 5) timer insert OK
-    with patch(
-        "app.routers.api.get_db_connection",
-        fake_connection([fake_schedule, None, Exception("DB down"), None, None]),
-    ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+    cur = MagicMock()
+    cur.fetchone.side_effect = [schedule, None]
+
+    def _execute(sql, params=None):
+        if fail_on in sql:
+            raise Exception("DB")
+
+    cur.execute.side_effect = _execute
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cur
+
+    @contextmanager
+    def _ctx(autocommit=False, readonly=False):
+        yield conn
+
+    return conn, _ctx
+
+
+@pytest.mark.parametrize(
+    "fail_on",
+    ["UPDATE oncall.escalation_timers", "INSERT INTO oncall.escalation_timers"],
+    ids=["deactivate", "create"],
+)
+async def test_escalate_timer_errors(client, sample_escalate_payload, fail_on):
+    """POST /api/v1/escalate rolls back the escalation when retiring or creating a timer fails."""
+    conn, ctx = _escalation_write_conn(_PLATFORM_SCHEDULE, fail_on)
+    with patch("app.routers.api.get_db_connection", ctx):
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+    assert resp.status_code == 500
+    conn.commit.assert_not_called()
+
+
+async def test_escalate_single_transaction(client, sample_escalate_payload):
+    """POST /api/v1/escalate checks out one connection and commits once."""
+    fake_schedule = _PLATFORM_SCHEDULE
+
+    conn, ctx = _escalation_write_conn(fake_schedule, "<no failure>")
+    with patch("app.routers.api.get_db_connection", side_effect=ctx) as get_conn:
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
     assert resp.status_code == 201
+    assert get_conn.call_count == 1
+    conn.commit.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_escalate_timer_errors(client, sample_escalate_payload):
-    """POST /api/v1/escalate succeeds even when timer creation fails."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+async def test_escalate_db_work_runs_off_event_loop(client, sample_escalate_payload):
+    """POST /api/v1/escalate does its blocking DB work in a worker thread."""
+    import threading
 
-    # 1) schedule OK, 2) insert esc OK, 3) deactivate OK, 4) timer policy FAIL, 5) timer insert FAIL
-    with patch(
-        "app.routers.api.get_db_connection",
-        fake_connection([fake_schedule, None, None, Exception("DB"), Exception("DB")]),
+    fake_schedule = _PLATFORM_SCHEDULE
+    conn, ctx = _escalation_write_conn(fake_schedule, "<no failure>")
+    threads = []
+
+    def _recording(**kwargs):
+        threads.append(threading.get_ident())
+        return ctx(**kwargs)
+
+    with patch("app.routers.api.get_db_connection", _recording):
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+
+    assert resp.status_code == 201
+    assert threads and threading.get_ident() not in threads
+
+
+async def test_escalate_notifies_in_background(client, sample_escalate_payload):
+    """POST /api/v1/escalate hands the notification to a background task."""
+    from unittest.mock import AsyncMock
+
+    fake_schedule = _PLATFORM_SCHEDULE
+
+    with (
+        patch("app.routers.api.get_db_connection", fake_connection([fake_schedule, None])),
+        patch("app.routers.api._notify_engineer", new_callable=AsyncMock) as notify,
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+
     assert resp.status_code == 201
+    notify.assert_awaited_once()
+    assert notify.await_args.kwargs["engineer"] == rjson(resp)["to_engineer"]
 
 
-@pytest.mark.asyncio
 async def test_escalate_notification_failure(client, sample_escalate_payload):
     """POST /api/v1/escalate succeeds even when notification service is down."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClientDown):
+        with patch("app.http_client.httpx.AsyncClient", FakeAsyncClientDown):
             resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
     assert resp.status_code == 201
 
 
-@pytest.mark.asyncio
 async def test_escalate_notification_bad_response(client, sample_escalate_payload):
     """POST /api/v1/escalate handles notification service returning 4xx."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     BadClient = make_fake_async_client(post_status=500)
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", BadClient):
+        with patch("app.http_client.httpx.AsyncClient", BadClient):
             resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
     assert resp.status_code == 201
 
 
-@pytest.mark.asyncio
-async def test_list_escalations_db_error(client):
-    """GET /api/v1/escalations returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.get("/api/v1/escalations")
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
 async def test_list_escalations_with_incident_filter(client):
     """GET /api/v1/escalations?incident_id=... filters properly."""
     fake_rows = [
@@ -827,7 +939,7 @@ async def test_list_escalations_with_incident_filter(client):
             "to_engineer": "bob@example.com",
             "level": 1,
             "reason": "Timeout",
-            "escalated_at": datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc),
+            "escalated_at": _TS_2026_02_10,
         }
     ]
 
@@ -835,29 +947,12 @@ async def test_list_escalations_with_incident_filter(client):
         resp = await client.get("/api/v1/escalations?incident_id=inc-filter")
 
     assert resp.status_code == 200
-    assert resp.json()["total"] == 1
+    assert rjson(resp)["total"] == 1
 
 
 # ── Escalation policy error paths ────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_create_policy_db_error(client, sample_policy_payload):
-    """POST /api/v1/escalation-policies returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.post("/api/v1/escalation-policies", json=sample_policy_payload)
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
-async def test_list_policies_db_error(client):
-    """GET /api/v1/escalation-policies returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.get("/api/v1/escalation-policies")
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
 async def test_list_policies_with_team_filter(client):
     """GET /api/v1/escalation-policies?team=backend filters by team."""
     fake_rows = [
@@ -873,15 +968,7 @@ async def test_list_policies_with_team_filter(client):
         resp = await client.get("/api/v1/escalation-policies?team=backend")
 
     assert resp.status_code == 200
-    assert resp.json()["total"] == 1
-
-
-@pytest.mark.asyncio
-async def test_get_policy_db_error(client):
-    """GET /api/v1/escalation-policies/platform returns 500 on DB error."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.get("/api/v1/escalation-policies/platform")
-    assert resp.status_code == 500
+    assert rjson(resp)["total"] == 1
 
 
 # ══════════════════════════════════════════════════════════════
@@ -889,15 +976,6 @@ async def test_get_policy_db_error(client):
 # ══════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
-async def test_check_escalations_db_error(client):
-    """POST /api/v1/check-escalations returns 500 when timer query fails."""
-    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
-        resp = await client.post("/api/v1/check-escalations")
-    assert resp.status_code == 500
-
-
-@pytest.mark.asyncio
 async def test_check_escalations_incident_acknowledged(client):
     """POST /api/v1/check-escalations skips acknowledged incidents."""
     fake_timers = [
@@ -915,18 +993,17 @@ async def test_check_escalations_incident_acknowledged(client):
 
     # 1) get timers, 2) deactivate timer (for acknowledged)
     with patch("app.routers.api.get_db_connection", fake_connection([fake_timers, None])):
-        with patch("app.routers.api.httpx.AsyncClient", AckClient):
+        with patch("app.http_client.httpx.AsyncClient", AckClient):
             resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["checked"] == 1
     assert body["escalated"] == 0
     assert body["details"][0]["action"] == "skipped"
     assert "acknowledged" in body["details"][0]["reason"]
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_incident_ack_deactivate_error(client):
     """POST /api/v1/check-escalations handles DB error when deactivating acknowledged timer."""
     fake_timers = [
@@ -946,15 +1023,19 @@ async def test_check_escalations_incident_ack_deactivate_error(client):
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, Exception("DB")]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", AckClient):
+        with (
+            patch("app.http_client.httpx.AsyncClient", AckClient),
+            patch("app.routers.api.logger") as logger,
+        ):
             resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["details"][0]["action"] == "skipped"
+    assert body["failed"] == 1
+    logger.exception.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_httpx_error(client):
     """POST /api/v1/check-escalations handles httpx failure when checking incident."""
     fake_timers = [
@@ -967,35 +1048,23 @@ async def test_check_escalations_httpx_error(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    fake_policy = {"wait_minutes": 5, "notify_target": "secondary"}
+    fake_policy = {"team": "platform", "level": 1, "wait_minutes": 5, "notify_target": "secondary"}
 
     # httpx GET raises
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, fake_policy, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClientDown):
+        with patch("app.http_client.httpx.AsyncClient", FakeAsyncClientDown):
             resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["escalated"] == 1
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_no_schedule(client):
     """POST /api/v1/check-escalations skips timers with no schedule."""
     fake_timers = [
@@ -1010,18 +1079,16 @@ async def test_check_escalations_no_schedule(client):
 
     # 1) get timers, 2) schedule lookup returns None
     with patch("app.routers.api.get_db_connection", fake_connection([fake_timers, None])):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["checked"] == 1
     assert body["escalated"] == 0
     assert body["details"][0]["action"] == "skipped"
     assert "No schedule" in body["details"][0]["reason"]
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_schedule_lookup_error(client):
     """POST /api/v1/check-escalations skips timer when schedule lookup raises."""
     fake_timers = [
@@ -1039,15 +1106,13 @@ async def test_check_escalations_schedule_lookup_error(client):
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, Exception("DB")]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["details"][0]["action"] == "skipped"
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_policy_manager_target(client):
     """POST /api/v1/check-escalations escalates to manager when policy says so."""
     fake_timers = [
@@ -1060,36 +1125,23 @@ async def test_check_escalations_policy_manager_target(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
-
-    fake_policy = {"wait_minutes": 10, "notify_target": "manager"}
+    fake_schedule = _PLATFORM_SCHEDULE
+
+    fake_policy = {"team": "platform", "level": 2, "wait_minutes": 10, "notify_target": "manager"}
 
     # 1) timers, 2) schedule, 3) policy, 4) record escalation, 5) timer policy, 6) timer insert
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, fake_policy, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["escalated"] == 1
     assert body["details"][0]["to"] == "admin@expertmind.local"
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_policy_direct_email(client):
     """POST /api/v1/check-escalations escalates to direct email from policy."""
     fake_timers = [
@@ -1102,34 +1154,21 @@ async def test_check_escalations_policy_direct_email(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    fake_policy = {"wait_minutes": 5, "notify_target": "teamlead@example.com"}
+    fake_policy = {"team": "platform", "level": 1, "wait_minutes": 5, "notify_target": "teamlead@example.com"}
 
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, fake_policy, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["details"][0]["to"] == "teamlead@example.com"
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_no_policy_level_gt1(client):
     """POST /api/v1/check-escalations defaults to manager when no policy and level > 1."""
     fake_timers = [
@@ -1142,33 +1181,20 @@ async def test_check_escalations_no_policy_level_gt1(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     # No policy found (None)
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["details"][0]["to"] == "admin@expertmind.local"
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_no_policy_level1_secondary(client):
     """POST /api/v1/check-escalations defaults to secondary when no policy and level == 1."""
     fake_timers = [
@@ -1181,33 +1207,20 @@ async def test_check_escalations_no_policy_level1_secondary(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, None, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     # The actual secondary depends on rotation index at today's date
     assert body["details"][0]["to"] in ("alice@example.com", "bob@example.com")
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_policy_lookup_error(client):
     """POST /api/v1/check-escalations handles DB error in policy lookup."""
     fake_timers = [
@@ -1220,33 +1233,20 @@ async def test_check_escalations_policy_lookup_error(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
     # 1) timers, 2) schedule, 3) policy FAIL → policy_row=None, 4) record, 5) timer policy, 6) timer insert
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, Exception("DB"), None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["escalated"] == 1
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_record_error(client):
     """POST /api/v1/check-escalations skips timer when recording escalation fails."""
     fake_timers = [
@@ -1259,36 +1259,23 @@ async def test_check_escalations_record_error(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    fake_policy = {"wait_minutes": 5, "notify_target": "secondary"}
+    fake_policy = {"team": "platform", "level": 1, "wait_minutes": 5, "notify_target": "secondary"}
 
     # 1) timers, 2) schedule, 3) policy, 4) record escalation FAIL → continue
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, fake_policy, Exception("DB")]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["checked"] == 1
     assert body["escalated"] == 0
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_max_level_no_timer(client):
     """POST /api/v1/check-escalations does not start timer when max level exceeded."""
     fake_timers = [
@@ -1301,35 +1288,99 @@ async def test_check_escalations_max_level_no_timer(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    fake_policy = {"wait_minutes": 5, "notify_target": "manager"}
+    fake_policy = {"team": "platform", "level": 99, "wait_minutes": 5, "notify_target": "manager"}
 
     # 1) timers, 2) schedule, 3) policy, 4) record escalation (no timer calls after)
     with patch(
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, fake_policy, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/check-escalations")
+        resp = await client.post("/api/v1/check-escalations")
+
+    assert resp.status_code == 200
+    body = rjson(resp)
+    assert body["escalated"] == 1
+
+
+async def test_check_escalations_batches_lookups(client):
+    """POST /api/v1/check-escalations loads schedules and policies once for all timers."""
+    fake_timers = [
+        {
+            "id": str(uuid.uuid4()),
+            "incident_id": f"inc-batch-{i}",
+            "team": "platform",
+            "current_level": 1,
+            "assigned_to": "alice@example.com",
+        }
+        for i in range(2)
+    ]
+
+    fake_schedule = _PLATFORM_SCHEDULE
+
+    fake_policy = {"team": "platform", "level": 1, "notify_target": "teamlead@example.com"}
+
+    # 1) timers, 2) schedules for all teams, 3) policies for all (team, level) pairs,
+    # 4) one bulk write for every escalation
+    with (
+        patch(
+            "app.routers.api.get_db_connection",
+            fake_connection([fake_timers, [fake_schedule], [fake_policy], None]),
+        ),
+        patch("app.routers.api.execute_prepared") as prepared,
+    ):
+        resp = await client.post("/api/v1/check-escalations")
+
+    assert resp.status_code == 200
+    body = rjson(resp)
+    assert body["escalated"] == 2
+    assert [d["to"] for d in body["details"]] == ["teamlead@example.com"] * 2
+
+    writes = [c for c in prepared.call_args_list if c.args[1] == "oncall_record_auto_escalations"]
+    assert len(writes) == 1
+    params = writes[0].args[3]
+    assert params[1] == ["inc-batch-0", "inc-batch-1"]
+    assert params[8] == [t["id"] for t in fake_timers]
+    assert params[10] == ["inc-batch-0", "inc-batch-1"]
+    assert params[12] == [2, 2]
+
+
+async def test_check_escalations_bulk_write_falls_back_per_timer(client):
+    """A failed bulk write is retried per timer, so one bad row does not block the others."""
+    fake_timers = [
+        {
+            "id": str(uuid.uuid4()),
+            "incident_id": f"inc-retry-{i}",
+            "team": "platform",
+            "current_level": 1,
+            "assigned_to": "alice@example.com",
+        }
+        for i in range(2)
+    ]
+
+    fake_schedule = _PLATFORM_SCHEDULE
+
+    # 1) timers, 2) schedules, 3) policies, 4) bulk write FAIL,
+    # 5) retry of the first timer OK, 6) retry of the second timer FAIL
+    with (
+        patch(
+            "app.routers.api.get_db_connection",
+            fake_connection([fake_timers, [fake_schedule], [], Exception("DB"), None, Exception("DB")]),
+        ),
+        patch("app.routers.api.logger") as logger,
+    ):
+        resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
+    assert body["checked"] == 2
     assert body["escalated"] == 1
+    assert body["failed"] == 1
+    assert [d["incident_id"] for d in body["details"]] == ["inc-retry-0"]
+    logger.exception.assert_called_once_with("auto-escalation failed for timer %s", fake_timers[1]["id"])
 
 
-@pytest.mark.asyncio
 async def test_check_escalations_incident_404(client):
     """POST /api/v1/check-escalations proceeds when incident service returns non-200."""
     fake_timers = [
@@ -1342,20 +1393,9 @@ async def test_check_escalations_incident_404(client):
         }
     ]
 
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    fake_policy = {"wait_minutes": 5, "notify_target": "secondary"}
+    fake_policy = {"team": "platform", "level": 1, "wait_minutes": 5, "notify_target": "secondary"}
 
     # Incident service returns 404 → incident_status stays None → escalate
     Client404 = make_fake_async_client(get_status=404, get_json={})
@@ -1364,11 +1404,11 @@ async def test_check_escalations_incident_404(client):
         "app.routers.api.get_db_connection",
         fake_connection([fake_timers, fake_schedule, fake_policy, None, None, None]),
     ):
-        with patch("app.routers.api.httpx.AsyncClient", Client404):
+        with patch("app.http_client.httpx.AsyncClient", Client404):
             resp = await client.post("/api/v1/check-escalations")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["escalated"] == 1
 
 
@@ -1377,7 +1417,6 @@ async def test_check_escalations_incident_404(client):
 # ══════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
 async def test_oncall_metrics_escalation_db_error(client):
     """GET /api/v1/metrics/oncall handles DB error in escalation query gracefully."""
     # Both DB connections fail → all metrics are defaults
@@ -1385,54 +1424,59 @@ async def test_oncall_metrics_escalation_db_error(client):
         resp = await client.get("/api/v1/metrics/oncall")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total_escalations"] == 0
     assert body["total_incidents"] == 0
 
 
-@pytest.mark.asyncio
 async def test_oncall_metrics_incident_db_error(client):
     """GET /api/v1/metrics/oncall handles DB error in incident query gracefully."""
-    fake_esc_count = {"cnt": 3}
+    fake_esc_count = {"cnt": 3, "by_team": {}}
 
-    # 1) escalation count OK, 2) incident query FAIL
+    # 1) metrics view empty, 2) escalation count OK, 3) incident query FAIL
     with patch(
         "app.routers.api.get_db_connection",
-        fake_connection([fake_esc_count, Exception("DB down")]),
+        fake_connection([None, fake_esc_count, Exception("DB down")]),
     ):
         resp = await client.get("/api/v1/metrics/oncall")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total_escalations"] == 3
     assert body["total_incidents"] == 0
 
 
-@pytest.mark.asyncio
+def _analytics_client(response):
+    """Shared HTTP client stub whose ``get`` returns *response*."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    client = MagicMock()
+    client.get = AsyncMock(return_value=response)
+    return client
+
+
 async def test_oncall_metrics_full_data(client):
     """GET /api/v1/metrics/oncall returns full metrics when all queries succeed."""
-    fake_esc_count = {"cnt": 10}
-    fake_esc_by_team = [{"team": "platform", "cnt": 7}]
+    fake_esc_counts = {"cnt": 10, "by_team": {"platform": 7}}
 
     from contextlib import contextmanager
     from unittest.mock import MagicMock
 
     @contextmanager
-    def _fake_conn(autocommit=False):
+    def _fake_conn(autocommit=False, readonly=False):
         conn = MagicMock()
 
         @contextmanager
         def _cur():
             cur = MagicMock()
-            # Only one DB block now: escalation count + by-team
-            cur.fetchone.return_value = fake_esc_count
-            cur.fetchall.return_value = fake_esc_by_team
+            # One query returns both the total and the by-team counts
+            cur.fetchone.return_value = fake_esc_counts
             yield cur
 
         conn.cursor = _cur
         yield conn
 
-    # Mock the httpx.get call to incident analytics API
+    # Mock the shared-client call to the incident analytics API
     fake_analytics_response = MagicMock()
     fake_analytics_response.status_code = 200
     fake_analytics_response.json.return_value = {
@@ -1444,32 +1488,36 @@ async def test_oncall_metrics_full_data(client):
         "avg_mttr_seconds": 600.0,
         "by_severity": {},
         "by_service": {},
+        "oncall_load": {"alice@example.com": 4},
     }
 
-    with patch("app.routers.api.get_db_connection", _fake_conn):
-        with patch("httpx.get", return_value=fake_analytics_response):
+    with (
+        patch("app.routers.api.get_db_connection", _fake_conn),
+        patch("app.routers.api._read_metrics_summary", return_value=None),
+    ):
+        with patch("app.routers.api.get_http_client", return_value=_analytics_client(fake_analytics_response)):
             resp = await client.get("/api/v1/metrics/oncall")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total_escalations"] == 10
     assert body["total_incidents"] == 100
     assert body["avg_mtta_seconds"] == 120.5
     assert body["avg_mttr_seconds"] == 600.0
     assert body["escalation_rate_pct"] == 10.0
     assert body["by_team"]["platform"] == 7
+    assert body["oncall_load"] == {"alice@example.com": 4}
 
 
-@pytest.mark.asyncio
 async def test_oncall_metrics_zero_incidents(client):
     """GET /api/v1/metrics/oncall handles zero total incidents (no divide-by-zero)."""
     from contextlib import contextmanager
     from unittest.mock import MagicMock
 
-    fake_esc_count = {"cnt": 0}
+    fake_esc_count = {"cnt": 0, "by_team": {}}
 
     @contextmanager
-    def _fake_conn(autocommit=False):
+    def _fake_conn(autocommit=False, readonly=False):
         conn = MagicMock()
 
         @contextmanager
@@ -1482,7 +1530,7 @@ async def test_oncall_metrics_zero_incidents(client):
         conn.cursor = _cur
         yield conn
 
-    # Mock the httpx.get call to incident analytics API
+    # Mock the shared-client call to the incident analytics API
     fake_analytics_response = MagicMock()
     fake_analytics_response.status_code = 200
     fake_analytics_response.json.return_value = {
@@ -1496,12 +1544,15 @@ async def test_oncall_metrics_zero_incidents(client):
         "by_service": {},
     }
 
-    with patch("app.routers.api.get_db_connection", _fake_conn):
-        with patch("httpx.get", return_value=fake_analytics_response):
+    with (
+        patch("app.routers.api.get_db_connection", _fake_conn),
+        patch("app.routers.api._read_metrics_summary", return_value=None),
+    ):
+        with patch("app.routers.api.get_http_client", return_value=_analytics_client(fake_analytics_response)):
             resp = await client.get("/api/v1/metrics/oncall")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["escalation_rate_pct"] is None
     assert body["avg_mtta_seconds"] is None
 
@@ -1511,17 +1562,14 @@ async def test_oncall_metrics_zero_incidents(client):
 # ══════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
-async def test_get_current_oncall_empty_engineers_json_string(client):
-    """GET /api/v1/oncall/current returns 404 when engineers is JSON string '[]'."""
+async def test_get_current_oncall_empty_engineers_json_null(client):
+    """GET /api/v1/oncall/current returns 404 when the primary is JSON 'null'."""
     fake_schedule = {
         "id": str(uuid.uuid4()),
-        "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": "[]",  # valid JSON string that parses to empty list
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "primary_engineer": None,  # JSON 'null' as decoded by the driver
+        "secondary_engineer": None,
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_schedule])):
@@ -1529,7 +1577,6 @@ async def test_get_current_oncall_empty_engineers_json_string(client):
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_escalate_no_to_engineer(client):
     """POST /api/v1/escalate returns 422 when to_engineer resolves to empty."""
     from app.config import settings as _s
@@ -1538,65 +1585,56 @@ async def test_escalate_no_to_engineer(client):
         "id": str(uuid.uuid4()),
         "team": "solo",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
+        "start_date": _DATE_2026_01_01,
         "engineers": [
             {"name": "Alice", "email": "alice@example.com", "primary": True},
         ],
         "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_schedule])):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            with patch.object(_s, "MANAGER_EMAIL", ""):
-                resp = await client.post(
-                    "/api/v1/escalate",
-                    json={"incident_id": "inc-no-target", "team": "solo"},
-                )
+        with patch.object(_s, "MANAGER_EMAIL", ""):
+            resp = await client.post(
+                "/api/v1/escalate",
+                json={"incident_id": "inc-no-target", "team": "solo"},
+            )
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_escalate_timer_uses_policy_wait(client, sample_escalate_payload):
-    """POST /api/v1/escalate _start_escalation_timer reads wait_minutes from policy."""
-    fake_schedule = {
-        "id": str(uuid.uuid4()),
-        "team": "platform",
-        "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
-        "engineers": [
-            {"name": "Alice", "email": "alice@example.com", "primary": True},
-            {"name": "Bob", "email": "bob@example.com", "primary": False},
-        ],
-        "escalation_minutes": 5,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
-    }
-
-    timer_policy = {"wait_minutes": 15}
+async def test_escalate_writes_in_one_statement(client, sample_escalate_payload):
+    """POST /api/v1/escalate records, retires and re-arms timers in a single prepared statement."""
+    fake_schedule = _PLATFORM_SCHEDULE
 
-    # 1) schedule, 2) insert esc, 3) deactivate timer, 4) timer policy FOUND, 5) timer insert
-    with patch(
-        "app.routers.api.get_db_connection",
-        fake_connection([fake_schedule, None, None, timer_policy, None]),
+    # 1) schedule, 2) escalation + timer hand-over + next-level timer
+    with (
+        patch("app.routers.api.get_db_connection", fake_connection([fake_schedule, None])),
+        patch("app.routers.api.execute_prepared") as prepared,
     ):
-        with patch("app.routers.api.httpx.AsyncClient", FakeAsyncClient):
-            resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+        resp = await client.post("/api/v1/escalate", json=sample_escalate_payload)
+
     assert resp.status_code == 201
+    names = [c.args[1] for c in prepared.call_args_list]
+    assert names == ["oncall_latest_schedule", "oncall_record_escalation"]
+    params = prepared.call_args_list[1].args[3]
+    assert params[0] == rjson(resp)["escalation_id"]
+    assert params[1] == "inc-test-123"
+    assert params[4] == 1
+    # The next-level wait falls back to the default when the policy has no such level
+    assert params[9] == 5
 
 
 # ── POST /api/v1/schedules -- invalid timezone ──────────────────
 
 
-@pytest.mark.asyncio
 async def test_create_schedule_invalid_timezone(client, sample_schedule_payload):
     """POST /api/v1/schedules rejects an invalid timezone string."""
     payload = {**sample_schedule_payload, "timezone": "Invalid/TZ"}
     resp = await client.post("/api/v1/schedules", json=payload)
     assert resp.status_code == 400
-    assert "Invalid timezone" in resp.json()["detail"]
+    assert "Invalid timezone" in rjson(resp)["detail"]
 
 
-@pytest.mark.asyncio
 async def test_create_schedule_with_handoff_and_timezone(client, sample_schedule_payload):
     """POST /api/v1/schedules with handoff_hour and timezone returns both fields."""
     payload = {**sample_schedule_payload, "handoff_hour": 8, "timezone": "US/Eastern"}
@@ -1604,7 +1642,7 @@ async def test_create_schedule_with_handoff_and_timezone(client, sample_schedule
         "id": str(uuid.uuid4()),
         "team": "platform",
         "rotation_type": "weekly",
-        "start_date": date(2026, 1, 1),
+        "start_date": _DATE_2026_01_01,
         "engineers": [
             {"name": "Alice Engineer", "email": "alice@example.com", "primary": True},
             {"name": "Bob Developer", "email": "bob@example.com", "primary": False},
@@ -1612,19 +1650,18 @@ async def test_create_schedule_with_handoff_and_timezone(client, sample_schedule
         "escalation_minutes": 5,
         "handoff_hour": 8,
         "timezone": "US/Eastern",
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
     with patch("app.routers.api.get_db_connection", fake_connection([fake_row])):
         resp = await client.post("/api/v1/schedules", json=payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["handoff_hour"] == 8
     assert body["timezone"] == "US/Eastern"
 
 
-@pytest.mark.asyncio
 async def test_create_schedule_reraises_http_exception(client, sample_schedule_payload):
     """Ensure HTTPException from timezone check is re-raised, not wrapped as 500."""
     payload = {**sample_schedule_payload, "timezone": "Fake/Zone"}
@@ -1635,7 +1672,6 @@ async def test_create_schedule_reraises_http_exception(client, sample_schedule_p
 # ── POST /api/v1/timers/start ─────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_start_timer_success(client):
     """POST /api/v1/timers/start creates a timer with default wait."""
     timer_payload = {
@@ -1650,7 +1686,7 @@ async def test_start_timer_success(client):
         resp = await client.post("/api/v1/timers/start", json=timer_payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["incident_id"] == "inc-timer-001"
     assert body["team"] == "platform"
     assert body["assigned_to"] == "alice@example.com"
@@ -1658,7 +1694,22 @@ async def test_start_timer_success(client):
     assert "escalate_after" in body
 
 
-@pytest.mark.asyncio
+async def test_start_timer_wakes_escalation_loop(client):
+    """Starting a timer signals the escalation loop and brings the next due time forward."""
+    from app.routers import api as api_mod
+
+    api_mod.next_timer_due = datetime.now(timezone.utc) + timedelta(hours=1)
+    with patch("app.routers.api.get_db_connection", fake_connection([None, None])):
+        resp = await client.post(
+            "/api/v1/timers/start",
+            json={"incident_id": "inc-wake", "team": "platform", "assigned_to": "alice@example.com"},
+        )
+
+    assert resp.status_code == 201
+    assert api_mod.timer_added.is_set()
+    assert api_mod.next_timer_due == datetime.fromisoformat(rjson(resp)["escalate_after"])
+
+
 async def test_start_timer_with_policy(client):
     """POST /api/v1/timers/start uses policy wait_minutes when present."""
     timer_payload = {
@@ -1674,11 +1725,81 @@ async def test_start_timer_with_policy(client):
         resp = await client.post("/api/v1/timers/start", json=timer_payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    body = rjson(resp)
     assert body["current_level"] == 1
 
 
-@pytest.mark.asyncio
+def test_policy_level_is_cached():
+    """_policy_level queries once per (team, level) and serves repeats from the cache."""
+    from unittest.mock import MagicMock
+
+    from app.routers.api import _policy_level
+
+    cur = MagicMock()
+    cur.connection.prepared = set()
+    cur.fetchone.return_value = {"wait_minutes": 15, "notify_target": "secondary"}
+
+    assert _policy_level(cur, "platform", 1)["wait_minutes"] == 15
+    assert _policy_level(cur, "platform", 1)["wait_minutes"] == 15
+    assert cur.fetchone.call_count == 1
+
+    # Unconfigured levels are cached too
+    cur.fetchone.return_value = None
+    assert _policy_level(cur, "platform", 2) is None
+    assert _policy_level(cur, "platform", 2) is None
+    assert cur.fetchone.call_count == 2
+
+
+def test_policy_cache_expires():
+    """Cached policies are re-read once the TTL has passed."""
+    import app.routers.api as api_mod
+
+    api_mod._cache_policy("platform", 1, {"wait_minutes": 5, "notify_target": "secondary"})
+    assert api_mod._cached_policy("platform", 1)[0] is True
+
+    with patch("app.routers.api.time.monotonic", return_value=time.monotonic() + api_mod._POLICY_CACHE_TTL + 1):
+        assert api_mod._cached_policy("platform", 1) == (False, None)
+
+
+async def test_create_escalation_policy_invalidates_cache(client, sample_policy_payload):
+    """POST /api/v1/escalation-policies drops the cached levels of that team only."""
+    import app.routers.api as api_mod
+
+    api_mod._cache_policy("platform", 1, {"wait_minutes": 1, "notify_target": "manager"})
+    api_mod._cache_policy("backend", 1, {"wait_minutes": 1, "notify_target": "manager"})
+
+    with patch("app.routers.api.get_db_connection", fake_connection([None])):
+        resp = await client.post("/api/v1/escalation-policies", json=sample_policy_payload)
+
+    assert resp.status_code == 201
+    assert ("platform", 1) not in api_mod._policy_cache
+    assert ("backend", 1) in api_mod._policy_cache
+
+
+async def test_start_timer_cached_policy_skips_lookup_connection(client):
+    """POST /api/v1/timers/start takes no lookup connection when the level-1 policy is cached."""
+    import app.routers.api as api_mod
+
+    api_mod._cache_policy("platform", 1, {"wait_minutes": 30, "notify_target": "secondary"})
+    calls = []
+    inner = fake_connection([None])
+
+    def _recording(**kwargs):
+        calls.append(kwargs)
+        return inner(**kwargs)
+
+    with patch("app.routers.api.get_db_connection", _recording):
+        resp = await client.post(
+            "/api/v1/timers/start",
+            json={"incident_id": "inc-cached", "team": "platform", "assigned_to": "alice@example.com"},
+        )
+
+    assert resp.status_code == 201
+    assert calls == [{"autocommit": True}]
+    escalate_after = datetime.fromisoformat(rjson(resp)["escalate_after"])
+    assert timedelta(minutes=29) < escalate_after - datetime.now(timezone.utc) <= timedelta(minutes=30)
+
+
 async def test_start_timer_policy_db_error(client):
     """POST /api/v1/timers/start handles policy lookup DB error gracefully."""
     timer_payload = {
@@ -1695,7 +1816,6 @@ async def test_start_timer_policy_db_error(client):
     assert resp.status_code == 201
 
 
-@pytest.mark.asyncio
 async def test_start_timer_insert_db_error(client):
     """POST /api/v1/timers/start returns 500 on timer INSERT failure."""
     timer_payload = {
@@ -1715,7 +1835,6 @@ async def test_start_timer_insert_db_error(client):
 # ── POST /api/v1/timers/cancel ────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_cancel_timer_success(client):
     """POST /api/v1/timers/cancel deactivates timer(s) and returns count."""
     cancel_payload = {"incident_id": "inc-timer-001"}
@@ -1726,12 +1845,11 @@ async def test_cancel_timer_success(client):
         resp = await client.post("/api/v1/timers/cancel", json=cancel_payload)
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["incident_id"] == "inc-timer-001"
     assert body["cancelled_count"] == 1
 
 
-@pytest.mark.asyncio
 async def test_cancel_timer_none_active(client):
     """POST /api/v1/timers/cancel with no active timer returns count 0."""
     cancel_payload = {"incident_id": "inc-nonexistent"}
@@ -1740,11 +1858,29 @@ async def test_cancel_timer_none_active(client):
         resp = await client.post("/api/v1/timers/cancel", json=cancel_payload)
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["cancelled_count"] == 0
 
 
-@pytest.mark.asyncio
+async def test_timer_writes_use_prepared_statements(client):
+    """Starting and cancelling timers run their writes as prepared statements."""
+    with (
+        patch("app.routers.api.get_db_connection", fake_connection([None, None, []])),
+        patch("app.routers.api.execute_prepared") as prepared,
+    ):
+        started = await client.post(
+            "/api/v1/timers/start",
+            json={"incident_id": "inc-prep", "team": "platform", "assigned_to": "alice@example.com"},
+        )
+        cancelled = await client.post("/api/v1/timers/cancel", json={"incident_id": "inc-prep"})
+
+    assert started.status_code == 201
+    assert cancelled.status_code == 200
+    names = [c.args[1] for c in prepared.call_args_list]
+    assert names == ["oncall_policy_level", "oncall_insert_timer", "oncall_cancel_timers"]
+    assert prepared.call_args_list[1].args[3][0] == rjson(started)["timer_id"]
+
+
 async def test_cancel_timer_db_error(client):
     """POST /api/v1/timers/cancel returns 500 on DB error."""
     cancel_payload = {"incident_id": "inc-timer-001"}
@@ -1758,7 +1894,6 @@ async def test_cancel_timer_db_error(client):
 # ── GET /api/v1/timers ────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_timers(client):
     """GET /api/v1/timers returns active timers."""
     fake_timers = [
@@ -1777,23 +1912,21 @@ async def test_list_timers(client):
         resp = await client.get("/api/v1/timers")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 1
     assert body["timers"][0]["incident_id"] == "inc-t-001"
 
 
-@pytest.mark.asyncio
 async def test_list_timers_with_team_filter(client):
     """GET /api/v1/timers?team=platform filters by team."""
     with patch("app.routers.api.get_db_connection", fake_connection([[]])):
         resp = await client.get("/api/v1/timers?team=platform")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 0
 
 
-@pytest.mark.asyncio
 async def test_list_timers_with_incident_filter(client):
     """GET /api/v1/timers?incident_id=inc-x filters by incident."""
     with patch("app.routers.api.get_db_connection", fake_connection([[]])):
@@ -1802,7 +1935,6 @@ async def test_list_timers_with_incident_filter(client):
     assert resp.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_list_timers_with_both_filters(client):
     """GET /api/v1/timers?team=x&incident_id=y accepts both filters."""
     with patch("app.routers.api.get_db_connection", fake_connection([[]])):
@@ -1811,7 +1943,6 @@ async def test_list_timers_with_both_filters(client):
     assert resp.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_list_timers_db_error(client):
     """GET /api/v1/timers returns 500 on DB error."""
     with patch("app.routers.api.get_db_connection", fake_connection([Exception("DB")])):
@@ -1823,7 +1954,6 @@ async def test_list_timers_db_error(client):
 # ── POST /api/v1/schedules/{id}/members ──────────────────────
 
 
-@pytest.mark.asyncio
 async def test_add_schedule_member_success(client):
     """POST /api/v1/schedules/{id}/members creates a member."""
     schedule_id = str(uuid.uuid4())
@@ -1833,7 +1963,6 @@ async def test_add_schedule_member_success(client):
         "position": 1,
     }
 
-    fake_schedule = {"id": schedule_id}
     fake_member_row = {
         "id": str(uuid.uuid4()),
         "schedule_id": schedule_id,
@@ -1841,24 +1970,21 @@ async def test_add_schedule_member_success(client):
         "user_email": "alice@example.com",
         "position": 1,
         "is_active": True,
-        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": _TS_2026_01_01,
     }
 
-    # Call 1: check schedule exists (fetchone), Call 2: INSERT member (fetchone)
-    with patch(
-        "app.routers.api.get_db_connection",
-        fake_connection([fake_schedule, fake_member_row]),
-    ):
+    # Single INSERT ... RETURNING; the foreign key checks the schedule exists
+    with patch("app.routers.api.get_db_connection", side_effect=fake_connection([fake_member_row])) as get_conn:
         resp = await client.post(f"/api/v1/schedules/{schedule_id}/members", json=member_payload)
 
     assert resp.status_code == 201
-    body = resp.json()
+    assert get_conn.call_count == 1
+    body = rjson(resp)
     assert body["user_name"] == "Alice Engineer"
     assert body["position"] == 1
     assert body["is_active"] is True
 
 
-@pytest.mark.asyncio
 async def test_add_schedule_member_schedule_not_found(client):
     """POST /api/v1/schedules/{id}/members returns 404 for unknown schedule."""
     schedule_id = str(uuid.uuid4())
@@ -1868,14 +1994,15 @@ async def test_add_schedule_member_schedule_not_found(client):
         "position": 1,
     }
 
-    # fetchone returns None (schedule not found)
-    with patch("app.routers.api.get_db_connection", fake_connection([None])):
+    from psycopg2.errors import ForeignKeyViolation
+
+    # The INSERT violates the schedule_id foreign key
+    with patch("app.routers.api.get_db_connection", fake_connection([ForeignKeyViolation("no schedule")])):
         resp = await client.post(f"/api/v1/schedules/{schedule_id}/members", json=member_payload)
 
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_add_schedule_member_db_error(client):
     """POST /api/v1/schedules/{id}/members returns 500 on DB error."""
     schedule_id = str(uuid.uuid4())
@@ -1894,7 +2021,6 @@ async def test_add_schedule_member_db_error(client):
 # ── GET /api/v1/schedules/{id}/members ───────────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_schedule_members(client):
     """GET /api/v1/schedules/{id}/members returns members list."""
     schedule_id = str(uuid.uuid4())
@@ -1906,7 +2032,7 @@ async def test_list_schedule_members(client):
             "user_email": "alice@example.com",
             "position": 1,
             "is_active": True,
-            "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "created_at": _TS_2026_01_01,
         },
         {
             "id": str(uuid.uuid4()),
@@ -1915,7 +2041,7 @@ async def test_list_schedule_members(client):
             "user_email": "bob@example.com",
             "position": 2,
             "is_active": True,
-            "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "created_at": _TS_2026_01_01,
         },
     ]
 
@@ -1923,13 +2049,12 @@ async def test_list_schedule_members(client):
         resp = await client.get(f"/api/v1/schedules/{schedule_id}/members")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 2
     assert body["members"][0]["user_name"] == "Alice"
     assert body["members"][1]["position"] == 2
 
 
-@pytest.mark.asyncio
 async def test_list_schedule_members_empty(client):
     """GET /api/v1/schedules/{id}/members returns empty list."""
     schedule_id = str(uuid.uuid4())
@@ -1938,12 +2063,11 @@ async def test_list_schedule_members_empty(client):
         resp = await client.get(f"/api/v1/schedules/{schedule_id}/members")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total"] == 0
     assert body["members"] == []
 
 
-@pytest.mark.asyncio
 async def test_list_schedule_members_db_error(client):
     """GET /api/v1/schedules/{id}/members returns 500 on DB error."""
     schedule_id = str(uuid.uuid4())
@@ -1957,7 +2081,6 @@ async def test_list_schedule_members_db_error(client):
 # ── DELETE /api/v1/schedules/{schedule_id} ────────────────────
 
 
-@pytest.mark.asyncio
 async def test_delete_schedule_success(client):
     """DELETE existing schedule → 204."""
     schedule_id = str(uuid.uuid4())
@@ -1970,7 +2093,6 @@ async def test_delete_schedule_success(client):
     assert resp.status_code == 204
 
 
-@pytest.mark.asyncio
 async def test_delete_schedule_not_found(client):
     """DELETE non-existent schedule → 404."""
     schedule_id = str(uuid.uuid4())
@@ -1983,7 +2105,6 @@ async def test_delete_schedule_not_found(client):
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_delete_schedule_db_error(client):
     """DELETE schedule DB error → 500."""
     schedule_id = str(uuid.uuid4())
@@ -1996,16 +2117,15 @@ async def test_delete_schedule_db_error(client):
 # ── Metrics: analytics API non-200 ───────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_oncall_metrics_analytics_api_non_200(client):
     """GET /api/v1/metrics/oncall handles non-200 from incident analytics API."""
     from contextlib import contextmanager
     from unittest.mock import MagicMock as _MagicMock
 
-    fake_esc_count = {"cnt": 2}
+    fake_esc_count = {"cnt": 2, "by_team": {}}
 
     @contextmanager
-    def _fake_conn(autocommit=False):
+    def _fake_conn(autocommit=False, readonly=False):
         conn = _MagicMock()
 
         @contextmanager
@@ -2021,11 +2141,239 @@ async def test_oncall_metrics_analytics_api_non_200(client):
     fake_resp = _MagicMock()
     fake_resp.status_code = 500
 
-    with patch("app.routers.api.get_db_connection", _fake_conn):
-        with patch("httpx.get", return_value=fake_resp):
+    with (
+        patch("app.routers.api.get_db_connection", _fake_conn),
+        patch("app.routers.api._read_metrics_summary", return_value=None),
+    ):
+        with patch("app.routers.api.get_http_client", return_value=_analytics_client(fake_resp)):
             resp = await client.get("/api/v1/metrics/oncall")
 
     assert resp.status_code == 200
-    body = resp.json()
+    body = rjson(resp)
     assert body["total_escalations"] == 2
     assert body["total_incidents"] == 0
+
+
+# ── Metrics: pre-aggregated summary ──────────────────────────
+
+
+async def test_oncall_metrics_from_summary(client):
+    """GET /api/v1/metrics/oncall serves escalation counts from the incremental summary."""
+    from decimal import Decimal
+    from unittest.mock import MagicMock
+
+    fake_summary = {"total_escalations": Decimal(4), "by_team": {"platform": 4}, "staleness_seconds": Decimal("12.345")}
+    fake_resp = MagicMock()
+    fake_resp.status_code = 500
+
+    with patch("app.routers.api.get_db_connection", fake_connection([fake_summary])):
+        with patch("app.routers.api.get_http_client", return_value=_analytics_client(fake_resp)):
+            resp = await client.get("/api/v1/metrics/oncall")
+
+    assert resp.status_code == 200
+    body = rjson(resp)
+    assert body["total_escalations"] == 4
+    assert body["by_team"] == {"platform": 4}
+    assert body["staleness_seconds"] == 12.35
+
+
+def test_apply_metrics_log_failure_disables_summary():
+    """A failed delta apply makes the metrics endpoint fall back to live queries."""
+    from unittest.mock import MagicMock
+
+    import app.routers.api as api_mod
+
+    with patch("app.routers.api._metrics_summary_fresh", True):
+        with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
+            api_mod.apply_metrics_log()
+        assert api_mod._metrics_summary_fresh is False
+        assert api_mod._read_metrics_summary(MagicMock()) is None
+
+        with patch("app.routers.api.get_db_connection", fake_connection([None])):
+            api_mod.apply_metrics_log()
+        assert api_mod._metrics_summary_fresh is True
+
+
+def test_refresh_oncall_gauge_replaces_label_set():
+    """refresh_oncall_gauge publishes every team's pair and drops engineers who rotated off."""
+    import app.routers.api as api_mod
+    from prometheus_client import REGISTRY
+
+    def _value(team, engineer, role):
+        return REGISTRY.get_sample_value("oncall_current", {"team": team, "engineer": engineer, "role": role})
+
+    api_mod.oncall_current.labels(team="platform", engineer="old@example.com", role="primary").set(1)
+    rows = [
+        {
+            "team": "platform",
+            "primary_engineer": {"name": "Alice", "email": "alice@example.com"},
+            "secondary_engineer": {"name": "Bob", "email": "bob@example.com"},
+        },
+        {
+            "team": "solo",
+            "primary_engineer": {"name": "Carol", "email": "carol@example.com"},
+            "secondary_engineer": None,
+        },
+    ]
+    with patch("app.routers.api.get_db_connection", fake_connection([rows])):
+        api_mod.refresh_oncall_gauge()
+
+    assert _value("platform", "alice@example.com", "primary") == 1
+    assert _value("platform", "bob@example.com", "secondary") == 1
+    assert _value("solo", "carol@example.com", "primary") == 1
+    assert _value("platform", "old@example.com", "primary") is None
+
+
+def test_refresh_oncall_gauge_db_error_keeps_gauge():
+    """A failed refresh leaves the last published gauge in place."""
+    import app.routers.api as api_mod
+    from prometheus_client import REGISTRY
+
+    api_mod.oncall_current.labels(team="platform", engineer="alice@example.com", role="primary").set(1)
+    with patch("app.routers.api.get_db_connection", side_effect=Exception("DB down")):
+        api_mod.refresh_oncall_gauge()
+
+    labels = {"team": "platform", "engineer": "alice@example.com", "role": "primary"}
+    assert REGISTRY.get_sample_value("oncall_current", labels) == 1
+
+
+async def test_refresh_oncall_metrics_publishes_snapshot():
+    """refresh_oncall_metrics updates the scrape snapshot and primes the /metrics/oncall cache."""
+    from unittest.mock import AsyncMock
+
+    import app.routers.api as api_mod
+    from prometheus_client import REGISTRY
+
+    with (
+        patch("app.routers.api._escalation_metrics", return_value={"total_escalations": 3, "by_team": {"ops": 3}}),
+        patch("app.routers.api._incident_metrics", AsyncMock(return_value={"oncall_load": {"dana@example.com": 2}})),
+    ):
+        await api_mod.refresh_oncall_metrics()
+
+    assert REGISTRY.get_sample_value("oncall_escalations_by_team", {"team": "ops"}) == 3
+    assert REGISTRY.get_sample_value("oncall_engineer_load", {"engineer": "dana@example.com"}) == 2
+    assert api_mod._metrics_cache[1].total_escalations == 3
+
+
+def test_read_metrics_summary_error_returns_none():
+    """A failing summary query is reported as unavailable rather than raised."""
+    from unittest.mock import MagicMock
+
+    import app.routers.api as api_mod
+
+    cur = MagicMock()
+    cur.execute.side_effect = Exception("relation does not exist")
+    with patch("app.routers.api._metrics_summary_fresh", True):
+        assert api_mod._read_metrics_summary(cur) is None
+
+
+async def test_oncall_metrics_cached_within_ttl(client):
+    """Repeated GET /api/v1/metrics/oncall calls within the TTL reuse the cached result."""
+    from app.models import OnCallMetrics
+
+    with patch("app.routers.api._collect_oncall_metrics", return_value=OnCallMetrics(total_escalations=3)) as collect:
+        first = await client.get("/api/v1/metrics/oncall")
+        second = await client.get("/api/v1/metrics/oncall")
+
+    assert rjson(first) == rjson(second)
+    assert rjson(second)["total_escalations"] == 3
+    collect.assert_called_once()
+
+
+async def test_oncall_metrics_cache_disabled(client):
+    """METRICS_CACHE_TTL=0 recomputes the metrics on every request."""
+    from app.models import OnCallMetrics
+
+    with (
+        patch("app.routers.api.settings.METRICS_CACHE_TTL", 0),
+        patch("app.routers.api._collect_oncall_metrics", return_value=OnCallMetrics(total_escalations=3)) as collect,
+    ):
+        await client.get("/api/v1/metrics/oncall")
+        await client.get("/api/v1/metrics/oncall")
+
+    assert collect.call_count == 2
+
+
+# ── http_client fallback ─────────────────────────────────────
+
+
+def test_http_client_fallback():
+    """get_http_client() creates the shared client once when not initialised."""
+    import app.http_client as hc
+
+    original = hc._client
+    try:
+        hc._client = None
+        c = hc.get_http_client()
+        assert c is not None
+        assert hc.get_http_client() is c
+        assert hc._client is c
+    finally:
+        hc._client = original
+
+
+async def test_close_http_client_closes_lazy_client():
+    """close_http_client() closes a client created on first use."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    import app.http_client as hc
+
+    created = MagicMock()
+    created.aclose = AsyncMock()
+    with patch("app.http_client.httpx.AsyncClient", return_value=created):
+        assert hc.get_http_client() is created
+    await hc.close_http_client()
+    created.aclose.assert_awaited_once()
+    assert hc._client is None
+
+
+def test_http_client_returns_existing():
+    """get_http_client() returns the shared client when initialised."""
+    import app.http_client as hc
+
+    sentinel = object()
+    original = hc._client
+    try:
+        hc._client = sentinel
+        assert hc.get_http_client() is sentinel
+    finally:
+        hc._client = original
+
+
+async def test_notify_engineer_uses_shared_client():
+    """_notify_engineer posts through the shared client instead of opening a new one."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    import app.http_client as hc
+    from app.routers.api import _notify_engineer
+
+    shared = MagicMock()
+    shared.post = AsyncMock(return_value=MagicMock(status_code=200))
+    original = hc._client
+    try:
+        hc._client = shared
+        with patch("app.http_client.httpx.AsyncClient") as ctor:
+            await _notify_engineer("inc-1", "bob@example.com", "hello", "platform")
+        ctor.assert_not_called()
+    finally:
+        hc._client = original
+    shared.post.assert_awaited_once()
+
+
+async def test_bounded_limits_concurrency():
+    """_bounded never lets more coroutines run at once than the semaphore allows."""
+    import asyncio
+
+    from app.routers.api import _bounded
+
+    running = {"now": 0, "peak": 0}
+
+    async def _work():
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0)
+        running["now"] -= 1
+
+    sem = asyncio.Semaphore(2)
+    await asyncio.gather(*(_bounded(sem, _work()) for _ in range(6)))
+    assert running["peak"] == 2
@@ -13,11 +13,23 @@ def test_settings_loads_defaults():
     assert settings.SERVICE_NAME == "oncall-service"
     assert settings.SERVICE_PORT == 8003
     assert settings.APP_VERSION == "1.0.0"
-    assert settings.DB_POOL_MIN == 1
-    assert settings.DB_POOL_MAX == 10
+    assert settings.DB_POOL_MIN == 5
+    assert settings.DB_POOL_MAX == 25
+    assert settings.DB_POOL_TIMEOUT == 5.0
     assert settings.DEFAULT_ESCALATION_MINUTES == 5
     assert settings.MANAGER_EMAIL == "admin@expertmind.local"
     assert settings.ESCALATION_LOOP_COUNT == 2
+    assert settings.ESCALATION_CHECK_BATCH_SIZE == 1000
+    assert settings.ESCALATION_CHECK_INTERVAL_SECONDS == 10.0
+    assert settings.ESCALATION_CHECK_MAX_INTERVAL_SECONDS == 300.0
+    assert settings.TIMER_LISTENER_RETRY_SECONDS == 30.0
+    assert settings.METRICS_CACHE_TTL == 15.0
+    assert settings.ONCALL_CACHE_MAX_AGE == 60
+    assert settings.HEALTH_CACHE_TTL == 5.0
+    assert settings.HEALTH_PSUTIL_INTERVAL == 2.0
+    assert settings.HEALTH_READY_CACHE_TTL == 2.0
+    assert settings.HEALTH_DB_TIMEOUT == 1.0
+    assert settings.HEALTH_DB_BACKOFF_MAX == 30.0
 
 
 def test_settings_cors_origin_list():
@@ -1,5 +1,6 @@
 """Tests for app/database.py -- pool lifecycle, get_db_connection, health check."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -97,6 +98,70 @@ def test_get_db_connection_autocommit():
         mock_pool.putconn.assert_called_once_with(mock_conn)
 
 
+def test_get_db_connection_readonly():
+    """get_db_connection(readonly=True) runs the block in autocommit without extra statements."""
+    mock_pool = MagicMock()
+    mock_conn = MagicMock(closed=0)
+    mock_conn.autocommit = False
+    mock_pool.getconn.return_value = mock_conn
+
+    with patch("app.database.get_pool", return_value=mock_pool):
+        from app.database import get_db_connection
+
+        with get_db_connection(readonly=True) as conn:
+            assert conn.autocommit is True
+
+        mock_conn.cursor.assert_not_called()
+        assert mock_conn.autocommit is False
+        mock_conn.commit.assert_not_called()
+        mock_pool.putconn.assert_called_once_with(mock_conn)
+
+
+def test_get_db_connection_waits_for_free_slot():
+    """get_db_connection fails with PoolError only after DB_POOL_TIMEOUT when every slot is taken."""
+    import threading
+
+    import app.database as db_mod
+    from psycopg2.pool import PoolError
+
+    mock_pool = MagicMock()
+    with (
+        patch("app.database.get_pool", return_value=mock_pool),
+        patch.object(db_mod, "_pool_slots", threading.BoundedSemaphore(1)),
+        patch.object(db_mod.settings, "DB_POOL_TIMEOUT", 0.01),
+    ):
+        with db_mod.get_db_connection():
+            with pytest.raises(PoolError):
+                with db_mod.get_db_connection():
+                    pass
+        # The slot is free again once the first connection is released
+        with db_mod.get_db_connection():
+            pass
+
+    assert mock_pool.getconn.call_count == 2
+
+
+def test_get_db_connection_timeout_overrides_pool_wait():
+    """An explicit timeout replaces DB_POOL_TIMEOUT as the wait for a free slot."""
+    import threading
+
+    import app.database as db_mod
+    from psycopg2.pool import PoolError
+
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    with (
+        patch("app.database.get_pool", return_value=MagicMock()),
+        patch.object(db_mod, "_pool_slots", slots),
+        patch.object(db_mod.settings, "DB_POOL_TIMEOUT", 60),
+    ):
+        start = time.monotonic()
+        with pytest.raises(PoolError):
+            with db_mod.get_db_connection(timeout=0.01):
+                pass
+        assert time.monotonic() - start < 1
+
+
 def test_get_db_connection_rollback_on_error():
     """get_db_connection rolls back and re-raises on error inside the block."""
     mock_pool = MagicMock()
@@ -113,3 +178,50 @@ def test_get_db_connection_rollback_on_error():
         mock_conn.rollback.assert_called_once()
         mock_conn.commit.assert_not_called()
         mock_pool.putconn.assert_called_once_with(mock_conn)
+
+
+# ── execute_prepared ──────────────────────────────────────────
+
+
+def test_execute_prepared_prepares_once_per_connection():
+    """execute_prepared issues PREPARE only the first time a name is used."""
+    from app.database import execute_prepared
+
+    cur = MagicMock()
+    cur.connection.prepared = set()
+
+    execute_prepared(cur, "q_team", "SELECT * FROM t WHERE team = $1", ("platform",))
+    execute_prepared(cur, "q_team", "SELECT * FROM t WHERE team = $1", ("backend",))
+
+    calls = [c.args for c in cur.execute.call_args_list]
+    assert calls == [
+        ("PREPARE q_team AS SELECT * FROM t WHERE team = $1",),
+        ("EXECUTE q_team (%s)", ("platform",)),
+        ("EXECUTE q_team (%s)", ("backend",)),
+    ]
+
+
+def test_execute_prepared_without_params():
+    """execute_prepared runs a bare EXECUTE for parameterless statements."""
+    from app.database import execute_prepared
+
+    cur = MagicMock()
+    cur.connection.prepared = {"q_total"}
+
+    execute_prepared(cur, "q_total", "SELECT COUNT(*) FROM t")
+
+    cur.execute.assert_called_once_with("EXECUTE q_total")
+
+
+# ── json/jsonb decoding ───────────────────────────────────────
+
+
+@pytest.mark.parametrize("oid", [114, 3802])
+def test_json_columns_decode_to_python_objects(oid):
+    """json (114) and jsonb (3802) columns are decoded once by the driver."""
+    import app.database  # noqa: F401 -- registers the typecasters
+    from psycopg2 import extensions
+
+    caster = extensions.string_types[oid]
+    assert caster('[{"name": "Alice", "primary": true}]', None) == [{"name": "Alice", "primary": True}]
+    assert caster(None, None) is None
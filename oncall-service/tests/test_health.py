@@ -1,11 +1,8 @@
-"""Tests for the health router -- /health, /health/ready, /health/live."""
+"""Tests for the health router -- /health, /health/deep, /health/ready, /health/live."""
 
 from unittest.mock import MagicMock, patch
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_health_check_healthy(client):
     """Health endpoint returns healthy when DB is up."""
     with patch("app.routers.health.check_database_health", return_value=True):
@@ -15,10 +12,34 @@ async def test_health_check_healthy(client):
         assert body["status"] == "healthy"
         assert body["service"] == "oncall-service"
         assert "uptime" in body
-        assert body["checks"]["database"] == "healthy"
+        assert body["checks"] == {"database": "healthy"}
+
+
+async def test_health_check_skips_system_usage(client):
+    """The basic health check never samples memory or disk."""
+    with (
+        patch("app.routers.health.check_database_health", return_value=True),
+        patch("app.routers.health.psutil") as mock_psutil,
+    ):
+        resp = await client.get("/health")
+    assert resp.status_code == 200
+    mock_psutil.virtual_memory.assert_not_called()
+    mock_psutil.disk_usage.assert_not_called()
+
+
+async def test_deep_health_check_healthy(client):
+    """Deep health endpoint reports database, memory and disk."""
+    with (
+        patch("app.routers.health.check_database_health", return_value=True),
+        patch("app.routers.health.psutil") as mock_psutil,
+    ):
+        mock_psutil.virtual_memory.return_value.percent = 10.0
+        mock_psutil.disk_usage.return_value.percent = 10.0
+        resp = await client.get("/health/deep")
+    assert resp.status_code == 200
+    assert resp.json()["checks"] == {"database": "healthy", "memory": "healthy", "disk": "healthy"}
 
 
-@pytest.mark.asyncio
 async def test_health_check_degraded(client):
     """Health endpoint returns 503 when DB is down."""
     with patch("app.routers.health.check_database_health", return_value=False):
@@ -29,37 +50,135 @@ async def test_health_check_degraded(client):
         assert body["checks"]["database"] == "unhealthy"
 
 
-@pytest.mark.asyncio
-async def test_health_check_high_memory(client):
-    """Health endpoint marks memory as warning when usage exceeds threshold."""
+async def test_deep_health_check_high_memory(client):
+    """Deep health endpoint marks memory as warning when usage exceeds threshold."""
     mock_mem = MagicMock()
     mock_mem.percent = 99.0  # Above default threshold (90)
     with (
         patch("app.routers.health.check_database_health", return_value=True),
         patch("app.routers.health.psutil.virtual_memory", return_value=mock_mem),
     ):
-        resp = await client.get("/health")
+        resp = await client.get("/health/deep")
         body = resp.json()
         assert body["status"] == "degraded"
         assert body["checks"]["memory"] == "warning"
 
 
-@pytest.mark.asyncio
-async def test_health_check_high_disk(client):
-    """Health endpoint marks disk as warning when usage exceeds threshold."""
+async def test_deep_health_check_high_disk(client):
+    """Deep health endpoint marks disk as warning when usage exceeds threshold."""
     mock_disk = MagicMock()
     mock_disk.percent = 99.0  # Above default threshold (90)
     with (
         patch("app.routers.health.check_database_health", return_value=True),
         patch("app.routers.health.psutil.disk_usage", return_value=mock_disk),
     ):
-        resp = await client.get("/health")
+        resp = await client.get("/health/deep")
         body = resp.json()
         assert body["status"] == "degraded"
         assert body["checks"]["disk"] == "warning"
 
 
-@pytest.mark.asyncio
+async def test_deep_health_check_failing_subcheck_degrades(client):
+    """A sub-check that raises is reported as failed instead of erroring the probe."""
+    with (
+        patch("app.routers.health.check_database_health", return_value=True),
+        patch("app.routers.health.psutil.disk_usage", side_effect=OSError("no such mount")),
+    ):
+        resp = await client.get("/health/deep")
+    assert resp.status_code == 503
+    body = resp.json()
+    assert body["checks"]["database"] == "healthy"
+    assert body["checks"]["disk"] == "warning"
+
+
+async def test_health_check_runs_on_health_pool(client):
+    """The database check runs on the dedicated health threads, not the default executor."""
+    import threading
+
+    threads = []
+
+    def check(timeout):
+        threads.append(threading.current_thread().name)
+        return True
+
+    with patch("app.routers.health.check_database_health", side_effect=check):
+        resp = await client.get("/health")
+    assert resp.status_code == 200
+    assert threads and threads[0].startswith("health")
+
+
+async def test_health_check_cached_within_ttl(client):
+    """Probes inside the TTL reuse the last result, including its status code."""
+    with patch("app.routers.health.check_database_health", return_value=False) as db_check:
+        first = await client.get("/health")
+        second = await client.get("/health")
+    assert first.status_code == second.status_code == 503
+    assert second.json() == first.json()
+    assert second.headers["cache-control"] == "no-store"
+    db_check.assert_called_once()
+
+
+async def test_health_check_etag_not_modified(client):
+    """A healthy probe repeating the ETag it was given gets 304 Not Modified."""
+    with patch("app.routers.health.check_database_health", return_value=True):
+        first = await client.get("/health")
+        etag = first.headers["etag"]
+        second = await client.get("/health", headers={"If-None-Match": etag})
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == second.headers["cache-control"] == "public, max-age=5"
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+
+
+async def test_health_check_degraded_has_no_etag(client):
+    """Degraded results are never answered with 304."""
+    with patch("app.routers.health.check_database_health", return_value=False):
+        resp = await client.get("/health", headers={"If-None-Match": "*"})
+    assert resp.status_code == 503
+    assert "etag" not in resp.headers
+
+
+async def test_health_check_cache_disabled(client):
+    """HEALTH_CACHE_TTL=0 runs the checks on every probe."""
+    with (
+        patch("app.routers.health.settings.HEALTH_CACHE_TTL", 0),
+        patch("app.routers.health.check_database_health", return_value=True) as db_check,
+    ):
+        await client.get("/health")
+        resp = await client.get("/health")
+    assert resp.status_code == 200
+    assert "cache-control" not in resp.headers
+    assert db_check.call_count == 2
+
+
+async def test_deep_health_check_reads_sampled_usage(client):
+    """Probes read the shared usage sample; psutil runs only for the first one."""
+    with (
+        patch("app.routers.health.settings.HEALTH_CACHE_TTL", 0),
+        patch("app.routers.health.check_database_health", return_value=True),
+        patch("app.routers.health.psutil") as mock_psutil,
+    ):
+        mock_psutil.virtual_memory.return_value.percent = 10.0
+        mock_psutil.disk_usage.return_value.percent = 10.0
+        await client.get("/health/deep")
+        resp = await client.get("/health/deep")
+    assert resp.status_code == 200
+    mock_psutil.virtual_memory.assert_called_once()
+    mock_psutil.disk_usage.assert_called_once()
+
+
+def test_sample_system_usage_records_failures():
+    """A failed psutil read is stored as None and reported as a warning."""
+    from app.routers.health import _system_usage, sample_system_usage
+
+    with patch("app.routers.health.psutil") as mock_psutil:
+        mock_psutil.virtual_memory.return_value.percent = 42.0
+        mock_psutil.disk_usage.side_effect = OSError("no such mount")
+        sample_system_usage()
+    assert _system_usage == {"memory": 42.0, "disk": None}
+
+
 async def test_readiness_ready(client):
     """Readiness probe returns ready when DB is up."""
     with patch("app.routers.health.check_database_health", return_value=True):
@@ -68,7 +187,6 @@ async def test_readiness_ready(client):
         assert resp.json()["status"] == "ready"
 
 
-@pytest.mark.asyncio
 async def test_readiness_not_ready(client):
     """Readiness probe returns not-ready when DB is down."""
     with patch("app.routers.health.check_database_health", return_value=False):
@@ -77,7 +195,73 @@ async def test_readiness_not_ready(client):
         assert resp.json()["status"] == "not ready"
 
 
-@pytest.mark.asyncio
+async def test_readiness_cached_within_ttl(client):
+    """Readiness probes inside the TTL reuse the last database check."""
+    with patch("app.routers.health.check_database_health", return_value=True) as db_check:
+        await client.get("/health/ready")
+        resp = await client.get("/health/ready")
+    assert resp.status_code == 200
+    db_check.assert_called_once()
+
+
+async def test_readiness_slow_database_not_ready(client):
+    """A database check slower than HEALTH_DB_TIMEOUT reports not ready."""
+    import time
+
+    def slow_check(timeout):
+        time.sleep(0.2)
+        return True
+
+    with (
+        patch("app.routers.health.settings.HEALTH_DB_TIMEOUT", 0.05),
+        patch("app.routers.health.check_database_health", side_effect=slow_check),
+    ):
+        resp = await client.get("/health/ready")
+    assert resp.status_code == 503
+    assert resp.json()["status"] == "not ready"
+
+
+async def test_ping_waits_for_pool_slot_at_most_health_timeout(client):
+    """The health ping passes HEALTH_DB_TIMEOUT down as its pool wait."""
+    with (
+        patch("app.routers.health.settings.HEALTH_DB_TIMEOUT", 0.25),
+        patch("app.routers.health.check_database_health", return_value=True) as db_check,
+    ):
+        await client.get("/health/ready")
+    db_check.assert_called_once_with(0.25)
+
+
+async def test_failed_ping_backs_off(client):
+    """After a failed ping the database is reported down without being pinged again."""
+    with (
+        patch("app.routers.health.settings.HEALTH_READY_CACHE_TTL", 0),
+        patch("app.routers.health.check_database_health", return_value=False) as db_check,
+    ):
+        await client.get("/health/ready")
+        resp = await client.get("/health/ready")
+    assert resp.status_code == 503
+    db_check.assert_called_once()
+
+
+async def test_backoff_grows_and_resets(client):
+    """Consecutive failures double the wait; a successful ping clears it."""
+    import time
+
+    from app.routers import health as health_mod
+
+    with patch("app.routers.health.check_database_health", return_value=False):
+        for _ in range(3):
+            health_mod._db_retry_at = 0.0
+            await health_mod._ping_database()
+    assert health_mod._db_failures == 3
+    assert 3 < health_mod._db_retry_at - time.monotonic() <= 4
+
+    health_mod._db_retry_at = 0.0
+    with patch("app.routers.health.check_database_health", return_value=True):
+        assert await health_mod._ping_database() is True
+    assert health_mod._db_failures == 0
+
+
 async def test_liveness(client):
     """Liveness probe always returns alive."""
     resp = await client.get("/health/live")
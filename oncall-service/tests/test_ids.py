@@ -0,0 +1,36 @@
+"""Tests for app/ids.py -- batched, time-ordered UUID generation."""
+
+import time
+import uuid
+from unittest.mock import patch
+
+import app.ids as ids
+
+
+def test_new_id_is_uuid7():
+    """new_id() returns an RFC 4122 variant, version 7 UUID string."""
+    value = uuid.UUID(ids.new_id())
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_new_id_embeds_millisecond_timestamp():
+    """The leading 48 bits are the Unix time in milliseconds."""
+    with patch("app.ids.time.time_ns", return_value=1_767_268_800_123_456_789):
+        value = uuid.UUID(ids.new_id())
+    assert value.int >> 80 == 1_767_268_800_123
+
+
+def test_new_id_sorts_by_creation_time():
+    """IDs minted in later milliseconds sort after earlier ones."""
+    first = ids.new_id()
+    time.sleep(0.002)
+    second = ids.new_id()
+    assert first < second
+
+
+def test_new_id_unique_across_refills():
+    """IDs stay unique when the pool is refilled several times."""
+    ids._pool.clear()
+    values = {ids.new_id() for _ in range(ids._BATCH_SIZE * 3)}
+    assert len(values) == ids._BATCH_SIZE * 3
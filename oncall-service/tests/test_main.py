@@ -5,7 +5,6 @@ from unittest.mock import patch
 import pytest
 
 
-@pytest.mark.asyncio
 async def test_root_endpoint(client):
     """Root endpoint returns service info."""
     resp = await client.get("/")
@@ -16,7 +15,6 @@ async def test_root_endpoint(client):
     assert "version" in body
 
 
-@pytest.mark.asyncio
 async def test_metrics_endpoint(client):
     """Metrics endpoint returns Prometheus text format."""
     resp = await client.get("/metrics")
@@ -24,14 +22,12 @@ async def test_metrics_endpoint(client):
     assert "text/plain" in resp.headers.get("content-type", "") or "text/plain" in str(resp.headers)
 
 
-@pytest.mark.asyncio
 async def test_openapi_docs(client):
     """OpenAPI docs should be accessible."""
     resp = await client.get("/docs")
     assert resp.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_openapi_json(client):
     """OpenAPI JSON schema should be accessible."""
     resp = await client.get("/openapi.json")
@@ -46,14 +42,12 @@ async def test_openapi_json(client):
     assert "/api/v1/metrics/oncall" in body["paths"]
 
 
-@pytest.mark.asyncio
 async def test_process_time_header(client):
     """Middleware adds X-Process-Time header."""
     resp = await client.get("/")
     assert "x-process-time" in resp.headers
 
 
-@pytest.mark.asyncio
 async def test_lifespan_startup_shutdown():
     """Lifespan context manager runs startup and shutdown."""
     from app.main import app, lifespan
@@ -65,7 +59,136 @@ async def test_lifespan_startup_shutdown():
         mock_close.assert_called_once()
 
 
-@pytest.mark.asyncio
+async def test_escalation_loop_backs_off_when_idle():
+    """Empty scans stretch the interval up to the cap; a scan that finds timers resets it."""
+    import asyncio
+
+    from app.main import _escalation_loop
+    from app.models import AutoEscalationResult
+
+    results = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0]
+    delays = []
+    clock = [0.0]
+
+    async def fake_wait_for(aw, timeout):
+        aw.close()
+        delays.append(timeout)
+        clock[0] += timeout
+        if len(delays) > len(results):
+            raise asyncio.CancelledError
+        raise TimeoutError
+
+    async def fake_check():
+        return AutoEscalationResult(checked=results[len(delays) - 1], escalated=0, details=[])
+
+    with (
+        patch("app.main._wait_for", fake_wait_for),
+        patch("app.main._monotonic", lambda: clock[0]),
+        patch("app.main.check_escalations", fake_check),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await _escalation_loop()
+
+    assert delays[:3] == [10.0, 15.0, 22.5]
+    assert max(delays) == 300.0
+    assert delays[-2:] == [10.0, 15.0]
+
+
+async def test_escalation_loop_never_sleeps_past_next_timer():
+    """The wait is capped at the earliest pending timer, recomputed when a new timer wakes the loop."""
+    import asyncio
+
+    from app.main import _escalation_loop
+
+    delays = []
+
+    async def fake_wait_for(aw, timeout):
+        aw.close()
+        delays.append(timeout)
+        if len(delays) == 1:
+            return True  # woken by a new timer
+        raise asyncio.CancelledError
+
+    with (
+        patch("app.main._wait_for", fake_wait_for),
+        patch("app.main._monotonic", lambda: 0.0),
+        patch("app.main.seconds_until_next_timer", side_effect=[None, 4.0]),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await _escalation_loop()
+
+    assert delays == [10.0, 4.0]
+
+
+async def test_escalation_loop_wakes_do_not_postpone_safety_scan():
+    """New-timer wakes every 3s still let the safety-net scan run on its original deadline."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    from app.main import _escalation_loop
+    from app.models import AutoEscalationResult
+
+    delays = []
+    clock = [0.0]
+    check = AsyncMock(return_value=AutoEscalationResult(checked=0, escalated=0, details=[]))
+
+    async def fake_wait_for(aw, timeout):
+        aw.close()
+        if check.await_count:
+            raise asyncio.CancelledError
+        delays.append(timeout)
+        if timeout > 3:
+            clock[0] += 3
+            return True  # woken by another replica's timer
+        clock[0] += timeout
+        raise TimeoutError
+
+    with (
+        patch("app.main._wait_for", fake_wait_for),
+        patch("app.main._monotonic", lambda: clock[0]),
+        patch("app.main.seconds_until_next_timer", return_value=None),
+        patch("app.main.check_escalations", check),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await _escalation_loop()
+
+    assert delays == [10.0, 7.0, 4.0, 1.0]
+    check.assert_awaited_once()
+
+
+async def test_metrics_refresh_loop_refreshes_before_sleeping():
+    """The first refresh runs at startup, and a failed refresh is logged without stopping the loop."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.main import _metrics_refresh_loop
+
+    calls = []
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append((delay, list(calls)))
+        if len(sleeps) == 2:
+            raise asyncio.CancelledError
+
+    apply_log = MagicMock(side_effect=lambda: calls.append("apply"))
+    refresh_gauge = MagicMock(side_effect=[Exception("DB down"), None])
+    with (
+        patch("app.main._sleep", fake_sleep),
+        patch("app.main.apply_metrics_log", apply_log),
+        patch("app.main.refresh_oncall_gauge", refresh_gauge),
+        patch("app.main.refresh_oncall_metrics", AsyncMock()) as refresh_metrics,
+        patch("app.main.logger") as logger,
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await _metrics_refresh_loop()
+
+    assert sleeps[0] == (60, ["apply"])
+    assert apply_log.call_count == 2
+    logger.error.assert_called_once()
+    refresh_metrics.assert_awaited_once()
+
+
 async def test_global_exception_handler():
     """Global exception handler returns 500 JSON response."""
     from app.main import global_exception_handler
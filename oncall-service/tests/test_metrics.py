@@ -71,3 +71,17 @@ def test_escalation_response_seconds_histogram():
 
     escalation_response_seconds.labels(team="platform").observe(120)
     # No assert needed — just verifying no exception
+
+
+def test_oncall_snapshot_collector():
+    """OnCallSnapshotCollector yields one sample per team/engineer from the latest snapshot."""
+    from app.metrics import OnCallSnapshotCollector
+
+    collector = OnCallSnapshotCollector()
+    collector.update({"platform": 3, "backend": 1}, {"alice@example.com": 2})
+    families = {f.name: f for f in collector.collect()}
+
+    team_samples = {s.labels["team"]: s.value for s in families["oncall_escalations_by_team"].samples}
+    load_samples = {s.labels["engineer"]: s.value for s in families["oncall_engineer_load"].samples}
+    assert team_samples == {"platform": 3, "backend": 1}
+    assert load_samples == {"alice@example.com": 2}
@@ -1,9 +1,9 @@
-"""Unit tests for the rotation algorithm (_compute_current_oncall)."""
+"""Unit tests for the rotation algorithm (app/rotation.py)."""
 
 from datetime import date, datetime, timezone
 from unittest.mock import patch
 
-from app.routers.api import _compute_current_oncall
+from app.rotation import _cached_rotation, compute_current_oncall
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -45,7 +45,7 @@ def _utc_dt(target_date, hour=12):
     )
 
 
-# We mock datetime.now inside _compute_current_oncall.
+# We mock datetime.now inside compute_current_oncall.
 # Using a side_effect that returns our fake "now" while keeping the real
 # datetime class available for isinstance() checks.
 _real_datetime = datetime
@@ -59,7 +59,7 @@ def _patch_now(fake_now):
         def now(cls, tz=None):
             return fake_now
 
-    return patch("app.routers.api.datetime", _FakeDatetime)
+    return patch("app.rotation.datetime", _FakeDatetime)
 
 
 # ---------------------------------------------------------------------------
@@ -72,19 +72,19 @@ class TestWeeklyRotation:
 
     def test_week_0_returns_first_engineer(self):
         with _patch_now(_utc_dt(date(2026, 1, 1))):
-            primary, secondary = _compute_current_oncall(_schedule())
+            primary, secondary = compute_current_oncall(_schedule())
         assert primary.email == "alice@example.com"
         assert secondary.email == "bob@example.com"
 
     def test_week_1_rotates_to_second(self):
         with _patch_now(_utc_dt(date(2026, 1, 8))):
-            primary, secondary = _compute_current_oncall(_schedule())
+            primary, secondary = compute_current_oncall(_schedule())
         assert primary.email == "bob@example.com"
         assert secondary.email == "charlie@example.com"
 
     def test_week_wraps_around(self):
         with _patch_now(_utc_dt(date(2026, 1, 22))):
-            primary, secondary = _compute_current_oncall(_schedule())
+            primary, secondary = compute_current_oncall(_schedule())
         assert primary.email == "alice@example.com"
         assert secondary.email == "bob@example.com"
 
@@ -99,18 +99,18 @@ class TestDailyRotation:
 
     def test_day_0_returns_first(self):
         with _patch_now(_utc_dt(date(2026, 1, 1))):
-            primary, secondary = _compute_current_oncall(_schedule(rotation_type="daily"))
+            primary, secondary = compute_current_oncall(_schedule(rotation_type="daily"))
         assert primary.email == "alice@example.com"
 
     def test_day_1_rotates(self):
         with _patch_now(_utc_dt(date(2026, 1, 2))):
-            primary, secondary = _compute_current_oncall(_schedule(rotation_type="daily"))
+            primary, secondary = compute_current_oncall(_schedule(rotation_type="daily"))
         assert primary.email == "bob@example.com"
         assert secondary.email == "charlie@example.com"
 
     def test_daily_wraps_around(self):
         with _patch_now(_utc_dt(date(2026, 1, 4))):
-            primary, secondary = _compute_current_oncall(_schedule(rotation_type="daily"))
+            primary, secondary = compute_current_oncall(_schedule(rotation_type="daily"))
         assert primary.email == "alice@example.com"
 
 
@@ -125,34 +125,34 @@ class TestHandoffHour:
     def test_before_handoff_uses_previous_day(self):
         """At 3 AM (handoff=9), still previous day's engineer."""
         with _patch_now(_utc_dt(date(2026, 1, 2), hour=3)):
-            primary, _ = _compute_current_oncall(_schedule(rotation_type="daily"))
+            primary, _ = compute_current_oncall(_schedule(rotation_type="daily"))
         # Day 2 at 3 AM → effective day 1 → delta 0 → idx 0 = Alice
         assert primary.email == "alice@example.com"
 
     def test_after_handoff_uses_current_day(self):
         """At 10 AM (handoff=9), the new rotation has taken effect."""
         with _patch_now(_utc_dt(date(2026, 1, 2), hour=10)):
-            primary, _ = _compute_current_oncall(_schedule(rotation_type="daily"))
+            primary, _ = compute_current_oncall(_schedule(rotation_type="daily"))
         # Day 2 at 10 AM → effective day 2 → delta 1 → idx 1 = Bob
         assert primary.email == "bob@example.com"
 
     def test_at_handoff_hour_uses_current_day(self):
         """At exactly handoff hour, the new rotation applies."""
         with _patch_now(_utc_dt(date(2026, 1, 2), hour=9)):
-            primary, _ = _compute_current_oncall(_schedule(rotation_type="daily"))
+            primary, _ = compute_current_oncall(_schedule(rotation_type="daily"))
         assert primary.email == "bob@example.com"
 
     def test_custom_handoff_hour(self):
         """Handoff at midnight: hour 0 >= handoff_hour 0 so current day applies."""
         with _patch_now(_utc_dt(date(2026, 1, 2), hour=0)):
-            primary, _ = _compute_current_oncall(_schedule(rotation_type="daily", handoff_hour=0))
+            primary, _ = compute_current_oncall(_schedule(rotation_type="daily", handoff_hour=0))
         # hour 0 >= handoff_hour 0, so current day → delta 1 → idx 1 = Bob
         assert primary.email == "bob@example.com"
 
     def test_invalid_timezone_falls_back_to_utc(self):
         """An invalid timezone string gracefully falls back to UTC."""
         with _patch_now(_utc_dt(date(2026, 1, 1), hour=12)):
-            primary, _ = _compute_current_oncall(_schedule(tz="Invalid/TZ"))
+            primary, _ = compute_current_oncall(_schedule(tz="Invalid/TZ"))
         assert primary.email == "alice@example.com"
 
     def test_missing_timezone_defaults_utc(self):
@@ -166,7 +166,7 @@ class TestHandoffHour:
                     {"name": "Bob", "email": "bob@example.com", "primary": False},
                 ],
             }
-            primary, _ = _compute_current_oncall(schedule)
+            primary, _ = compute_current_oncall(schedule)
         assert primary.email == "alice@example.com"
 
     def test_missing_handoff_hour_defaults_to_9(self):
@@ -182,13 +182,13 @@ class TestHandoffHour:
                 "timezone": "UTC",
             }
             # hour 3 < default 9 → still day 1 → delta 0 → idx 0 = Alice
-            primary, _ = _compute_current_oncall(schedule)
+            primary, _ = compute_current_oncall(schedule)
         assert primary.email == "alice@example.com"
 
     def test_none_timezone_defaults_utc(self):
         """Schedule with timezone=None defaults to UTC."""
         with _patch_now(_utc_dt(date(2026, 1, 1), hour=12)):
-            primary, _ = _compute_current_oncall(_schedule(tz=None))
+            primary, _ = compute_current_oncall(_schedule(tz=None))
         assert primary.email == "alice@example.com"
 
 
@@ -201,42 +201,96 @@ class TestEdgeCases:
     """Edge case tests for rotation logic."""
 
     def test_empty_engineers_returns_none(self):
-        primary, secondary = _compute_current_oncall(_schedule(engineers=[]))
+        primary, secondary = compute_current_oncall(_schedule(engineers=[]))
         assert primary is None
         assert secondary is None
 
     def test_single_engineer_no_secondary(self):
         with _patch_now(_utc_dt(date(2026, 1, 1))):
             engineers = [{"name": "Alice", "email": "alice@example.com", "primary": True}]
-            primary, secondary = _compute_current_oncall(_schedule(engineers=engineers))
+            primary, secondary = compute_current_oncall(_schedule(engineers=engineers))
         assert primary.email == "alice@example.com"
         assert secondary is None
 
     def test_start_date_in_future_uses_idx_zero(self):
         with _patch_now(_utc_dt(date(2025, 6, 1))):
-            primary, _ = _compute_current_oncall(_schedule(start_date=date(2026, 1, 1)))
+            primary, _ = compute_current_oncall(_schedule(start_date=date(2026, 1, 1)))
         assert primary.email == "alice@example.com"
 
     def test_start_date_as_string(self):
         with _patch_now(_utc_dt(date(2026, 1, 1))):
-            primary, _ = _compute_current_oncall(_schedule(start_date="2026-01-01"))
+            primary, _ = compute_current_oncall(_schedule(start_date="2026-01-01"))
         assert primary.email == "alice@example.com"
 
     def test_start_date_as_datetime(self):
         with _patch_now(_utc_dt(date(2026, 1, 1))):
-            primary, _ = _compute_current_oncall(_schedule(start_date=datetime(2026, 1, 1, tzinfo=timezone.utc)))
+            primary, _ = compute_current_oncall(_schedule(start_date=datetime(2026, 1, 1, tzinfo=timezone.utc)))
         assert primary.email == "alice@example.com"
 
-    def test_engineers_as_json_string(self):
-        import json
 
+# ---------------------------------------------------------------------------
+# Power-of-two team sizes (bit-masked index)
+# ---------------------------------------------------------------------------
+
+_FOUR_ENGINEERS = [{"name": n, "email": f"{n.lower()}@example.com", "primary": False} for n in ("A", "B", "C", "D")]
+
+
+class TestPowerOfTwoTeams:
+    """Teams of 2, 4, 8, ... engineers rotate exactly like other sizes."""
+
+    def test_weekly_matches_modulo(self):
+        for week in range(9):
+            target = date.fromordinal(date(2026, 1, 1).toordinal() + week * 7)
+            with _patch_now(_utc_dt(target)):
+                primary, secondary = compute_current_oncall(_schedule(engineers=_FOUR_ENGINEERS))
+            assert primary.email == _FOUR_ENGINEERS[week % 4]["email"]
+            assert secondary.email == _FOUR_ENGINEERS[(week + 1) % 4]["email"]
+
+    def test_daily_wraps_last_to_first(self):
+        with _patch_now(_utc_dt(date(2026, 1, 4))):
+            primary, secondary = compute_current_oncall(_schedule(rotation_type="daily", engineers=_FOUR_ENGINEERS))
+        assert primary.email == "d@example.com"
+        assert secondary.email == "a@example.com"
+
+
+# ---------------------------------------------------------------------------
+# Memoization
+# ---------------------------------------------------------------------------
+
+
+class TestRotationCache:
+    """The rotation is memoized per schedule within a wall-clock minute."""
+
+    def test_same_minute_hits_cache(self):
         with _patch_now(_utc_dt(date(2026, 1, 1))):
-            engineers = json.dumps(
-                [
-                    {"name": "Alice", "email": "alice@example.com", "primary": True},
-                    {"name": "Bob", "email": "bob@example.com", "primary": False},
-                ]
-            )
-            primary, secondary = _compute_current_oncall(_schedule(engineers=engineers))
+            first = compute_current_oncall(_schedule())
+            second = compute_current_oncall(_schedule())
+        assert first == second
+        info = _cached_rotation.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_next_minute_recomputes(self):
+        now = _utc_dt(date(2026, 1, 1))
+        with _patch_now(now):
+            compute_current_oncall(_schedule())
+        with _patch_now(now.replace(minute=now.minute + 1)):
+            compute_current_oncall(_schedule())
+        assert _cached_rotation.cache_info().misses == 2
+
+    def test_schedule_id_keys_the_cache(self):
+        """Rows of the same (immutable) schedule share one cache entry."""
+        with _patch_now(_utc_dt(date(2026, 1, 1))):
+            compute_current_oncall({**_schedule(), "id": "sched-1"})
+            primary, _ = compute_current_oncall({**_schedule(), "id": "sched-1"})
+            compute_current_oncall({**_schedule(), "id": "sched-2"})
         assert primary.email == "alice@example.com"
-        assert secondary.email == "bob@example.com"
+        info = _cached_rotation.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+
+    def test_explicit_now_skips_the_clock(self):
+        """A caller-supplied *now* decides the rotation instead of the clock."""
+        with _patch_now(_utc_dt(date(2026, 1, 1))):
+            primary, _ = compute_current_oncall(_schedule(), _utc_dt(date(2026, 1, 8)))
+        assert primary.email == "bob@example.com"
@@ -0,0 +1,100 @@
+"""Tests for app/timer_listener.py -- LISTEN/NOTIFY wake-ups for new timers."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import app.timer_listener as listener
+import pytest
+
+
+def _notify(payload: str):
+    n = MagicMock()
+    n.payload = payload
+    return n
+
+
+def test_connect_listens_in_autocommit():
+    """The LISTEN connection is opened with a bounded connect timeout in autocommit."""
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+
+    with patch("app.timer_listener.psycopg2.connect", return_value=conn) as connect:
+        assert listener._connect() is conn
+
+    assert connect.call_args.kwargs["connect_timeout"] == listener._CONNECT_TIMEOUT
+    assert conn.autocommit is True
+    cur.execute.assert_called_once_with("LISTEN oncall_timer_added")
+
+
+def test_connect_returns_none_when_connect_fails():
+    """An unreachable database leaves the loop on its periodic checks."""
+    with patch("app.timer_listener.psycopg2.connect", side_effect=Exception("down")):
+        assert listener._connect() is None
+
+
+async def test_run_reconnects_after_failures_and_lost_connections():
+    """The listener retries failed connects, rescans on every connect and reopens a lost connection."""
+    first, second = MagicMock(), MagicMock()
+    first.fileno.return_value = 41
+    second.fileno.return_value = 42
+    seen = []
+    sleeps = []
+    readers = {}
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) == 3:
+            raise asyncio.CancelledError
+
+    loop = asyncio.get_running_loop()
+
+    def add_reader(fd, callback, *args):
+        readers[fd] = args
+        # The connection drops as soon as it is watched
+        args[2].set()
+
+    with (
+        patch("app.timer_listener._connect", side_effect=[None, first, second]),
+        patch("app.timer_listener._sleep", fake_sleep),
+        patch.object(loop, "add_reader", add_reader),
+        patch.object(loop, "remove_reader") as remove_reader,
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await listener.run_timer_listener(seen.append)
+
+    assert sleeps == [30.0, 30.0, 30.0]
+    assert set(readers) == {41, 42}
+    assert len(seen) == 2
+    assert [c.args for c in remove_reader.call_args_list] == [(41,), (42,)]
+    first.close.assert_called_once()
+    second.close.assert_called_once()
+
+
+def test_drain_reports_due_times_and_skips_bad_payloads():
+    """Each notification's Unix-seconds payload is passed on as an aware datetime."""
+    conn = MagicMock()
+    conn.notifies = [_notify("1767268800.5"), _notify("garbage"), _notify("1767272400")]
+    seen = []
+    lost = asyncio.Event()
+
+    listener._drain_notifies(conn, seen.append, lost)
+
+    conn.poll.assert_called_once()
+    assert seen == [
+        datetime(2026, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc),
+        datetime(2026, 1, 1, 13, 0, tzinfo=timezone.utc),
+    ]
+    assert conn.notifies == []
+    assert not lost.is_set()
+
+
+def test_drain_flags_a_lost_connection():
+    """A failed poll signals the listener to reconnect."""
+    conn = MagicMock()
+    conn.poll.side_effect = Exception("server closed the connection")
+    lost = asyncio.Event()
+
+    listener._drain_notifies(conn, print, lost)
+
+    assert lost.is_set()